@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import concurrent.futures
 import signal
 import sys
 from datetime import datetime, timedelta, timezone
@@ -37,6 +38,10 @@ _ws_manager: Optional["WebSocketManager"] = None
 _rest_client: Optional["UnifiClient"] = None
 _rest_client_site: Optional[str] = None
 
+# Longest wait for integration results from the shared AsyncIOHost loop
+# (each integration is also capped at INTEGRATION_TIMEOUT by the runner)
+INTEGRATIONS_RESULT_TIMEOUT = 60.0
+
 # Exit codes
 EXIT_SUCCESS = 0
 EXIT_CONFIG_ERROR = 1
@@ -244,6 +249,8 @@ def start_session(config: "UnifiSettings", log: Any) -> Optional["WebSocketManag
 def stop_session(log: Any) -> None:
     """Stop the global WebSocket manager and REST client if running.
 
+    Also closes the shared Cloudflare connection pool on the AsyncIOHost loop.
+
     Args:
         log: Logger instance.
     """
@@ -267,6 +274,17 @@ def stop_session(log: Any) -> None:
         _rest_client = None
         _rest_client_site = None
 
+    from unifi_scanner.api.async_host import AsyncIOHost
+
+    host = AsyncIOHost.get()
+    if host.is_running():
+        from unifi_scanner.integrations.cloudflare.client import aclose_shared_client
+
+        try:
+            host.submit(aclose_shared_client()).result(timeout=5.0)
+        except Exception as e:
+            log.warning("cloudflare_client_close_error", error=str(e))
+
 
 def run_report_job() -> None:
     """Execute one report generation and delivery cycle.
@@ -288,6 +306,7 @@ def run_report_job() -> None:
     from unifi_scanner.analysis.ips import IPSAnalyzer, IPSEvent
     from unifi_scanner.analysis.rules import get_default_registry
     from unifi_scanner.api import UnifiClient
+    from unifi_scanner.api.async_host import AsyncIOHost
     from unifi_scanner.config.loader import get_config
     from unifi_scanner.delivery import DeliveryManager, EmailDelivery, FileDelivery
     from unifi_scanner.health import HealthStatus, update_health_status
@@ -455,14 +474,24 @@ def run_report_job() -> None:
             log_entry_count=len(log_entries),
         )
 
-        # Generate report content in a single asyncio.run() call
-        # Integrations (e.g. Cloudflare WAF) run once and results are
-        # shared between both HTML and text generation.
-        async def _generate_reports() -> tuple[str, str]:
-            from unifi_scanner.integrations import IntegrationRunner
-            runner = IntegrationRunner(config)
-            integrations = await runner.run_all()
+        # Integrations run on the shared AsyncIOHost loop, which outlives the
+        # job so their connection pools (e.g. Cloudflare) stay warm between
+        # runs. The wait is bounded so a hung integration cannot stall the
+        # job; the report then goes out without integration sections.
+        from unifi_scanner.integrations import IntegrationResults, IntegrationRunner
 
+        integrations_future = AsyncIOHost.get().submit(IntegrationRunner(config).run_all())
+        try:
+            integrations = integrations_future.result(timeout=INTEGRATIONS_RESULT_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            integrations_future.cancel()
+            log.warning("integrations_timeout", timeout=INTEGRATIONS_RESULT_TIMEOUT)
+            integrations = IntegrationResults(sections=[])
+
+        # Templates render in this thread rather than on the shared loop, so
+        # WebSocket event handling is never blocked by report rendering.
+        # Integration results are shared between both HTML and text generation.
+        async def _render_reports() -> tuple[str, str]:
             generator = ReportGenerator(
                 display_timezone=config.schedule_timezone,
             )
@@ -476,7 +505,7 @@ def run_report_job() -> None:
             )
             return html, text
 
-        html_content, text_content = asyncio.run(_generate_reports())
+        html_content, text_content = asyncio.run(_render_reports())
 
         # Set up delivery
         email_delivery = None
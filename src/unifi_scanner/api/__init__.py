@@ -8,8 +8,10 @@ WebSocket support for UniFi Network 10.x+:
 - UnifiWebSocketClient: Real-time event streaming via WebSocket
 - WebSocketEventBuffer: Thread-safe event collection
 - BufferedEvent: Parsed event dataclass
+- AsyncIOHost: Shared background event loop for async I/O
 """
 
+from unifi_scanner.api.async_host import AsyncIOHost
 from unifi_scanner.api.client import UnifiClient
 from unifi_scanner.api.endpoints import (
     API_PREFIXES,
@@ -38,6 +40,7 @@ __all__ = [
     # Client
     "UnifiClient",
     # WebSocket
+    "AsyncIOHost",
     "BufferedEvent",
     "UnifiWebSocketClient",
     "WebSocketEventBuffer",
@@ -0,0 +1,129 @@
+"""Shared background event loop for async I/O from synchronous code.
+
+The scheduler is synchronous, but WebSocket streaming is async. Rather than
+each component spinning up its own thread and event loop, AsyncIOHost owns a
+single daemon thread running one event loop for the life of the process.
+Coroutines are submitted from any thread and run concurrently on that loop.
+
+Example usage:
+    from unifi_scanner.api.async_host import AsyncIOHost
+
+    future = AsyncIOHost.get().submit(some_coroutine())
+    # ... later, from sync code:
+    future.cancel()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, ClassVar, Coroutine, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncIOHost:
+    """Process-wide event loop running in a daemon background thread.
+
+    The loop and thread are created lazily on first use and reused by every
+    caller. Use get() to obtain the shared instance.
+
+    Attributes:
+        _loop: The shared event loop (None until started).
+        _thread: Daemon thread running the loop forever.
+        _lock: Guards lazy startup and shutdown.
+    """
+
+    _instance: ClassVar[AsyncIOHost | None] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        """Initialize the host without starting the loop."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> AsyncIOHost:
+        """Return the shared AsyncIOHost, creating it on first call."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running shared event loop, started on first access."""
+        loop = self._loop
+        if loop is not None:
+            return loop
+
+        with self._lock:
+            if self._loop is None:
+                started = threading.Event()
+                new_loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_forever,
+                    args=(new_loop, started),
+                    name="asyncio-host",
+                    daemon=True,
+                )
+                self._thread.start()
+                started.wait()
+                self._loop = new_loop
+                logger.debug("asyncio_host_started")
+            return self._loop
+
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+        """Thread target: run the loop until shutdown() stops it."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule a coroutine on the shared loop from any thread.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            concurrent.futures.Future resolving to the coroutine's result.
+            Cancelling it cancels the underlying task.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def is_running(self) -> bool:
+        """Check if the shared loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the shared loop and join its thread.
+
+        Pending tasks are abandoned; callers should cancel their own work
+        first. A later submit() starts a fresh loop.
+
+        Args:
+            timeout: Seconds to wait for the loop thread to exit.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None or thread is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            logger.warning("asyncio_host_thread_timeout")
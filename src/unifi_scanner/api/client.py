@@ -21,9 +21,13 @@ Example usage:
         print(f"Found {len(sites)} sites")
 """
 
+import threading
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 import structlog
 
 from unifi_scanner.config import UnifiSettings
@@ -39,6 +43,16 @@ from .exceptions import (
 )
 from .session import create_retry_decorator, request_with_session_check
 
+# HTTP/2 lets the collector's concurrent requests share one TLS connection
+# (negotiated via ALPN; controllers without it stay on HTTP/1.1). It needs
+# the h2 package (httpx[http2]), so fall back to HTTP/1.1 without it.
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    _HTTP2_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
 
@@ -85,6 +99,9 @@ class UnifiClient:
         self.api_prefix: Optional[str] = None
         self._csrf_token: Optional[str] = None
 
+        # Serializes re-authentication when concurrent requests all see a 401
+        self._reauth_lock = threading.Lock()
+
         # Cache for IPS endpoint discovery (avoids re-probing on every run)
         self._ips_endpoint_cache: Optional[Dict[str, Any]] = None
 
@@ -130,6 +147,7 @@ class UnifiClient:
         self._client = httpx.Client(
             verify=self.settings.verify_ssl,
             timeout=self.settings.connect_timeout,
+            http2=_HTTP2_AVAILABLE,
         )
 
         # Authenticate and get CSRF token
@@ -190,7 +208,7 @@ class UnifiClient:
         endpoints = get_endpoints(self.device_type)
         response = self._request("GET", endpoints.sites)
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # UniFi API wraps data in {"meta": {...}, "data": [...]}
         if isinstance(data, dict) and "data" in data:
@@ -298,7 +316,7 @@ class UnifiClient:
         }
 
         response = self._request("POST", endpoint, json=body)
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Debug: Log raw response structure to diagnose empty results
         logger.debug(
@@ -368,7 +386,7 @@ class UnifiClient:
             params["archived"] = "true" if archived else "false"
 
         response = self._request("GET", endpoint, params=params if params else None)
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Extract alarms from response wrapper
         if isinstance(data, dict) and "data" in data:
@@ -410,8 +428,6 @@ class UnifiClient:
             >>> for event in ips_events[:5]:
             ...     print(f"{event.get('signature', 'Unknown')}: {event.get('action')}")
         """
-        import time
-
         self._ensure_connected()
         assert self.device_type is not None  # For type checker
 
@@ -419,7 +435,7 @@ class UnifiClient:
         endpoint = endpoints.ips_events.format(site=site)
 
         # Default time range: last 24 hours
-        now_ms = int(time.time() * 1000)
+        now_ms = time.time_ns() // 1_000_000
         if end is None:
             end = now_ms
         if start is None:
@@ -436,7 +452,6 @@ class UnifiClient:
         }
 
         # Debug: Log the request being made
-        from datetime import datetime, timezone
         start_dt = datetime.fromtimestamp(start / 1000, tz=timezone.utc)
         end_dt = datetime.fromtimestamp(end / 1000, tz=timezone.utc)
         logger.debug(
@@ -460,7 +475,7 @@ class UnifiClient:
                     cache_resp = self._request("GET", cached["endpoint"])
                 else:
                     cache_resp = self._request("POST", cached["endpoint"], json=body)
-                cache_data = cache_resp.json()
+                cache_data = orjson.loads(cache_resp.content)
 
                 cache_events: list = []
                 if isinstance(cache_data, dict) and "data" in cache_data:
@@ -479,7 +494,7 @@ class UnifiClient:
                 self._ips_endpoint_cache = None
 
         response = self._request("POST", endpoint, json=body)
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # If primary endpoint has data, cache it
         if isinstance(data, dict) and len(data.get("data", [])) > 0:
@@ -489,7 +504,7 @@ class UnifiClient:
         if isinstance(data, dict) and len(data.get("data", [])) == 0:
             logger.debug("ips_events_retry_no_filter", message="Retrying without time filter")
             response2 = self._request("POST", endpoint, json={"_limit": 100})
-            data2 = response2.json()
+            data2 = orjson.loads(response2.content)
             if isinstance(data2, dict) and len(data2.get("data", [])) > 0:
                 logger.info(
                     "ips_events_found_without_filter",
@@ -523,7 +538,7 @@ class UnifiClient:
                         alt_response = self._request("GET", alt_endpoint)
                     else:
                         alt_response = self._request("POST", alt_endpoint, json=alt_config.get("json", {}))
-                    alt_data = alt_response.json()
+                    alt_data = orjson.loads(alt_response.content)
 
                     # Log what we found
                     if isinstance(alt_data, dict):
@@ -617,7 +632,7 @@ class UnifiClient:
         endpoint = endpoints.devices.format(site=site)
 
         response = self._request("GET", endpoint)
-        data = response.json()
+        data = orjson.loads(response.content)
 
         devices = data.get("data", data) if isinstance(data, dict) else data
 
@@ -685,18 +700,19 @@ class UnifiClient:
         if not self._client or not self.base_url or not self.device_type:
             raise RuntimeError("Cannot re-authenticate: not connected")
 
-        logger.debug("reauthenticating", host=self.settings.host)
+        with self._reauth_lock:
+            logger.debug("reauthenticating", host=self.settings.host)
 
-        self._csrf_token = authenticate(
-            client=self._client,
-            base_url=self.base_url,
-            device_type=self.device_type,
-            username=self.settings.username,
-            password=self.settings.password,
-        )
+            self._csrf_token = authenticate(
+                client=self._client,
+                base_url=self.base_url,
+                device_type=self.device_type,
+                username=self.settings.username,
+                password=self.settings.password,
+            )
 
-        self._authenticated = True
-        logger.info("reauthenticated", host=self.settings.host)
+            self._authenticated = True
+            logger.info("reauthenticated", host=self.settings.host)
 
     def _request(
         self,
@@ -98,8 +98,13 @@ class WebSocketEventBuffer:
 
         # From sync scheduler
         events = buffer.drain()
+
+        # Or wait up to 30 seconds for the first event to arrive
+        events = buffer.drain_blocking(timeout=30.0)
     """
 
+    __slots__ = ("_buffer", "_lock", "_max_size", "_not_empty")
+
     def __init__(self, max_size: int = 10000) -> None:
         """Initialize the event buffer.
 
@@ -110,6 +115,8 @@ class WebSocketEventBuffer:
         self._buffer: deque[BufferedEvent] = deque(maxlen=max_size)
         self._lock = threading.Lock()
         self._max_size = max_size
+        # Set when the buffer goes from empty to non-empty, cleared on drain
+        self._not_empty = threading.Event()
 
     def add(self, event: BufferedEvent) -> None:
         """Add an event to the buffer.
@@ -120,7 +127,10 @@ class WebSocketEventBuffer:
             event: The parsed event to buffer.
         """
         with self._lock:
+            was_empty = not self._buffer
             self._buffer.append(event)
+            if was_empty:
+                self._not_empty.set()
 
     def drain(self) -> list[BufferedEvent]:
         """Remove and return all buffered events.
@@ -130,10 +140,27 @@ class WebSocketEventBuffer:
         Returns:
             List of all buffered events in order received.
         """
+        # Swap in a fresh deque under the lock; copy out after releasing it
         with self._lock:
-            events = list(self._buffer)
-            self._buffer.clear()
-            return events
+            events = self._buffer
+            self._buffer = deque(maxlen=self._max_size)
+            self._not_empty.clear()
+        return list(events)
+
+    def drain_blocking(self, timeout: float) -> list[BufferedEvent]:
+        """Wait for at least one event, then drain the buffer.
+
+        Thread-safe. Returns as soon as an event is buffered, or after
+        timeout seconds with whatever is present (possibly nothing).
+
+        Args:
+            timeout: Maximum seconds to wait for the first event.
+
+        Returns:
+            List of all buffered events in order received.
+        """
+        self._not_empty.wait(timeout)
+        return self.drain()
 
     def __len__(self) -> int:
         """Return the number of buffered events."""
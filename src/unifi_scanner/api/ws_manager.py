@@ -1,14 +1,14 @@
-"""WebSocket manager for background thread operation.
+"""WebSocket manager for background operation.
 
 This module bridges async WebSocket operation with the synchronous scheduler.
-The WebSocketManager runs the async WebSocket client in a daemon background
-thread with its own event loop, while providing sync-friendly methods for
+The WebSocketManager runs the async WebSocket client on the shared background
+event loop owned by AsyncIOHost, while providing sync-friendly methods for
 draining events.
 
 Features:
-- Background thread with isolated event loop
+- Runs on the process-wide AsyncIOHost loop (no per-manager thread)
 - Thread-safe event buffer accessible from sync context
-- Graceful shutdown with timeout
+- Graceful shutdown via task cancellation with timeout
 - Automatic reconnection via UnifiWebSocketClient
 
 Example usage:
@@ -33,11 +33,13 @@ Example usage:
 from __future__ import annotations
 
 import asyncio
-import threading
+import concurrent.futures
+import logging
 from typing import TYPE_CHECKING
 
 import structlog
 
+from unifi_scanner.api.async_host import AsyncIOHost
 from unifi_scanner.api.websocket import (
     BufferedEvent,
     UnifiWebSocketClient,
@@ -52,18 +54,20 @@ logger = structlog.get_logger(__name__)
 
 
 class WebSocketManager:
-    """Manager for WebSocket client running in background thread.
+    """Manager for WebSocket client running on the shared background loop.
 
     Bridges async WebSocket operation with synchronous scheduler context.
-    Runs WebSocket in a daemon thread with its own event loop, buffering
+    Submits the WebSocket client to AsyncIOHost's event loop, buffering
     events that can be drained from the main thread.
 
     Attributes:
-        _thread: Background thread running the event loop.
-        _loop: Event loop for async WebSocket operations.
+        _host: Shared event loop host the client runs on.
+        _future: Future for the submitted connect/listen coroutine.
         _client: The WebSocket client instance.
         _buffer: Thread-safe buffer for events.
         _running: Flag to control shutdown.
+        _main_task: Task running the connect/listen coroutine on the host loop.
+        _log_debug: Whether per-event debug logging is enabled.
 
     Example:
         manager = WebSocketManager()
@@ -81,17 +85,29 @@ class WebSocketManager:
         manager.stop()
     """
 
+    __slots__ = (
+        "_host",
+        "_future",
+        "_client",
+        "_buffer",
+        "_running",
+        "_main_task",
+        "_log_debug",
+    )
+
     def __init__(self) -> None:
         """Initialize the WebSocket manager.
 
         Constructor takes no args for lazy initialization.
         Call start() to begin WebSocket connection.
         """
-        self._thread: threading.Thread | None = None
-        self._loop: asyncio.AbstractEventLoop | None = None
+        self._host: AsyncIOHost = AsyncIOHost.get()
+        self._future: concurrent.futures.Future[None] | None = None
         self._client: UnifiWebSocketClient | None = None
         self._buffer: WebSocketEventBuffer = WebSocketEventBuffer()
         self._running: bool = False
+        self._main_task: asyncio.Task[None] | None = None
+        self._log_debug: bool = False
 
     def start(
         self,
@@ -101,10 +117,10 @@ class WebSocketManager:
         device_type: DeviceType,
         verify_ssl: bool = False,
     ) -> None:
-        """Start the WebSocket client in a background thread.
+        """Start the WebSocket client on the shared background loop.
 
-        Creates UnifiWebSocketClient and starts background thread running
-        the async event loop.
+        Creates UnifiWebSocketClient and submits its connect/listen
+        coroutine to AsyncIOHost.
 
         Args:
             base_url: Base URL of the UniFi controller.
@@ -128,13 +144,12 @@ class WebSocketManager:
 
         self._running = True
 
-        # Create and start the background thread
-        self._thread = threading.Thread(
-            target=self._run_loop,
-            name="websocket-manager",
-            daemon=True,
-        )
-        self._thread.start()
+        # Checked once here so _on_event skips building debug kwargs per event
+        self._log_debug = logger.is_enabled_for(logging.DEBUG)
+
+        # Run connect/listen on the shared background loop
+        self._future = self._host.submit(self._async_main())
+        self._future.add_done_callback(self._on_main_done)
 
         logger.info(
             "websocket_manager_started",
@@ -153,53 +168,53 @@ class WebSocketManager:
             event: Parsed WiFi event from WebSocket.
         """
         self._buffer.add(event)
-        logger.debug(
-            "websocket_event_buffered",
-            event_type=event.event_type,
-            buffer_size=len(self._buffer),
-        )
+        if self._log_debug:
+            logger.debug(
+                "websocket_event_buffered",
+                event_type=event.event_type,
+                buffer_size=len(self._buffer),
+            )
 
-    def _run_loop(self) -> None:
-        """Run the async event loop in the background thread.
+    def _on_main_done(self, future: concurrent.futures.Future[None]) -> None:
+        """Log unexpected failures of the main coroutine.
 
-        Creates a new event loop for this thread and runs the WebSocket
-        client's connect and listen methods.
+        Args:
+            future: Completed future returned by AsyncIOHost.submit().
         """
-        # Create new event loop for this thread
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
-
-        try:
-            # Run the async main logic
-            self._loop.run_until_complete(self._async_main())
-        except Exception as e:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
             logger.error(
                 "websocket_manager_loop_error",
-                error=str(e),
-                error_type=type(e).__name__,
+                error=str(error),
+                error_type=type(error).__name__,
             )
-        finally:
-            # Clean up the loop
-            self._loop.close()
-            self._loop = None
 
     async def _async_main(self) -> None:
         """Main async logic for WebSocket operation.
 
         Connects to WebSocket and listens for events until stopped.
+        Cancellation (from stop()) closes the client before unwinding.
         """
-        if self._client is None:
+        client = self._client
+        if client is None:
             return
 
+        self._main_task = asyncio.current_task()
         try:
             # Attempt connection
-            connected = await self._client.connect()
+            connected = await client.connect()
             if not connected:
                 logger.warning("websocket_manager_connection_failed")
                 return
 
-            # Listen for events (runs until stop() is called)
-            await self._client.listen(self._on_event)
+            # stop() may have run before this task existed to be cancelled
+            if not self._running:
+                return
+
+            # Listen for events (runs until stop() cancels this task)
+            await client.listen(self._on_event)
 
         except Exception as e:
             logger.error(
@@ -207,51 +222,62 @@ class WebSocketManager:
                 error=str(e),
                 error_type=type(e).__name__,
             )
+        finally:
+            self._main_task = None
+            await client.stop()
 
-    def drain_events(self) -> list[BufferedEvent]:
+    def drain_events(self, timeout: float = 0.0) -> list[BufferedEvent]:
         """Drain and return all buffered events.
 
         Thread-safe method called from sync context (main thread).
 
+        Args:
+            timeout: Seconds to wait for the first event if the buffer is
+                empty. The default of 0 returns immediately.
+
         Returns:
             List of all buffered events. Empty list if not running.
         """
         if not self._running:
             return []
 
+        if timeout > 0:
+            return self._buffer.drain_blocking(timeout)
         return self._buffer.drain()
 
     def stop(self) -> None:
         """Stop the WebSocket manager gracefully.
 
-        Stops the client, closes the event loop, and waits for the
-        background thread to join.
+        Cancels the listen task, which closes the client as it unwinds,
+        then waits for the task to finish. The shared loop keeps running.
         """
         if not self._running:
             return
 
         self._running = False
 
-        # Schedule client stop in the background loop
-        if self._loop is not None and self._client is not None:
+        future = self._future
+        main_task = self._main_task
+        if main_task is not None:
+            # Cancel the running task from outside the loop; the future
+            # completes once the task has unwound and closed the client
             try:
-                # Schedule stop coroutine from outside the loop
-                asyncio.run_coroutine_threadsafe(
-                    self._client.stop(),
-                    self._loop,
-                )
-            except Exception as e:
+                self._host.loop.call_soon_threadsafe(main_task.cancel)
+            except RuntimeError as e:
                 logger.debug(
                     "websocket_manager_stop_schedule_error",
                     error=str(e),
                 )
-
-        # Wait for thread to join with timeout
-        if self._thread is not None:
-            self._thread.join(timeout=5.0)
-            if self._thread.is_alive():
+        elif future is not None:
+            # Task not started yet - cancelling the future cancels it
+            future.cancel()
+
+        # Wait for the main coroutine to finish with timeout
+        if future is not None:
+            done, _ = concurrent.futures.wait([future], timeout=5.0)
+            if not done:
                 logger.warning("websocket_manager_thread_timeout")
-            self._thread = None
+            self._future = None
 
         self._client = None
 
@@ -261,9 +287,9 @@ class WebSocketManager:
         """Check if the manager is running.
 
         Returns:
-            True if background thread is alive and client is connected.
+            True if the listen coroutine is active and client is connected.
         """
-        if self._thread is None or not self._thread.is_alive():
+        if self._future is None or self._future.done():
             return False
 
         if self._client is None:
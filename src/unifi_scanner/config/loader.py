@@ -2,27 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import os
+import re
 import sys
 import threading
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-import yaml
 from pydantic import ValidationError
 
-from unifi_scanner.config.settings import UnifiSettings
+# ConfigurationError is re-exported: callers import it from this module
+from unifi_scanner.config.settings import ConfigurationError as ConfigurationError
+from unifi_scanner.config.settings import UnifiSettings, load_yaml_file
 
+# Global config storage; writers serialize on the lock, readers do not
+_config: Optional[UnifiSettings] = None
+_config_lock = threading.Lock()
 
-class ConfigurationError(Exception):
-    """Raised when configuration is invalid or cannot be loaded."""
+# Docker secrets pattern: UNIFI_<NAME>_FILE -> <NAME>
+_SECRET_ENV_RE = re.compile(r"^UNIFI_(.+)_FILE$")
 
-    pass
+_SECRET_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0)
+_SECRET_READ_SIZE = 65536
 
 
-# Thread-safe global config storage
-_config: Optional[UnifiSettings] = None
-_config_lock = threading.Lock()
+def _read_secret_file(filepath: str) -> str:
+    """Read a secret file with raw os.open/os.read and return stripped text.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        PermissionError: If the file cannot be opened.
+    """
+    fd = os.open(filepath, _SECRET_OPEN_FLAGS)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, _SECRET_READ_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8").strip()
 
 
 def resolve_file_secrets() -> Dict[str, str]:
@@ -37,36 +59,33 @@ def resolve_file_secrets() -> Dict[str, str]:
         -> Returns {"PASSWORD": "<file contents>"}
     """
     secrets: Dict[str, str] = {}
-    prefix = "UNIFI_"
-    suffix = "_FILE"
 
     for key, filepath in os.environ.items():
-        if key.startswith(prefix) and key.endswith(suffix):
-            # Extract base name: UNIFI_PASSWORD_FILE -> PASSWORD
-            base_name = key[len(prefix) : -len(suffix)]
-            try:
-                path = Path(filepath)
-                if path.exists():
-                    content = path.read_text().strip()
-                    secrets[base_name] = content
-                else:
-                    # Log warning but don't fail - let validation catch missing password
-                    import structlog
-
-                    log = structlog.get_logger()
-                    log.warning(
-                        "secret_file_not_found",
-                        env_var=key,
-                        path=filepath,
-                    )
-            except PermissionError:
-                raise ConfigurationError(
-                    f"Cannot read secret file '{filepath}' specified by {key}: permission denied"
-                )
-            except Exception as e:
-                raise ConfigurationError(
-                    f"Error reading secret file '{filepath}' specified by {key}: {e}"
-                )
+        match = _SECRET_ENV_RE.match(key)
+        if match is None:
+            continue
+        # Extract base name: UNIFI_PASSWORD_FILE -> PASSWORD
+        base_name = match.group(1)
+        try:
+            secrets[base_name] = _read_secret_file(filepath)
+        except FileNotFoundError:
+            # Log warning but don't fail - let validation catch missing password
+            import structlog
+
+            log = structlog.get_logger()
+            log.warning(
+                "secret_file_not_found",
+                env_var=key,
+                path=filepath,
+            )
+        except PermissionError:
+            raise ConfigurationError(
+                f"Cannot read secret file '{filepath}' specified by {key}: permission denied"
+            )
+        except Exception as e:
+            raise ConfigurationError(
+                f"Error reading secret file '{filepath}' specified by {key}: {e}"
+            )
 
     return secrets
 
@@ -79,25 +98,51 @@ def load_yaml_config(config_path: Optional[str] = None) -> Dict[str, Any]:
 
     Returns:
         Dict of configuration values from YAML, or empty dict if no file.
+
+    Raises:
+        ConfigurationError: If the file is missing, unreadable, or not valid YAML.
     """
     path = config_path or os.environ.get("CONFIG_PATH")
 
     if not path:
         return {}
 
-    try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
-            return data if isinstance(data, dict) else {}
-    except FileNotFoundError:
-        raise ConfigurationError(
-            f"Configuration file not found: {path}\n"
-            "Ensure CONFIG_PATH points to a valid YAML file, or remove it to use environment variables only."
-        )
-    except yaml.YAMLError as e:
-        raise ConfigurationError(f"Invalid YAML in configuration file {path}: {e}")
-    except PermissionError:
-        raise ConfigurationError(f"Cannot read configuration file {path}: permission denied")
+    return load_yaml_file(path)
+
+
+async def load_yaml_config_async(config_path: Optional[str] = None) -> Dict[str, Any]:
+    """Load YAML configuration from an async context without blocking the loop.
+
+    Runs load_yaml_config() in the default executor. When the caller has no
+    context variables set, the function is submitted directly instead of
+    through Context.run(), which is what asyncio.to_thread() always does.
+
+    Args:
+        config_path: Path to YAML config file. If None, checks CONFIG_PATH env var.
+
+    Returns:
+        Dict of configuration values from YAML, or empty dict if no file.
+
+    Raises:
+        ConfigurationError: If the file is missing, unreadable, or not valid YAML.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    if not ctx:
+        return await loop.run_in_executor(None, load_yaml_config, config_path)
+    return await loop.run_in_executor(None, ctx.run, load_yaml_config, config_path)
+
+
+def _format_missing_error(loc: str) -> str:
+    """Format a missing required field error with a hint on how to set it."""
+    hint = f"Set UNIFI_{loc.upper()} environment variable or add '{loc}:' to config file."
+    return f"Configuration error: '{loc}' is required. {hint}"
+
+
+# Pydantic error type -> formatter for errors that need a custom message
+_ERROR_FORMATTERS: Dict[str, Callable[[str], str]] = {
+    "missing": _format_missing_error,
+}
 
 
 def format_validation_errors(errors: List[Dict[str, Any]]) -> List[str]:
@@ -112,9 +157,11 @@ def format_validation_errors(errors: List[Dict[str, Any]]) -> List[str]:
         # The msg already contains the descriptive error, so use it directly
         if not loc:
             messages.append(f"Configuration error: {msg}")
-        elif "missing" in msg.lower() or "required" in msg.lower():
-            hint = f"Set UNIFI_{loc.upper()} environment variable or add '{loc}:' to config file."
-            messages.append(f"Configuration error: '{loc}' is required. {hint}")
+            continue
+
+        formatter = _ERROR_FORMATTERS.get(error.get("type", ""))
+        if formatter is not None:
+            messages.append(formatter(loc))
         elif input_val is not None:
             messages.append(f"Configuration error: '{loc}' {msg}, got: {input_val}")
         else:
@@ -148,10 +195,6 @@ def load_config(config_path: Optional[str] = None) -> UnifiSettings:
     if config_path:
         os.environ["CONFIG_PATH"] = config_path
 
-    # Validate YAML file exists and is readable (gives better errors)
-    # The actual loading happens in the pydantic settings source
-    _ = load_yaml_config()
-
     # Resolve Docker secrets and apply to environment
     secrets = resolve_file_secrets()
     for key, value in secrets.items():
@@ -159,12 +202,11 @@ def load_config(config_path: Optional[str] = None) -> UnifiSettings:
         if env_key not in os.environ:
             os.environ[env_key] = value
 
-    # Create settings - pydantic-settings handles source precedence
+    # Create settings - pydantic-settings handles source precedence.
+    # The YAML settings source reads CONFIG_PATH once and raises
+    # ConfigurationError if the file is missing or invalid.
     try:
-        _config = UnifiSettings()
-        with _config_lock:
-            pass  # Config already set above
-        return _config
+        config = UnifiSettings()
     except ValidationError as e:
         # Format all errors at once for fail-fast behavior
         error_messages = format_validation_errors(e.errors())
@@ -172,6 +214,10 @@ def load_config(config_path: Optional[str] = None) -> UnifiSettings:
             print(msg, file=sys.stderr)
         sys.exit(1)
 
+    with _config_lock:
+        _config = config
+    return config
+
 
 def get_config() -> UnifiSettings:
     """Get the current configuration.
@@ -182,10 +228,12 @@ def get_config() -> UnifiSettings:
     Raises:
         ConfigurationError: If configuration has not been loaded.
     """
-    with _config_lock:
-        if _config is None:
-            raise ConfigurationError("Configuration not loaded. Call load_config() first.")
-        return _config
+    # Lock-free read: rebinding a module global is atomic, and writers
+    # only ever swap in a fully constructed settings object
+    config = _config
+    if config is None:
+        raise ConfigurationError("Configuration not loaded. Call load_config() first.")
+    return config
 
 
 def reload_config() -> UnifiSettings:
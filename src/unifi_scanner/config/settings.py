@@ -2,49 +2,151 @@
 
 from __future__ import annotations
 
+import copy
 import os
+import re
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Literal, Optional, Tuple, Type
 
 import yaml
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
     SettingsConfigDict,
 )
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+
+# Validation lookup tables, built once at import
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_LOG_LEVEL_ALIASES = {"WARN": "WARNING"}
+_VALID_SCHEDULE_PRESETS = frozenset(
+    {
+        "daily_8am",
+        "daily_6pm",
+        "weekly_monday_8am",
+        "weekly_friday_5pm",
+    }
+)
+_EMAIL_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# Only hand pydantic-settings a .env path if one exists at startup, so
+# containers without a .env file skip the probe on every settings load
+_ENV_FILE: Optional[str] = ".env" if os.path.exists(".env") else None
+
+
+class ConfigurationError(Exception):
+    """Raised when configuration is invalid or cannot be loaded."""
+
+    pass
+
+
+# Parsed YAML files keyed by path, validated against (inode, mtime_ns, size)
+_YAML_CACHE: OrderedDict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = OrderedDict()
+_YAML_CACHE_SIZE = 8
+_yaml_cache_lock = threading.Lock()
+
+
+def load_yaml_file(path: str) -> Dict[str, Any]:
+    """Read and parse a YAML configuration file.
+
+    Parsed results are cached per path and reused while the file's inode,
+    mtime, and size are unchanged. Callers always receive a deep copy.
+
+    Args:
+        path: Path to the YAML config file.
+
+    Returns:
+        Dict of configuration values, or empty dict if the file is not a mapping.
+
+    Raises:
+        ConfigurationError: If the file is missing, unreadable, or not valid YAML.
+    """
+    try:
+        st = os.stat(path)
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        with _yaml_cache_lock:
+            cached = _YAML_CACHE.get(path)
+            if cached is not None and cached[0] == stamp:
+                _YAML_CACHE.move_to_end(path)
+                return copy.deepcopy(cached[1])
+
+        with open(path, "rb") as f:
+            data = yaml.load(f.read(), Loader=YamlLoader)
+        config = data if isinstance(data, dict) else {}
+
+        with _yaml_cache_lock:
+            _YAML_CACHE[path] = (stamp, config)
+            _YAML_CACHE.move_to_end(path)
+            while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+                _YAML_CACHE.popitem(last=False)
+        return copy.deepcopy(config)
+    except FileNotFoundError as e:
+        raise ConfigurationError(
+            f"Configuration file not found: {path}\n"
+            "Ensure CONFIG_PATH points to a valid YAML file, or remove it to use environment variables only."
+        ) from e
+    except yaml.YAMLError as e:
+        raise ConfigurationError(f"Invalid YAML in configuration file {path}: {e}") from e
+    except PermissionError as e:
+        raise ConfigurationError(
+            f"Cannot read configuration file {path}: permission denied"
+        ) from e
+
 
 class YamlConfigSettingsSource(PydanticBaseSettingsSource):
     """Custom settings source that loads values from a YAML file.
 
     The YAML file path is determined by the CONFIG_PATH environment variable.
+    The file is read once per settings build, in __call__(); field lookups
+    are plain dict gets against that result. Instances are reused across
+    builds (see UnifiSettings.settings_customise_sources), and unchanged
+    files are served from load_yaml_file()'s cache.
     """
 
+    def __init__(self, settings_cls: Type[BaseSettings]) -> None:
+        """Initialize the source without reading the YAML file yet."""
+        super().__init__(settings_cls)
+        self._yaml_config: Dict[str, Any] = {}
+
     def get_field_value(
         self, field: Any, field_name: str
     ) -> Tuple[Any, str, bool]:
-        """Get field value from YAML config."""
-        yaml_config = self._load_yaml_config()
-        field_value = yaml_config.get(field_name)
-        return field_value, field_name, False
+        """Get field value from the most recently loaded YAML config."""
+        return self._yaml_config.get(field_name), field_name, False
 
     def _load_yaml_config(self) -> Dict[str, Any]:
-        """Load YAML configuration file."""
+        """Load YAML configuration file.
+
+        Raises:
+            ConfigurationError: If CONFIG_PATH is set but cannot be loaded.
+        """
         config_path = os.environ.get("CONFIG_PATH")
         if not config_path:
             return {}
-
-        try:
-            with open(config_path) as f:
-                data = yaml.safe_load(f)
-                return data if isinstance(data, dict) else {}
-        except (FileNotFoundError, yaml.YAMLError, PermissionError):
-            # Errors will be handled by loader.py
-            return {}
+        return load_yaml_file(config_path)
 
     def __call__(self) -> Dict[str, Any]:
-        """Return the YAML config values."""
-        return self._load_yaml_config()
+        """Load and return the YAML config values.
+
+        Raises:
+            ConfigurationError: If CONFIG_PATH is set but cannot be loaded.
+        """
+        yaml_config = self._load_yaml_config()
+        self._yaml_config = yaml_config
+        return yaml_config
+
+
+# One YAML source per settings class, reused across UnifiSettings() builds
+_YAML_SOURCES: Dict[Type[BaseSettings], YamlConfigSettingsSource] = {}
 
 
 class UnifiSettings(BaseSettings):
@@ -59,7 +161,7 @@ class UnifiSettings(BaseSettings):
 
     model_config = SettingsConfigDict(
         env_prefix="UNIFI_",
-        env_file=".env",
+        env_file=_ENV_FILE,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -252,6 +354,9 @@ class UnifiSettings(BaseSettings):
         description="Cloudflare account ID (required for tunnel status, auto-discovered from zones if not set)",
     )
 
+    # Parsed email_recipients, filled in by parse_email_recipients
+    _email_recipients: Tuple[str, ...] = PrivateAttr(default=())
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -270,11 +375,16 @@ class UnifiSettings(BaseSettings):
         4. yaml_settings (CONFIG_PATH YAML file)
         5. file_secret_settings (not used, handled by loader)
         """
+        yaml_settings = _YAML_SOURCES.get(settings_cls)
+        if yaml_settings is None:
+            yaml_settings = _YAML_SOURCES.setdefault(
+                settings_cls, YamlConfigSettingsSource(settings_cls)
+            )
         return (
             init_settings,
             env_settings,
             dotenv_settings,
-            YamlConfigSettingsSource(settings_cls),
+            yaml_settings,
         )
 
     @field_validator("port", mode="before")
@@ -297,11 +407,9 @@ class UnifiSettings(BaseSettings):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate and normalize log level."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "WARN", "ERROR", "CRITICAL"}
-        normalized = v.upper()
-        if normalized == "WARN":
-            normalized = "WARNING"
-        if normalized not in valid_levels:
+        upper = v.upper()
+        normalized = _LOG_LEVEL_ALIASES.get(upper, upper)
+        if normalized not in _VALID_LOG_LEVELS:
             raise ValueError(
                 f"Invalid log level '{v}'. Must be one of: DEBUG, INFO, WARNING, ERROR"
             )
@@ -311,17 +419,19 @@ class UnifiSettings(BaseSettings):
     @classmethod
     def validate_host(cls, v: str) -> str:
         """Validate host is not empty."""
-        if not v or not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Host cannot be empty")
-        return v.strip()
+        return stripped
 
     @field_validator("username")
     @classmethod
     def validate_username(cls, v: str) -> str:
         """Validate username is not empty."""
-        if not v or not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Username cannot be empty")
-        return v.strip()
+        return stripped
 
     @field_validator("schedule_preset")
     @classmethod
@@ -329,16 +439,10 @@ class UnifiSettings(BaseSettings):
         """Validate schedule preset is a known preset."""
         if v is None:
             return None
-        valid_presets = {
-            "daily_8am",
-            "daily_6pm",
-            "weekly_monday_8am",
-            "weekly_friday_5pm",
-        }
-        if v not in valid_presets:
+        if v not in _VALID_SCHEDULE_PRESETS:
             raise ValueError(
                 f"Invalid schedule preset '{v}'. "
-                f"Must be one of: {', '.join(sorted(valid_presets))}"
+                f"Must be one of: {', '.join(sorted(_VALID_SCHEDULE_PRESETS))}"
             )
         return v
 
@@ -366,12 +470,20 @@ class UnifiSettings(BaseSettings):
             raise ValueError("file_output_dir is required when file_enabled is True")
         return self
 
+    @model_validator(mode="after")
+    def parse_email_recipients(self) -> "UnifiSettings":
+        """Split email_recipients once so get_email_recipients() need not re-parse."""
+        recipients = self.email_recipients.strip()
+        if recipients:
+            self._email_recipients = tuple(
+                addr for addr in _EMAIL_SPLIT_RE.split(recipients) if addr
+            )
+        return self
+
     def get_email_recipients(self) -> List[str]:
-        """Parse email_recipients string into a list of addresses.
+        """Return the email_recipients string as a list of addresses.
 
         Returns:
             List of email addresses, filtered for empty strings.
         """
-        if not self.email_recipients:
-            return []
-        return [addr.strip() for addr in self.email_recipients.split(",") if addr.strip()]
+        return list(self._email_recipients)
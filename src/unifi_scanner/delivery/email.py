@@ -2,13 +2,16 @@
 
 import smtplib
 import ssl
+from contextlib import contextmanager
+from datetime import datetime
 from email.message import EmailMessage
-from email.utils import formatdate
-from typing import List, Optional
+from email.utils import format_datetime
+from typing import Iterator, List, Optional
 
 import structlog
 
 from unifi_scanner.models.report import Report
+from unifi_scanner.utils.timestamps import get_zoneinfo
 
 log = structlog.get_logger()
 
@@ -75,21 +78,57 @@ class EmailDelivery:
         Returns:
             Formatted subject line string
         """
-        from zoneinfo import ZoneInfo
-
-        tz = ZoneInfo(self.timezone)
+        tz = get_zoneinfo(self.timezone)
         date_str = report.generated_at.astimezone(tz).strftime("%b %d, %Y")
 
         if report.severe_count > 0:
             return f"[{report.severe_count} SEVERE] UniFi Report - {date_str}"
         return f"UniFi Report - {date_str}"
 
+    @contextmanager
+    def session(self) -> Iterator[smtplib.SMTP]:
+        """Open an authenticated SMTP connection for one or more sends.
+
+        Performs EHLO, STARTTLS (when enabled on a non-465 port), and
+        login once, so several send() calls can share the handshake:
+
+            with delivery.session() as server:
+                delivery.send(recipients, subject, html, text, server=server)
+                delivery.send(other_recipients, subject, html, text, server=server)
+
+        Yields:
+            Connected SMTP (or SMTP_SSL) instance, closed on exit.
+
+        Raises:
+            smtplib.SMTPException, OSError: If connecting or login fails.
+        """
+        context = ssl.create_default_context()
+
+        if self.use_tls and self.smtp_port == 465:
+            # Implicit TLS (SMTPS) - connection encrypted from start
+            connection: smtplib.SMTP = smtplib.SMTP_SSL(
+                self.smtp_host, self.smtp_port, context=context
+            )
+        else:
+            # Explicit TLS (STARTTLS) or no TLS
+            connection = smtplib.SMTP(self.smtp_host, self.smtp_port)
+
+        with connection as server:
+            server.ehlo()
+            if self.use_tls and self.smtp_port != 465:
+                server.starttls(context=context)
+                server.ehlo()
+            if self.smtp_user and self.smtp_password:
+                server.login(self.smtp_user, self.smtp_password)
+            yield server
+
     def send(
         self,
         recipients: List[str],
         subject: str,
         html_content: str,
         text_content: str,
+        server: Optional[smtplib.SMTP] = None,
     ) -> None:
         """Send multipart email to BCC recipients.
 
@@ -101,6 +140,8 @@ class EmailDelivery:
             subject: Email subject line
             html_content: HTML body content
             text_content: Plain text fallback content
+            server: Connection from session() to reuse. If None, a new
+                connection is opened and closed for this message.
 
         Raises:
             EmailDeliveryError: If sending fails
@@ -112,33 +153,23 @@ class EmailDelivery:
         msg = EmailMessage()
         msg["Subject"] = subject
         msg["From"] = self.from_addr
-        msg["Date"] = formatdate(localtime=True)
+        # Aware datetime carries its own offset, so no system tz lookup
+        msg["Date"] = format_datetime(datetime.now(get_zoneinfo(self.timezone)))
         # NOTE: No To/Cc headers - all recipients via BCC (hidden)
-        # Recipients are passed directly to sendmail() below
+        # Recipients are passed directly to send_message() below
 
         # Set plaintext first, then add HTML alternative
         msg.set_content(text_content)
         msg.add_alternative(html_content, subtype="html")
 
         try:
-            context = ssl.create_default_context()
-
-            if self.use_tls and self.smtp_port == 465:
-                # Implicit TLS (SMTPS) - connection encrypted from start
-                with smtplib.SMTP_SSL(
-                    self.smtp_host, self.smtp_port, context=context
-                ) as server:
-                    if self.smtp_user and self.smtp_password:
-                        server.login(self.smtp_user, self.smtp_password)
-                    server.sendmail(self.from_addr, recipients, msg.as_string())
+            if server is not None:
+                server.send_message(msg, from_addr=self.from_addr, to_addrs=recipients)
             else:
-                # Explicit TLS (STARTTLS) or no TLS
-                with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                    if self.use_tls:
-                        server.starttls(context=context)
-                    if self.smtp_user and self.smtp_password:
-                        server.login(self.smtp_user, self.smtp_password)
-                    server.sendmail(self.from_addr, recipients, msg.as_string())
+                with self.session() as new_server:
+                    new_server.send_message(
+                        msg, from_addr=self.from_addr, to_addrs=recipients
+                    )
 
             log.info("email_sent", recipients_count=len(recipients), subject=subject)
 
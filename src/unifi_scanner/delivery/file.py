@@ -1,17 +1,34 @@
 """File-based report delivery with retention management."""
 
-from datetime import datetime, timedelta
+import logging
+import os
+import secrets
+import time
+from datetime import timedelta
 from pathlib import Path
 from typing import List, Literal, Optional
-import tempfile
-import shutil
 
 import structlog
 
 from unifi_scanner.models.report import Report
+from unifi_scanner.utils.timestamps import get_zoneinfo
 
 log = structlog.get_logger()
 
+# Report filenames eligible for retention cleanup
+_REPORT_PREFIX = "unifi-report-"
+_REPORT_SUFFIXES = (".html", ".txt")
+_FILENAME_STAMP_FORMAT = "%Y-%m-%d-%H%M"
+
+# Exclusive create so a stray temp file is never reused
+_TEMP_OPEN_FLAGS = (
+    os.O_WRONLY
+    | os.O_CREAT
+    | os.O_EXCL
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_BINARY", 0)
+)
+
 
 class FileDeliveryError(Exception):
     """Raised when file delivery fails."""
@@ -46,37 +63,56 @@ class FileDelivery:
         """Create output directory if it doesn't exist."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _generate_filename(self, report: Report, extension: str) -> str:
+    def _filename_stamp(self, report: Report) -> str:
+        """Format the report time for filenames in the configured timezone.
+
+        Format: 2026-01-24-1430
+        """
+        tz = get_zoneinfo(self.timezone)
+        return report.generated_at.astimezone(tz).strftime(_FILENAME_STAMP_FORMAT)
+
+    def _generate_filename(
+        self,
+        report: Report,
+        extension: str,
+        stamp: Optional[str] = None,
+    ) -> str:
         """Generate datetime-based filename.
 
         Format: unifi-report-2026-01-24-1430.html
-        """
-        from zoneinfo import ZoneInfo
 
-        tz = ZoneInfo(self.timezone)
-        timestamp = report.generated_at.astimezone(tz)
-        date_str = timestamp.strftime("%Y-%m-%d-%H%M")
-        return f"unifi-report-{date_str}.{extension}"
+        Args:
+            report: Report object whose generated_at names the file
+            extension: File extension without the dot
+            stamp: Precomputed _filename_stamp() result, to share across formats
+        """
+        if stamp is None:
+            stamp = self._filename_stamp(report)
+        return f"{_REPORT_PREFIX}{stamp}.{extension}"
 
     def _atomic_write(self, path: Path, content: str) -> None:
         """Write file atomically (write to temp, then rename).
 
-        Prevents partial writes and cleanup race conditions.
+        Prevents partial writes and cleanup race conditions. Content is
+        encoded once and written straight to the file descriptor.
         """
+        data = content.encode("utf-8")
         # Write to temp file in same directory (for same-filesystem rename)
-        temp_fd, temp_path = tempfile.mkstemp(
-            dir=self.output_dir,
-            prefix=".tmp-",
-            suffix=path.suffix,
-        )
+        temp_path = self.output_dir / f".tmp-{os.getpid()}-{secrets.token_hex(4)}{path.suffix}"
         try:
-            with open(temp_fd, "w", encoding="utf-8") as f:
-                f.write(content)
-            # Atomic rename (same filesystem)
-            shutil.move(temp_path, path)
+            fd = os.open(temp_path, _TEMP_OPEN_FLAGS, 0o600)
+            try:
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            finally:
+                os.close(fd)
+            # Atomic rename (same filesystem, so a single rename syscall)
+            os.replace(temp_path, path)
         except Exception:
             # Clean up temp file on failure
-            Path(temp_path).unlink(missing_ok=True)
+            temp_path.unlink(missing_ok=True)
             raise
 
     def cleanup_old_reports(self) -> int:
@@ -90,24 +126,34 @@ class FileDelivery:
         if not self.output_dir.exists():
             return 0
 
-        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        # Compare raw st_mtime floats against one precomputed cutoff
+        now_ts = time.time()
+        cutoff_ts = now_ts - timedelta(days=self.retention_days).total_seconds()
         deleted_count = 0
-
-        # Clean up both HTML and text files
-        for pattern in ["unifi-report-*.html", "unifi-report-*.txt"]:
-            for file_path in self.output_dir.glob(pattern):
+        # Checked once so per-file debug kwargs are skipped when filtered out
+        debug_enabled = log.is_enabled_for(logging.DEBUG)
+
+        # Clean up both HTML and text files in a single directory pass
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(_REPORT_PREFIX) or not name.endswith(_REPORT_SUFFIXES):
+                    continue
                 try:
-                    mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if mtime < cutoff:
-                        file_path.unlink()
+                    if not entry.is_file():
+                        continue
+                    mtime_ts = entry.stat().st_mtime
+                    if mtime_ts < cutoff_ts:
+                        os.unlink(entry.path)
                         deleted_count += 1
-                        log.debug(
-                            "deleted_old_report",
-                            path=str(file_path),
-                            age_days=(datetime.now() - mtime).days,
-                        )
+                        if debug_enabled:
+                            log.debug(
+                                "deleted_old_report",
+                                path=entry.path,
+                                age_days=int((now_ts - mtime_ts) // 86400),
+                            )
                 except (OSError, PermissionError) as e:
-                    log.warning("cleanup_failed", path=str(file_path), error=str(e))
+                    log.warning("cleanup_failed", path=entry.path, error=str(e))
 
         if deleted_count > 0:
             log.info(
@@ -139,17 +185,18 @@ class FileDelivery:
         """
         self._ensure_output_dir()
         saved_paths: List[Path] = []
+        stamp = self._filename_stamp(report)
 
         try:
             if self.file_format in ("html", "both") and html_content:
-                html_filename = self._generate_filename(report, "html")
+                html_filename = self._generate_filename(report, "html", stamp)
                 html_path = self.output_dir / html_filename
                 self._atomic_write(html_path, html_content)
                 saved_paths.append(html_path)
                 log.info("report_saved", path=str(html_path), format="html")
 
             if self.file_format in ("text", "both") and text_content:
-                text_filename = self._generate_filename(report, "txt")
+                text_filename = self._generate_filename(report, "txt", stamp)
                 text_path = self.output_dir / text_filename
                 self._atomic_write(text_path, text_content)
                 saved_paths.append(text_path)
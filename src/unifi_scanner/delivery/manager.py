@@ -34,6 +34,18 @@ class DeliveryManager:
         self.email_delivery = email_delivery
         self.file_delivery = file_delivery
         self.fallback_dir = fallback_dir
+        # Built on first email failure, then reused for later failures
+        self._fallback_file_delivery: Optional[FileDelivery] = None
+
+    def _get_fallback_file_delivery(self) -> FileDelivery:
+        """Return the file delivery used when email fails and none is configured."""
+        if self._fallback_file_delivery is None:
+            self._fallback_file_delivery = FileDelivery(
+                output_dir=self.fallback_dir,
+                file_format="both",
+                retention_days=30,
+            )
+        return self._fallback_file_delivery
 
     def deliver(
         self,
@@ -55,11 +67,17 @@ class DeliveryManager:
         Returns:
             True if at least one delivery succeeded, False if all failed
         """
+        if self.email_delivery is None and self.file_delivery is None:
+            log.error("all_delivery_failed", message="No delivery method configured")
+            return False
+
         email_success = False
         file_success = False
+        file_delivery = self.file_delivery
 
         # Attempt email delivery
         if self.email_delivery and email_recipients:
+            subject = self.email_delivery.build_subject(report)
             try:
                 log.debug(
                     "email_delivery_attempting",
@@ -67,7 +85,7 @@ class DeliveryManager:
                 )
                 self.email_delivery.send(
                     recipients=email_recipients,
-                    subject=self.email_delivery.build_subject(report),
+                    subject=subject,
                     html_content=html_content,
                     text_content=text_content,
                 )
@@ -76,13 +94,9 @@ class DeliveryManager:
             except EmailDeliveryError as e:
                 log.error("email_delivery_failed", error=str(e))
                 # Activate fallback if file delivery not configured
-                if not self.file_delivery:
+                if not file_delivery:
                     log.warning("activating_file_fallback", reason="email_failed")
-                    self.file_delivery = FileDelivery(
-                        output_dir=self.fallback_dir,
-                        file_format="both",
-                        retention_days=30,
-                    )
+                    file_delivery = self._get_fallback_file_delivery()
         else:
             # Log why email was skipped
             if not self.email_delivery:
@@ -91,9 +105,9 @@ class DeliveryManager:
                 log.debug("email_delivery_skipped", reason="no_recipients")
 
         # File delivery (explicit or fallback)
-        if self.file_delivery:
+        if file_delivery:
             try:
-                paths = self.file_delivery.save(
+                paths = file_delivery.save(
                     report=report,
                     html_content=html_content,
                     text_content=text_content,
@@ -24,14 +24,20 @@ Example usage:
     clear_health_status()
 """
 
-import json
+import os
+import secrets
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
 HEALTH_FILE = Path("/tmp/unifi-scanner-health")
 
+# Exclusive create so a stray temp file is never reused
+_TEMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+
 
 class HealthStatus(Enum):
     """Health status values for the scanner service.
@@ -50,6 +56,13 @@ class HealthStatus(Enum):
     UNHEALTHY = "unhealthy"
 
 
+# Pre-rendered payloads for updates without details; %s is the timestamp
+_NO_DETAILS_TEMPLATES: Dict[HealthStatus, bytes] = {
+    status: b'{"status":"' + status.value.encode("ascii") + b'","timestamp":"%s","details":{}}'
+    for status in HealthStatus
+}
+
+
 def update_health_status(
     status: HealthStatus,
     details: Optional[Dict[str, Any]] = None,
@@ -67,14 +80,38 @@ def update_health_status(
     Example:
         >>> update_health_status(HealthStatus.HEALTHY, {"site": "default", "polls": 42})
         >>> # File now contains:
-        >>> # {"status": "healthy", "timestamp": "2024-01-15T12:30:00", "details": {"site": "default", "polls": 42}}
+        >>> # {"status":"healthy","timestamp":"2024-01-15T12:30:00+00:00","details":{"site":"default","polls":42}}
     """
+    if not details:
+        # Fast path: no dict or serializer work, just fill in the timestamp
+        timestamp = datetime.now(timezone.utc).isoformat().encode("ascii")
+        _write_atomic(_NO_DETAILS_TEMPLATES[status] % timestamp)
+        return
+
     health_data = {
         "status": status.value,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "details": details or {},
+        "timestamp": datetime.now(timezone.utc),  # orjson emits ISO 8601
+        "details": details,
     }
-    HEALTH_FILE.write_text(json.dumps(health_data))
+    _write_atomic(orjson.dumps(health_data, option=orjson.OPT_NON_STR_KEYS))
+
+
+def _write_atomic(payload: bytes) -> None:
+    """Replace the health file in one rename so readers never see a partial write."""
+    temp_path = HEALTH_FILE.with_name(
+        f"{HEALTH_FILE.name}.{os.getpid()}-{secrets.token_hex(4)}.tmp"
+    )
+    try:
+        fd = os.open(temp_path, _TEMP_OPEN_FLAGS, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(temp_path, HEALTH_FILE)
+    except Exception:
+        # Clean up temp file on failure
+        temp_path.unlink(missing_ok=True)
+        raise
 
 
 def get_health_status() -> Optional[Dict[str, Any]]:
@@ -91,8 +128,9 @@ def get_health_status() -> Optional[Dict[str, Any]]:
     if not HEALTH_FILE.exists():
         return None
     try:
-        return json.loads(HEALTH_FILE.read_text())
-    except (json.JSONDecodeError, OSError):
+        data: Dict[str, Any] = orjson.loads(HEALTH_FILE.read_bytes())
+        return data
+    except (orjson.JSONDecodeError, OSError):
         return None
 
 
@@ -7,11 +7,15 @@ fail gracefully without affecting core UniFi report generation.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
 
+# Slotted dataclasses drop the per-instance __dict__; slots=True needs 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class IntegrationResult:
     """Result from an integration fetch call.
 
@@ -32,7 +36,7 @@ class IntegrationResult:
     """Error message if fetch failed."""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class IntegrationSection:
     """Section data for a single integration in the report.
 
@@ -56,7 +60,7 @@ class IntegrationSection:
     """User-friendly error message if fetch failed (e.g., 'Unable to fetch data')."""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class IntegrationResults:
     """Aggregated results from all integrations for report generation.
 
@@ -67,6 +71,34 @@ class IntegrationResults:
     sections: List[IntegrationSection] = field(default_factory=list)
     """All integration sections (both successful and failed)."""
 
+    _by_name: Dict[str, IntegrationSection] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Index of sections by integration name for get_section()."""
+
+    _has_data: bool = field(default=False, init=False, repr=False, compare=False)
+    """Whether any indexed section has data, maintained by add()."""
+
+    def __post_init__(self) -> None:
+        """Index sections passed to the constructor."""
+        for section in self.sections:
+            self._index(section)
+
+    def _index(self, section: IntegrationSection) -> None:
+        """Record a section in the name index and has_data flag."""
+        self._by_name.setdefault(section.name, section)
+        if section.success and section.data:
+            self._has_data = True
+
+    def add(self, section: IntegrationSection) -> None:
+        """Append a section and index it by name.
+
+        Args:
+            section: Section to add.
+        """
+        self.sections.append(section)
+        self._index(section)
+
     @property
     def has_data(self) -> bool:
         """Check if any integration returned data.
@@ -74,7 +106,7 @@ class IntegrationResults:
         Returns:
             True if at least one section has success=True and non-empty data.
         """
-        return any(s.success and s.data for s in self.sections)
+        return self._has_data
 
     def get_section(self, name: str) -> Optional[IntegrationSection]:
         """Get a specific integration's section by name.
@@ -85,10 +117,7 @@ class IntegrationResults:
         Returns:
             IntegrationSection if found, None otherwise.
         """
-        for section in self.sections:
-            if section.name == name:
-                return section
-        return None
+        return self._by_name.get(name)
 
 
 @runtime_checkable
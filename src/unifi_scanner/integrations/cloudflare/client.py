@@ -7,11 +7,19 @@ Uses:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import sys
+import time
+from collections import Counter, deque
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 import httpx
+import orjson
+import pybreaker
 import structlog
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
 
 from .models import (
     CloudflareData,
@@ -21,10 +29,385 @@ from .models import (
     WAFEvent,
 )
 
+# HTTP/2 lets concurrent GraphQL and REST calls share one TLS connection;
+# it needs the h2 package (httpx[http2]), so fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    _HTTP2_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
 GRAPHQL_ENDPOINT = "https://api.cloudflare.com/client/v4/graphql"
 
+# Lower-cased Cloudflare WAF actions -> WAFEvent.action (anything else is "log")
+_WAF_ACTION_MAP: dict[str, str] = {
+    "block": "block",
+    "drop": "block",
+    "challenge": "js_challenge",
+    "jschallenge": "js_challenge",
+    "managed_challenge": "managed_challenge",
+    "allow": "log",  # Allowed but logged
+}
+
+# Lower-cased tunnel statuses -> TunnelStatus.status (anything else is "inactive")
+_TUNNEL_STATUS_MAP: dict[str, str] = {
+    "healthy": "healthy",
+    "degraded": "degraded",
+    "down": "down",
+    "offline": "down",
+}
+
+# Zones per GraphQL request (zoneTag_in filter) and maximum concurrent
+# requests (stays clear of API rate limits)
+ZONE_BATCH_SIZE = 10
+ZONE_CONCURRENCY = 8
+
+# WAF events are paged newest-first, WAF_PAGE_SIZE per request, using the
+# oldest datetime of each page as the next page's until cursor. Paging stops
+# after WAF_MAX_EVENTS_PER_ZONE events so a flood cannot exhaust memory.
+WAF_PAGE_SIZE = 1000
+WAF_MAX_EVENTS_PER_ZONE = 10000
+
+# Zones rarely change; reuse them across report runs for this long (seconds)
+ZONES_CACHE_TTL = 300.0
+
+# Process-wide zones cache: token digest -> (monotonic fetch time, zones)
+_ZONES_CACHE: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+
+# Identical GraphQL queries within this window reuse the cached response (seconds)
+GRAPHQL_CACHE_TTL = 60.0
+
+# Process-wide GraphQL response cache: request digest -> (monotonic time, body)
+_GRAPHQL_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# Query windows end on a multiple of this many seconds (see _query_window)
+QUERY_WINDOW_BUCKET_SECONDS = 60
+
+# Transient GraphQL failures are retried with exponential backoff
+# (GRAPHQL_RETRY_BASE_DELAY * 2**n seconds), up to GRAPHQL_MAX_ATTEMPTS tries
+GRAPHQL_MAX_ATTEMPTS = 3
+GRAPHQL_RETRY_BASE_DELAY = 0.2
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Repeated GraphQL failures open a breaker so remaining zone batches fail
+# fast instead of each waiting out its own timeout during an outage. The
+# breaker opens after GRAPHQL_CIRCUIT_FAIL_MAX outage errors within
+# GRAPHQL_CIRCUIT_FAIL_WINDOW seconds, even with successes in between (see
+# _FailureWindowListener). There is one breaker per API token (see
+# _graphql_breaker), like the response caches.
+GRAPHQL_CIRCUIT_FAIL_MAX = 5
+GRAPHQL_CIRCUIT_FAIL_WINDOW = 60.0
+GRAPHQL_CIRCUIT_RESET_TIMEOUT = 30
+_GRAPHQL_BREAKERS: dict[str, pybreaker.CircuitBreaker] = {}
+
+# Connection pool shared by every CloudflareClient, and the loop it belongs to
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+_SHARED_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+# Per-token locks so concurrent cold fetches hit the API once. Reports run on
+# the long-lived AsyncIOHost loop, but an asyncio.Lock only works on the loop
+# it was created on, so each lock is stored with its loop and rebuilt if the
+# caller's loop differs (e.g. after the host loop restarts, or in tests).
+_ZONES_LOCKS: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+
+
+# Static GraphQL queries, serialized once into a request-body prefix so each
+# call only encodes its variables
+_WAF_QUERY = """
+query GetFirewallEvents(
+    $zoneTags: [string!]!, $since: Time!, $until: Time!, $limit: Int!
+) {
+    viewer {
+        zones(filter: {zoneTag_in: $zoneTags}) {
+            zoneTag
+            firewallEventsAdaptive(
+                filter: {
+                    datetime_gt: $since,
+                    datetime_lt: $until
+                },
+                limit: $limit,
+                orderBy: [datetime_DESC]
+            ) {
+                datetime
+                action
+                clientIP
+                ruleId
+                source
+                clientRequestHTTPHost
+                clientRequestPath
+                clientCountryName
+                userAgent
+                rayName
+            }
+        }
+    }
+}
+"""
+
+_DNS_QUERY = """
+query GetDNSAnalytics($zoneTags: [string!]!, $since: Time!, $until: Time!) {
+    viewer {
+        zones(filter: {zoneTag_in: $zoneTags}) {
+            zoneTag
+            dnsAnalyticsAdaptiveGroups(
+                filter: {
+                    datetime_gt: $since,
+                    datetime_lt: $until
+                },
+                limit: 100
+            ) {
+                count
+                dimensions {
+                    queryType
+                    responseCode
+                }
+            }
+        }
+    }
+}
+"""
+
+
+def _graphql_request_prefix(query: str) -> bytes:
+    """Pre-encode the static part of a GraphQL request body."""
+    return b'{"query":' + orjson.dumps(query) + b',"variables":'
+
+
+# Follow-up pages include the cursor second itself: datetimes are whole
+# seconds, so an exclusive cursor would drop the rest of a busy second
+_WAF_PAGE_QUERY = _WAF_QUERY.replace("datetime_lt: $until", "datetime_leq: $until")
+
+_WAF_REQUEST_PREFIX = _graphql_request_prefix(_WAF_QUERY)
+_WAF_PAGE_REQUEST_PREFIX = _graphql_request_prefix(_WAF_PAGE_QUERY)
+_DNS_REQUEST_PREFIX = _graphql_request_prefix(_DNS_QUERY)
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat() accepts the trailing "Z" Cloudflare uses natively
+    _parse_iso = datetime.fromisoformat
+else:
+
+    def _parse_iso(value: str) -> datetime:
+        """Parse a Cloudflare ISO 8601 timestamp (trailing "Z" for UTC)."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _waf_event(event: dict[str, Any]) -> WAFEvent:
+    """Build a WAFEvent from a firewallEventsAdaptive GraphQL row."""
+    return WAFEvent(
+        timestamp=_parse_iso(event["datetime"]),
+        action=_WAF_ACTION_MAP.get(event.get("action", "log").lower(), "log"),
+        source_ip=event.get("clientIP", "unknown"),
+        rule_id=event.get("ruleId"),
+        rule_source=event.get("source", "unknown"),
+        host=event.get("clientRequestHTTPHost"),
+        path=event.get("clientRequestPath"),
+        country=event.get("clientCountryName"),
+        user_agent=event.get("userAgent"),
+        ray_id=event.get("rayName"),
+    )
+
+
+def _extend_waf_events(
+    events: list[WAFEvent], rows: list[dict[str, Any]], zone_name: Optional[str]
+) -> None:
+    """Convert firewallEventsAdaptive rows and append them to events.
+
+    Args:
+        events: List to extend.
+        rows: Raw GraphQL event rows.
+        zone_name: Zone name for debug logging of malformed rows.
+    """
+    try:
+        # Fast path: the whole page parses cleanly
+        events.extend([_waf_event(row) for row in rows])
+    except Exception:
+        # Slow path: skip only the malformed events
+        for row in rows:
+            try:
+                events.append(_waf_event(row))
+            except Exception as e:
+                logger.debug(
+                    "cloudflare_waf_event_parse_error",
+                    zone=zone_name,
+                    error=str(e),
+                )
+
+
+def _waf_row_key(row: dict[str, Any]) -> Any:
+    """Identify a firewallEventsAdaptive row (by ray ID, else by its contents)."""
+    return row.get("rayName") or tuple(sorted(row.items()))
+
+
+def _waf_boundary(rows: list[dict[str, Any]]) -> tuple[str, set[Any]]:
+    """Return the oldest datetime in a page and the keys of the rows at it."""
+    cursor = rows[-1]["datetime"]
+    return cursor, {_waf_row_key(row) for row in rows if row["datetime"] == cursor}
+
+
+def _token_key(api_token: str) -> str:
+    """Digest an API token for use as a cache key (never store the raw token)."""
+    return hashlib.blake2b(api_token.encode(), digest_size=16).hexdigest()
+
+
+def _query_window(
+    lookback_hours: int, now: Optional[datetime] = None
+) -> tuple[datetime, datetime]:
+    """Build a (start, end) query window ending at a bucket boundary.
+
+    The end is floored to QUERY_WINDOW_BUCKET_SECONDS so back-to-back runs
+    produce identical GraphQL variables and hit the response cache. Events
+    from the current partial bucket are picked up by the next run.
+
+    Args:
+        lookback_hours: Window length in hours.
+        now: Current time (defaults to datetime.now(timezone.utc)).
+
+    Returns:
+        Tuple of (start_time, end_time), both timezone-aware UTC.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    bucket = QUERY_WINDOW_BUCKET_SECONDS
+    end_time = datetime.fromtimestamp(now.timestamp() // bucket * bucket, tz=timezone.utc)
+    return end_time - timedelta(hours=lookback_hours), end_time
+
+
+def _is_retryable_status(exc: BaseException) -> bool:
+    """Check whether a GraphQL failure is a transient (retryable) HTTP status."""
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in _RETRYABLE_STATUS_CODES
+    )
+
+
+def _is_outage_error(exc: BaseException) -> bool:
+    """Check whether a GraphQL failure signals an outage (counts toward the breaker).
+
+    Only transport failures and transient statuses count; client errors
+    (400/401/403) and cancellation do not.
+    """
+    return isinstance(exc, httpx.TransportError) or _is_retryable_status(exc)
+
+
+class _FailureWindowListener(pybreaker.CircuitBreakerListener):
+    """Open a closed breaker once enough failures land within the window.
+
+    pybreaker's own fail_max only counts consecutive failures, so an outage
+    that lets the odd call through would never trip it on its own.
+    """
+
+    def __init__(self) -> None:
+        self._failures: deque[float] = deque()
+
+    def failure(self, cb: pybreaker.CircuitBreaker, exc: BaseException) -> None:
+        now = time.monotonic()
+        self._failures.append(now)
+        while now - self._failures[0] > GRAPHQL_CIRCUIT_FAIL_WINDOW:
+            self._failures.popleft()
+        if len(self._failures) >= cb.fail_max and cb.current_state == pybreaker.STATE_CLOSED:
+            cb.open()
+
+    def state_change(
+        self,
+        cb: pybreaker.CircuitBreaker,
+        old_state: Optional[pybreaker.CircuitBreakerState],
+        new_state: pybreaker.CircuitBreakerState,
+    ) -> None:
+        # Start counting afresh once the breaker has recovered
+        if new_state.name == pybreaker.STATE_CLOSED:
+            self._failures.clear()
+
+
+def _graphql_breaker(key: str) -> pybreaker.CircuitBreaker:
+    """Get the GraphQL circuit breaker for a token key, creating it on first use."""
+    breaker = _GRAPHQL_BREAKERS.get(key)
+    if breaker is None:
+        breaker = pybreaker.CircuitBreaker(
+            name=f"cloudflare_graphql_{key[:8]}",
+            fail_max=GRAPHQL_CIRCUIT_FAIL_MAX,
+            reset_timeout=GRAPHQL_CIRCUIT_RESET_TIMEOUT,
+            exclude=[lambda exc: not _is_outage_error(exc)],
+            listeners=[_FailureWindowListener()],
+        )
+        _GRAPHQL_BREAKERS[key] = breaker
+    return breaker
+
+
+def _batched(zones: list[dict[str, Any]], size: int) -> list[list[dict[str, Any]]]:
+    """Split zones into consecutive batches of at most size zones."""
+    return [zones[i : i + size] for i in range(0, len(zones), size)]
+
+
+def _zones_lock(key: str) -> asyncio.Lock:
+    """Get the zones lock for a token key on the running event loop."""
+    loop = asyncio.get_running_loop()
+    entry = _ZONES_LOCKS.get(key)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Lock())
+        _ZONES_LOCKS[key] = entry
+    return entry[1]
+
+
+def _close_stale_shared_client(
+    client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Close a shared pool left behind on another event loop.
+
+    Its connections can only be closed from the loop that opened them. If
+    that loop is no longer running they cannot be closed cleanly, which is
+    logged as a warning (shutdown should call aclose_shared_client() first).
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    logger.warning(
+        "cloudflare_shared_client_abandoned",
+        reason="event loop that owns the pool is no longer running",
+    )
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide AsyncClient, creating it on first use.
+
+    Reusing one pool keeps TLS sessions and keep-alive connections to
+    api.cloudflare.com warm across report runs. Connections belong to the
+    event loop that opened them, so a different running loop gets a new pool
+    and the previous pool is closed on its own loop.
+    """
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+
+    loop = asyncio.get_running_loop()
+    if (
+        _SHARED_CLIENT is not None
+        and not _SHARED_CLIENT.is_closed
+        and _SHARED_CLIENT_LOOP is not loop
+    ):
+        _close_stale_shared_client(_SHARED_CLIENT, _SHARED_CLIENT_LOOP)
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed or _SHARED_CLIENT_LOOP is not loop:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+        )
+        _SHARED_CLIENT_LOOP = loop
+    return _SHARED_CLIENT
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared AsyncClient (call at application shutdown)."""
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+
+    client, _SHARED_CLIENT, _SHARED_CLIENT_LOOP = _SHARED_CLIENT, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 
 class CloudflareClient:
     """Client for fetching data from Cloudflare APIs.
@@ -37,6 +420,7 @@ class CloudflareClient:
         api_token: str,
         account_id: Optional[str] = None,
         timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         """Initialize Cloudflare client.
 
@@ -45,39 +429,43 @@ class CloudflareClient:
             account_id: Cloudflare account ID. If not provided, will be
                 discovered from zones. Required for tunnel status.
             timeout: Request timeout in seconds.
+            http_client: Dedicated AsyncClient to use (closed by aclose()).
+                Defaults to the process-wide shared connection pool.
         """
         self.api_token = api_token
         self.account_id = account_id
         self.timeout = timeout
         self._zones: Optional[list[dict[str, Any]]] = None
-        self._http_client: Optional[httpx.Client] = None
+        self._http_client = http_client
+        # Credentials go on each request so the pooled client stays token-agnostic
+        self._headers = {
+            "Authorization": f"Bearer {api_token}",
+            "Content-Type": "application/json",
+        }
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the dedicated HTTP client, or the shared pool if none was given."""
+        if self._http_client is not None:
+            return self._http_client
+        return _get_shared_client()
 
-    @property
-    def http_client(self) -> httpx.Client:
-        """Lazy-initialize HTTP client."""
-        if self._http_client is None:
-            self._http_client = httpx.Client(
-                timeout=self.timeout,
-                headers={
-                    "Authorization": f"Bearer {self.api_token}",
-                    "Content-Type": "application/json",
-                },
-            )
-        return self._http_client
+    async def aclose(self) -> None:
+        """Close a dedicated HTTP client.
 
-    def close(self) -> None:
-        """Close HTTP client and release resources."""
+        The shared pool is left open for the next client; it is closed at
+        shutdown by aclose_shared_client().
+        """
         if self._http_client is not None:
-            self._http_client.close()
+            await self._http_client.aclose()
             self._http_client = None
 
-    def __enter__(self) -> "CloudflareClient":
-        """Context manager entry."""
+    async def __aenter__(self) -> "CloudflareClient":
+        """Async context manager entry."""
         return self
 
-    def __exit__(self, *args: Any) -> None:
-        """Context manager exit."""
-        self.close()
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
 
     async def fetch_all(
         self,
@@ -85,6 +473,10 @@ class CloudflareClient:
     ) -> CloudflareData:
         """Fetch all Cloudflare data: WAF events, DNS analytics, and tunnel status.
 
+        The query window ends at the current time floored to
+        QUERY_WINDOW_BUCKET_SECONDS, so runs within the same bucket send
+        identical queries and share the GraphQL response cache.
+
         Args:
             lookback_hours: Hours of history to fetch for events/analytics.
 
@@ -96,42 +488,70 @@ class CloudflareClient:
         dns_analytics: list[DNSAnalytics] = []
         tunnel_statuses: list[TunnelStatus] = []
 
+        # WAF, DNS, and account discovery all need zones: load them once and
+        # record a failure once rather than have each fetch retry the request
+        zones_error: Optional[Exception] = None
+        try:
+            await self._get_zones()
+        except Exception as e:
+            zones_error = e
+            errors.append(f"Failed to fetch zones: {e}")
+            logger.warning("cloudflare_zones_fetch_failed", error=str(e))
+
         # Discover account ID from zones if not provided
-        if self.account_id is None:
+        if self.account_id is None and zones_error is None:
             try:
-                self._discover_account_id()
+                await self._discover_account_id()
             except Exception as e:
                 errors.append(f"Failed to discover account ID: {e}")
                 logger.warning("cloudflare_account_discovery_failed", error=str(e))
 
-        # Fetch WAF events
-        try:
-            waf_events = self._fetch_waf_events(lookback_hours=lookback_hours)
-            logger.info("cloudflare_waf_events_fetched", count=len(waf_events))
-        except Exception as e:
-            errors.append(f"Failed to fetch WAF events: {e}")
-            logger.warning("cloudflare_waf_fetch_failed", error=str(e))
-
-        # Fetch DNS analytics
-        try:
-            dns_analytics = self._fetch_dns_analytics(lookback_hours=lookback_hours)
-            logger.info("cloudflare_dns_analytics_fetched", zones=len(dns_analytics))
-        except Exception as e:
-            errors.append(f"Failed to fetch DNS analytics: {e}")
-            logger.warning("cloudflare_dns_fetch_failed", error=str(e))
+        # One query window for every fetch
+        start_time, end_time = _query_window(lookback_hours)
+
+        tunnel_result: list[TunnelStatus] | BaseException
+        if zones_error is None:
+            # WAF, DNS, and tunnel fetches are independent; run them concurrently
+            waf_result, dns_result, tunnel_result = await asyncio.gather(
+                self._fetch_waf_events(start_time, end_time),
+                self._fetch_dns_analytics(start_time, end_time),
+                self._fetch_tunnels(),
+                return_exceptions=True,
+            )
 
-        # Fetch tunnel status (requires account_id)
-        if self.account_id:
+            if isinstance(waf_result, BaseException):
+                errors.append(f"Failed to fetch WAF events: {waf_result}")
+                logger.warning("cloudflare_waf_fetch_failed", error=str(waf_result))
+            else:
+                waf_events = waf_result
+                logger.info("cloudflare_waf_events_fetched", count=len(waf_events))
+
+            if isinstance(dns_result, BaseException):
+                errors.append(f"Failed to fetch DNS analytics: {dns_result}")
+                logger.warning("cloudflare_dns_fetch_failed", error=str(dns_result))
+            else:
+                dns_analytics = dns_result
+                logger.info("cloudflare_dns_analytics_fetched", zones=len(dns_analytics))
+        else:
+            # WAF and DNS are queried per zone; only tunnels can still be fetched
             try:
-                tunnel_statuses = self._fetch_tunnels()
-                logger.info("cloudflare_tunnels_fetched", count=len(tunnel_statuses))
+                tunnel_result = await self._fetch_tunnels()
             except Exception as e:
-                errors.append(f"Failed to fetch tunnel status: {e}")
-                logger.warning("cloudflare_tunnels_fetch_failed", error=str(e))
-        else:
+                tunnel_result = e
+
+        # Tunnel status requires account_id (_fetch_tunnels returns [] without it)
+        if not self.account_id:
             errors.append("Tunnel status skipped: account_id not available")
+        elif isinstance(tunnel_result, BaseException):
+            errors.append(f"Failed to fetch tunnel status: {tunnel_result}")
+            logger.warning("cloudflare_tunnels_fetch_failed", error=str(tunnel_result))
+        else:
+            tunnel_statuses = tunnel_result
+            logger.info("cloudflare_tunnels_fetched", count=len(tunnel_statuses))
 
-        return CloudflareData(
+        # Every element below was built (and validated) by the fetchers, so
+        # the container skips re-validating the lists.
+        return CloudflareData.model_construct(
             waf_events=waf_events,
             dns_analytics=dns_analytics,
             tunnel_statuses=tunnel_statuses,
@@ -139,9 +559,9 @@ class CloudflareClient:
             errors=errors,
         )
 
-    def _discover_account_id(self) -> None:
+    async def _discover_account_id(self) -> None:
         """Discover account ID from zones list."""
-        zones = self._get_zones()
+        zones = await self._get_zones()
         if zones and len(zones) > 0:
             # All zones should be in the same account
             account = zones[0].get("account", {})
@@ -152,131 +572,281 @@ class CloudflareClient:
                 zone_count=len(zones),
             )
 
-    def _get_zones(self) -> list[dict[str, Any]]:
-        """Get list of zones for the account (cached)."""
+    async def _get_zones(self) -> list[dict[str, Any]]:
+        """Get list of zones for the account.
+
+        Cached per client and, for ZONES_CACHE_TTL seconds, per API token
+        across clients so warm report runs skip the zones request entirely.
+        Zones carry the account ID, so discovery is free on a warm cache.
+        """
         if self._zones is not None:
             return self._zones
 
-        response = self.http_client.get(
-            "https://api.cloudflare.com/client/v4/zones",
-            params={"per_page": 50},
-        )
-        response.raise_for_status()
-        data = response.json()
+        key = _token_key(self.api_token)
+        async with _zones_lock(key):
+            cached = _ZONES_CACHE.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ZONES_CACHE_TTL:
+                self._zones = list(cached[1])
+                return self._zones
+
+            client = await self._get_client()
+            response = await client.get(
+                "https://api.cloudflare.com/client/v4/zones",
+                params={"per_page": 50},
+                headers=self._headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
-        if not data.get("success", False):
-            errors = data.get("errors", [])
-            raise RuntimeError(f"Cloudflare API error: {errors}")
+            if not data.get("success", False):
+                errors = data.get("errors", [])
+                raise RuntimeError(f"Cloudflare API error: {errors}")
 
-        self._zones = data.get("result", [])
-        return self._zones
+            zones = data.get("result", [])
+            _ZONES_CACHE[key] = (time.monotonic(), zones)
+            self._zones = list(zones)
+            return self._zones
 
-    def _fetch_waf_events(self, lookback_hours: int = 24) -> list[WAFEvent]:
+    async def _graphql(
+        self,
+        request_prefix: bytes,
+        variables: dict[str, Any],
+        ttl: float = GRAPHQL_CACHE_TTL,
+    ) -> dict[str, Any]:
+        """Execute a GraphQL query, serving identical recent queries from cache.
+
+        Responses are cached process-wide for ttl seconds, keyed by a digest
+        of the API token and the request body. Responses carrying GraphQL
+        errors are not cached.
+
+        Args:
+            request_prefix: Pre-encoded query from _graphql_request_prefix().
+            variables: Query variables.
+            ttl: Seconds a cached response stays fresh.
+
+        Returns:
+            Decoded JSON response body.
+
+        Raises:
+            httpx.HTTPError: On transport failure or error status (after
+                retrying transient statuses).
+            pybreaker.CircuitBreakerError: If recent GraphQL calls with this
+                token keep failing (transport errors or transient statuses)
+                and the circuit is open.
+        """
+        content = request_prefix + orjson.dumps(variables, option=orjson.OPT_SORT_KEYS) + b"}"
+        token_key = _token_key(self.api_token)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(token_key.encode())
+        digest.update(content)
+        key = digest.hexdigest()
+
+        now = time.monotonic()
+        cached = _GRAPHQL_CACHE.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        client = await self._get_client()
+        with _graphql_breaker(token_key).calling():
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(GRAPHQL_MAX_ATTEMPTS),
+                wait=wait_exponential(multiplier=GRAPHQL_RETRY_BASE_DELAY),
+                retry=retry_if_exception(_is_retryable_status),
+                reraise=True,
+            ):
+                with attempt:
+                    response = await client.post(
+                        GRAPHQL_ENDPOINT,
+                        content=content,
+                        headers=self._headers,
+                        timeout=self.timeout,
+                    )
+                    response.raise_for_status()
+        data: dict[str, Any] = orjson.loads(response.content)
+
+        # Drop expired entries so the cache stays bounded by recent queries
+        for stale in [k for k, (ts, _) in _GRAPHQL_CACHE.items() if now - ts >= ttl]:
+            del _GRAPHQL_CACHE[stale]
+        # GraphQL errors (rate limits, per-zone auth) arrive with HTTP 200;
+        # don't replay them as empty results for the rest of the TTL
+        if not data.get("errors"):
+            _GRAPHQL_CACHE[key] = (time.monotonic(), data)
+        return data
+
+    async def _fetch_waf_events(self, start_time: datetime, end_time: datetime) -> list[WAFEvent]:
         """Fetch WAF events using GraphQL.
 
+        Zones are queried in batches of ZONE_BATCH_SIZE per request, with at
+        most ZONE_CONCURRENCY batches in flight.
+
         Args:
-            lookback_hours: Hours of history to fetch.
+            start_time: Start of the query window.
+            end_time: End of the query window.
 
         Returns:
             List of WAFEvent objects.
         """
-        zones = self._get_zones()
+        zones = await self._get_zones()
         if not zones:
             return []
 
-        # Build time filter
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(hours=lookback_hours)
+        since, until = start_time.isoformat(), end_time.isoformat()
+        semaphore = asyncio.Semaphore(ZONE_CONCURRENCY)
+        batches = _batched(zones, ZONE_BATCH_SIZE)
+        results = await asyncio.gather(
+            *(
+                self._fetch_waf_for_zones(batch, since, until, semaphore)
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
 
         events: list[WAFEvent] = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "cloudflare_waf_zone_fetch_failed",
+                    zones=[zone.get("name") for zone in batch],
+                    error=str(result),
+                )
+            else:
+                events.extend(result)
+        return events
 
-        for zone in zones:
-            zone_id = zone.get("id")
-            zone_name = zone.get("name")
-
-            query = """
-            query GetFirewallEvents($zoneTag: string!, $since: Time!, $until: Time!) {
-                viewer {
-                    zones(filter: {zoneTag: $zoneTag}) {
-                        firewallEventsAdaptive(
-                            filter: {
-                                datetime_gt: $since,
-                                datetime_lt: $until
-                            },
-                            limit: 1000,
-                            orderBy: [datetime_DESC]
-                        ) {
-                            datetime
-                            action
-                            clientIP
-                            ruleId
-                            source
-                            clientRequestHTTPHost
-                            clientRequestPath
-                            clientCountryName
-                            userAgent
-                            rayName
-                        }
-                    }
-                }
-            }
-            """
+    async def _fetch_waf_for_zones(
+        self,
+        zones: list[dict[str, Any]],
+        since: str,
+        until: str,
+        semaphore: asyncio.Semaphore,
+    ) -> list[WAFEvent]:
+        """Fetch WAF events for a batch of zones in a single GraphQL request.
 
-            variables = {
-                "zoneTag": zone_id,
-                "since": start_time.isoformat(),
-                "until": end_time.isoformat(),
-            }
+        Args:
+            zones: Zone dicts from the zones API.
+            since: Start of the query window (ISO 8601).
+            until: End of the query window (ISO 8601).
+            semaphore: Limits concurrent GraphQL requests.
+
+        Returns:
+            List of WAFEvent objects for the batch (empty on HTTP error).
+        """
+        zone_names = {zone.get("id"): zone.get("name") for zone in zones}
+
+        variables = {
+            "zoneTags": list(zone_names),
+            "since": since,
+            "until": until,
+            "limit": WAF_PAGE_SIZE,
+        }
+
+        events: list[WAFEvent] = []
 
+        try:
+            async with semaphore:
+                data = await self._graphql(_WAF_REQUEST_PREFIX, variables)
+        except (httpx.HTTPError, pybreaker.CircuitBreakerError) as e:
+            logger.warning(
+                "cloudflare_waf_zone_fetch_failed",
+                zones=list(zone_names.values()),
+                error=str(e),
+            )
+            return events
+
+        # Navigate GraphQL response; each zone is identified by its zoneTag
+        viewer = data.get("data", {}).get("viewer", {})
+        for zone_data in viewer.get("zones", []):
+            zone_tag = zone_data.get("zoneTag")
+            zone_name = zone_names.get(zone_tag)
+            fw_events = zone_data.get("firewallEventsAdaptive", [])
+            _extend_waf_events(events, fw_events, zone_name)
+
+            # A full first page means older events remain; page through them
+            if len(fw_events) < WAF_PAGE_SIZE:
+                continue
             try:
-                response = self.http_client.post(
-                    GRAPHQL_ENDPOINT,
-                    json={"query": query, "variables": variables},
+                until, seen = _waf_boundary(fw_events)
+                pages = self._iter_waf_pages(
+                    zone_tag, since, until, seen, len(fw_events), semaphore
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                # Navigate GraphQL response
-                viewer = data.get("data", {}).get("viewer", {})
-                zones_data = viewer.get("zones", [])
-                if zones_data:
-                    fw_events = zones_data[0].get("firewallEventsAdaptive", [])
-                    for event in fw_events:
-                        try:
-                            # Map GraphQL action to our Literal type
-                            action = self._map_waf_action(event.get("action", "log"))
-                            events.append(
-                                WAFEvent(
-                                    timestamp=datetime.fromisoformat(
-                                        event["datetime"].replace("Z", "+00:00")
-                                    ),
-                                    action=action,
-                                    source_ip=event.get("clientIP", "unknown"),
-                                    rule_id=event.get("ruleId"),
-                                    rule_source=event.get("source", "unknown"),
-                                    host=event.get("clientRequestHTTPHost"),
-                                    path=event.get("clientRequestPath"),
-                                    country=event.get("clientCountryName"),
-                                    user_agent=event.get("userAgent"),
-                                    ray_id=event.get("rayName"),
-                                )
-                            )
-                        except Exception as e:
-                            logger.debug(
-                                "cloudflare_waf_event_parse_error",
-                                zone=zone_name,
-                                error=str(e),
-                            )
-
-            except httpx.HTTPError as e:
+                async for page in pages:
+                    _extend_waf_events(events, page, zone_name)
+            except (httpx.HTTPError, pybreaker.CircuitBreakerError, KeyError) as e:
                 logger.warning(
-                    "cloudflare_waf_zone_fetch_failed",
+                    "cloudflare_waf_page_fetch_failed",
                     zone=zone_name,
                     error=str(e),
                 )
 
         return events
 
+    async def _iter_waf_pages(
+        self,
+        zone_tag: str,
+        since: str,
+        until: str,
+        seen: set[Any],
+        fetched: int,
+        semaphore: asyncio.Semaphore,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield further pages of raw WAF events for one zone, newest first.
+
+        Each page is yielded as soon as it arrives so the caller can convert
+        it and drop the raw rows before the next request. Pages are requested
+        up to and including the cursor second; rows at that second which were
+        already returned (tracked in seen) are skipped.
+
+        Args:
+            zone_tag: Zone ID to page through.
+            since: Start of the query window (ISO 8601).
+            until: Cursor; only events at or before this second are fetched.
+            seen: Keys (see _waf_row_key) of rows already returned at until.
+            fetched: Events already fetched for this zone.
+            semaphore: Limits concurrent GraphQL requests.
+
+        Yields:
+            Lists of raw firewallEventsAdaptive rows.
+        """
+        while fetched < WAF_MAX_EVENTS_PER_ZONE:
+            limit = min(WAF_PAGE_SIZE, WAF_MAX_EVENTS_PER_ZONE - fetched)
+            variables = {
+                "zoneTags": [zone_tag],
+                "since": since,
+                "until": until,
+                "limit": limit,
+            }
+            async with semaphore:
+                data = await self._graphql(_WAF_PAGE_REQUEST_PREFIX, variables)
+
+            zones_data = data.get("data", {}).get("viewer", {}).get("zones", [])
+            rows = zones_data[0].get("firewallEventsAdaptive", []) if zones_data else []
+            new_rows = [row for row in rows if _waf_row_key(row) not in seen]
+            if new_rows:
+                yield new_rows
+
+            if len(rows) < limit:
+                return
+            fetched += len(new_rows)
+
+            cursor, cursor_keys = _waf_boundary(rows)
+            if cursor != until:
+                until = cursor
+                seen = cursor_keys
+                continue
+
+            # The whole page fell within the cursor second, so a datetime
+            # cursor cannot reach the rest of it; move on to the next second
+            logger.warning(
+                "cloudflare_waf_second_truncated",
+                zone_tag=zone_tag,
+                second=until,
+                page_size=limit,
+            )
+            previous = _parse_iso(until) - timedelta(seconds=1)
+            until = previous.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            seen = set()
+
     def _map_waf_action(self, action: str) -> str:
         """Map Cloudflare WAF action to our Literal type.
 
@@ -286,128 +856,134 @@ class CloudflareClient:
         Returns:
             One of: block, challenge, managed_challenge, js_challenge, log
         """
-        action_lower = action.lower()
-        if action_lower in ("block", "drop"):
-            return "block"
-        elif action_lower in ("challenge", "jschallenge"):
-            return "js_challenge"
-        elif action_lower == "managed_challenge":
-            return "managed_challenge"
-        elif action_lower == "allow":
-            return "log"  # Allowed but logged
-        return "log"
-
-    def _fetch_dns_analytics(self, lookback_hours: int = 24) -> list[DNSAnalytics]:
+        return _WAF_ACTION_MAP.get(action.lower(), "log")
+
+    async def _fetch_dns_analytics(
+        self, start_time: datetime, end_time: datetime
+    ) -> list[DNSAnalytics]:
         """Fetch DNS analytics using GraphQL.
 
+        Zones are queried in batches of ZONE_BATCH_SIZE per request, with at
+        most ZONE_CONCURRENCY batches in flight.
+
         Args:
-            lookback_hours: Hours of history to fetch.
+            start_time: Start of the query window.
+            end_time: End of the query window.
 
         Returns:
             List of DNSAnalytics objects (one per zone).
         """
-        zones = self._get_zones()
+        zones = await self._get_zones()
         if not zones:
             return []
 
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(hours=lookback_hours)
+        since, until = start_time.isoformat(), end_time.isoformat()
+        semaphore = asyncio.Semaphore(ZONE_CONCURRENCY)
+        batches = _batched(zones, ZONE_BATCH_SIZE)
+        results = await asyncio.gather(
+            *(
+                self._fetch_dns_for_zones(batch, start_time, end_time, since, until, semaphore)
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
 
         analytics: list[DNSAnalytics] = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "cloudflare_dns_zone_fetch_failed",
+                    zones=[zone.get("name", "unknown") for zone in batch],
+                    error=str(result),
+                )
+            else:
+                analytics.extend(result)
+        return analytics
 
-        for zone in zones:
-            zone_id = zone.get("id")
-            zone_name = zone.get("name", "unknown")
-
-            query = """
-            query GetDNSAnalytics($zoneTag: string!, $since: Time!, $until: Time!) {
-                viewer {
-                    zones(filter: {zoneTag: $zoneTag}) {
-                        dnsAnalyticsAdaptiveGroups(
-                            filter: {
-                                datetime_gt: $since,
-                                datetime_lt: $until
-                            },
-                            limit: 100
-                        ) {
-                            count
-                            dimensions {
-                                queryType
-                                responseCode
-                            }
-                        }
-                    }
-                }
-            }
-            """
+    async def _fetch_dns_for_zones(
+        self,
+        zones: list[dict[str, Any]],
+        start_time: datetime,
+        end_time: datetime,
+        since: str,
+        until: str,
+        semaphore: asyncio.Semaphore,
+    ) -> list[DNSAnalytics]:
+        """Fetch DNS analytics for a batch of zones in a single GraphQL request.
 
-            variables = {
-                "zoneTag": zone_id,
-                "since": start_time.isoformat(),
-                "until": end_time.isoformat(),
-            }
+        Args:
+            zones: Zone dicts from the zones API.
+            start_time: Start of the query window.
+            end_time: End of the query window.
+            since: start_time in ISO 8601.
+            until: end_time in ISO 8601.
+            semaphore: Limits concurrent GraphQL requests.
 
-            try:
-                response = self.http_client.post(
-                    GRAPHQL_ENDPOINT,
-                    json={"query": query, "variables": variables},
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                # Navigate GraphQL response
-                viewer = data.get("data", {}).get("viewer", {})
-                zones_data = viewer.get("zones", [])
-
-                total_queries = 0
-                noerror = 0
-                nxdomain = 0
-                servfail = 0
-                query_types: dict[str, int] = {}
-
-                if zones_data:
-                    groups = zones_data[0].get("dnsAnalyticsAdaptiveGroups", [])
-                    for group in groups:
-                        count = group.get("count", 0)
-                        dims = group.get("dimensions", {})
-                        query_type = dims.get("queryType", "UNKNOWN")
-                        response_code = dims.get("responseCode", 0)
-
-                        total_queries += count
-                        query_types[query_type] = query_types.get(query_type, 0) + count
-
-                        # Aggregate by response code
-                        if response_code == 0:  # NOERROR
-                            noerror += count
-                        elif response_code == 3:  # NXDOMAIN
-                            nxdomain += count
-                        elif response_code == 2:  # SERVFAIL
-                            servfail += count
-
-                if total_queries > 0:
-                    analytics.append(
-                        DNSAnalytics(
-                            zone_name=zone_name,
-                            total_queries=total_queries,
-                            noerror_count=noerror,
-                            nxdomain_count=nxdomain,
-                            servfail_count=servfail,
-                            query_types=query_types,
-                            period_start=start_time,
-                            period_end=end_time,
-                        )
-                    )
+        Returns:
+            DNSAnalytics for each zone in the batch that had queries, in
+            zone order (empty on HTTP error).
+        """
+        variables = {
+            "zoneTags": [zone.get("id") for zone in zones],
+            "since": since,
+            "until": until,
+        }
 
-            except httpx.HTTPError as e:
-                logger.warning(
-                    "cloudflare_dns_zone_fetch_failed",
-                    zone=zone_name,
-                    error=str(e),
+        try:
+            async with semaphore:
+                data = await self._graphql(_DNS_REQUEST_PREFIX, variables)
+        except (httpx.HTTPError, pybreaker.CircuitBreakerError) as e:
+            logger.warning(
+                "cloudflare_dns_zone_fetch_failed",
+                zones=[zone.get("name", "unknown") for zone in zones],
+                error=str(e),
+            )
+            return []
+
+        # Navigate GraphQL response; each zone is identified by its zoneTag
+        viewer = data.get("data", {}).get("viewer", {})
+        groups_by_zone = {
+            zone_data.get("zoneTag"): zone_data.get("dnsAnalyticsAdaptiveGroups", [])
+            for zone_data in viewer.get("zones", [])
+        }
+
+        analytics: list[DNSAnalytics] = []
+        for zone in zones:
+            groups = groups_by_zone.get(zone.get("id"))
+            if not groups:
+                continue
+
+            total_queries = 0
+            query_types: Counter[str] = Counter()
+            response_codes: Counter[int] = Counter()
+
+            for group in groups:
+                count = group.get("count", 0)
+                dims = group.get("dimensions", {})
+                total_queries += count
+                query_types[dims.get("queryType", "UNKNOWN")] += count
+                response_codes[dims.get("responseCode", 0)] += count
+
+            if total_queries > 0:
+                # Values are computed here rather than taken from the API, so
+                # validation is skipped. Models built straight from API rows
+                # (WAFEvent, TunnelStatus) stay validated.
+                analytics.append(
+                    DNSAnalytics.model_construct(
+                        zone_name=zone.get("name", "unknown"),
+                        total_queries=total_queries,
+                        noerror_count=response_codes[0],  # NOERROR
+                        nxdomain_count=response_codes[3],  # NXDOMAIN
+                        servfail_count=response_codes[2],  # SERVFAIL
+                        query_types=dict(query_types),
+                        period_start=start_time,
+                        period_end=end_time,
+                    )
                 )
 
         return analytics
 
-    def _fetch_tunnels(self) -> list[TunnelStatus]:
+    async def _fetch_tunnels(self) -> list[TunnelStatus]:
         """Fetch tunnel status using REST API.
 
         Returns:
@@ -416,12 +992,15 @@ class CloudflareClient:
         if not self.account_id:
             return []
 
-        response = self.http_client.get(
+        client = await self._get_client()
+        response = await client.get(
             f"https://api.cloudflare.com/client/v4/accounts/{self.account_id}/cfd_tunnel",
             params={"per_page": 50},
+            headers=self._headers,
+            timeout=self.timeout,
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if not data.get("success", False):
             errors = data.get("errors", [])
@@ -443,9 +1022,7 @@ class CloudflareClient:
                 opened_at = None
                 if conn.get("opened_at"):
                     try:
-                        opened_at = datetime.fromisoformat(
-                            conn["opened_at"].replace("Z", "+00:00")
-                        )
+                        opened_at = _parse_iso(conn["opened_at"])
                     except (ValueError, TypeError):
                         pass
 
@@ -462,9 +1039,7 @@ class CloudflareClient:
             created_at = None
             if tunnel.get("created_at"):
                 try:
-                    created_at = datetime.fromisoformat(
-                        tunnel["created_at"].replace("Z", "+00:00")
-                    )
+                    created_at = _parse_iso(tunnel["created_at"])
                 except (ValueError, TypeError):
                     pass
 
@@ -490,11 +1065,4 @@ class CloudflareClient:
         Returns:
             One of: healthy, degraded, down, inactive
         """
-        status_lower = status.lower()
-        if status_lower == "healthy":
-            return "healthy"
-        elif status_lower == "degraded":
-            return "degraded"
-        elif status_lower in ("down", "offline"):
-            return "down"
-        return "inactive"
+        return _TUNNEL_STATUS_MAP.get(status.lower(), "inactive")
@@ -138,13 +138,14 @@ class CloudflareIntegration:
                 data=self._data_to_dict(data),
             )
         finally:
-            client.close()
+            await client.aclose()
 
     def _data_to_dict(self, data: CloudflareData) -> dict:
         """Convert CloudflareData to dict for template rendering.
 
         Formats data for Jinja2 template consumption with helper values.
         """
+        unhealthy_tunnels = [t.model_dump() for t in data.get_unhealthy_tunnels()]
         return {
             # WAF events
             "waf_events": [e.model_dump() for e in data.waf_events],
@@ -160,11 +161,11 @@ class CloudflareIntegration:
             # Tunnels
             "tunnels": [t.model_dump() for t in data.tunnel_statuses],
             "has_tunnels": data.has_tunnel_statuses,
-            "unhealthy_tunnels": [t.model_dump() for t in data.get_unhealthy_tunnels()],
-            "has_unhealthy_tunnels": len(data.get_unhealthy_tunnels()) > 0,
+            "unhealthy_tunnels": unhealthy_tunnels,
+            "has_unhealthy_tunnels": bool(unhealthy_tunnels),
             # Errors during collection
             "collection_errors": data.errors,
-            "has_collection_errors": len(data.errors) > 0,
+            "has_collection_errors": bool(data.errors),
         }
 
 
@@ -9,11 +9,20 @@ Models for:
 
 from __future__ import annotations
 
+import sys
 from collections import Counter
-from datetime import datetime
-from typing import List, Literal, Optional
+from datetime import datetime, timezone
+from typing import Any, List, Literal, NamedTuple, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+# WAF actions that stop the request (counted by blocked_event_count)
+_BLOCK_ACTIONS: frozenset[str] = frozenset({"block", "managed_challenge"})
+
+
+def _intern(v: Any) -> Any:
+    """Intern low-cardinality strings so repeated values share one object."""
+    return sys.intern(v) if isinstance(v, str) else v
 
 
 class WAFEvent(BaseModel):
@@ -22,6 +31,8 @@ class WAFEvent(BaseModel):
     Represents blocked requests, challenges, or rate-limited traffic.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime = Field(description="When the event occurred")
     action: Literal["block", "challenge", "managed_challenge", "js_challenge", "log"] = Field(
         description="Action taken by WAF rule"
@@ -37,6 +48,12 @@ class WAFEvent(BaseModel):
     user_agent: Optional[str] = Field(default=None, description="Client user agent string")
     ray_id: Optional[str] = Field(default=None, description="Cloudflare ray ID for debugging")
 
+    @field_validator("action", "rule_source", "country", mode="before")
+    @classmethod
+    def intern_repeated(cls, v: Any) -> Any:
+        """Intern action/source/country; they repeat across thousands of events."""
+        return _intern(v)
+
 
 class DNSAnalytics(BaseModel):
     """DNS query analytics for a zone.
@@ -44,6 +61,8 @@ class DNSAnalytics(BaseModel):
     Aggregated statistics about DNS resolution.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     zone_name: str = Field(description="Zone domain name")
     total_queries: int = Field(ge=0, description="Total DNS queries in period")
     noerror_count: int = Field(ge=0, default=0, description="Successful responses (NOERROR)")
@@ -63,6 +82,8 @@ class TunnelStatus(BaseModel):
     Represents tunnel health and connection state.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     tunnel_id: str = Field(description="Unique tunnel identifier")
     tunnel_name: str = Field(description="Human-readable tunnel name")
     status: Literal["healthy", "degraded", "down", "inactive"] = Field(
@@ -82,16 +103,37 @@ class TunnelConnection(BaseModel):
     Each tunnel can have multiple connectors for redundancy.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     colo_name: str = Field(description="Cloudflare datacenter location (e.g., 'SJC', 'LAX')")
     is_pending_reconnect: bool = Field(default=False, description="Connection is reconnecting")
     client_id: Optional[str] = Field(default=None, description="Connector client UUID")
     opened_at: Optional[datetime] = Field(default=None, description="Connection establish time")
 
+    @field_validator("colo_name", mode="before")
+    @classmethod
+    def intern_colo_name(cls, v: Any) -> Any:
+        """Intern datacenter codes; a few hundred values cover every connector."""
+        return _intern(v)
+
 
 # Update TunnelStatus to use forward reference
 TunnelStatus.model_rebuild()
 
 
+class _WAFAggregate(NamedTuple):
+    """Single-pass summary of WAF events (see CloudflareData._waf_aggregate)."""
+
+    blocked_total: int
+    """Events with a blocking action (block or managed_challenge)."""
+
+    ips: Counter[str]
+    """Source IP counts for events with action "block"."""
+
+    countries: Counter[str]
+    """Country counts for events with action "block" and a known country."""
+
+
 class CloudflareData(BaseModel):
     """Combined container for all Cloudflare data.
 
@@ -106,7 +148,8 @@ class CloudflareData(BaseModel):
         default_factory=list, description="Tunnel health data"
     )
     collected_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When data was fetched"
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="When data was fetched (UTC)",
     )
     errors: List[str] = Field(
         default_factory=list, description="Non-fatal errors during collection"
@@ -127,10 +170,40 @@ class CloudflareData(BaseModel):
         """Check if any tunnel statuses were collected."""
         return len(self.tunnel_statuses) > 0
 
+    # (waf_events list, its length, aggregate) from the last _waf_aggregate call
+    _waf_cache: Optional[tuple[List[WAFEvent], int, _WAFAggregate]] = PrivateAttr(default=None)
+
+    @property
+    def _waf_aggregate(self) -> _WAFAggregate:
+        """Blocked totals and per-IP/country counts from one pass over waf_events.
+
+        Cached until waf_events is replaced or changes length, so copies made
+        with model_copy(update=...) and appended events are recomputed.
+        """
+        waf_events = self.waf_events
+        cache = self._waf_cache
+        if cache is not None and cache[0] is waf_events and cache[1] == len(waf_events):
+            return cache[2]
+
+        blocked_total = 0
+        ips: Counter[str] = Counter()
+        countries: Counter[str] = Counter()
+        for event in waf_events:
+            action = event.action
+            if action in _BLOCK_ACTIONS:
+                blocked_total += 1
+                if action == "block":
+                    ips[event.source_ip] += 1
+                    if event.country is not None:
+                        countries[event.country] += 1
+        aggregate = _WAFAggregate(blocked_total, ips, countries)
+        self._waf_cache = (waf_events, len(waf_events), aggregate)
+        return aggregate
+
     @property
     def blocked_event_count(self) -> int:
         """Count of WAF events with blocking action (not just logged)."""
-        return sum(1 for e in self.waf_events if e.action in ("block", "managed_challenge"))
+        return self._waf_aggregate.blocked_total
 
     def get_top_blocked_ips(self, limit: int = 10) -> List[tuple[str, int]]:
         """Get IPs with most blocked requests.
@@ -141,8 +214,7 @@ class CloudflareData(BaseModel):
         Returns:
             List of (ip, count) tuples sorted by count descending.
         """
-        blocked = [e.source_ip for e in self.waf_events if e.action == "block"]
-        return Counter(blocked).most_common(limit)
+        return self._waf_aggregate.ips.most_common(limit)
 
     def get_top_blocked_countries(self, limit: int = 10) -> List[tuple[str, int]]:
         """Get countries with most blocked requests.
@@ -153,10 +225,7 @@ class CloudflareData(BaseModel):
         Returns:
             List of (country_code, count) tuples sorted by count descending.
         """
-        blocked = [
-            e.country for e in self.waf_events if e.action == "block" and e.country is not None
-        ]
-        return Counter(blocked).most_common(limit)
+        return self._waf_aggregate.countries.most_common(limit)
 
     def get_unhealthy_tunnels(self) -> List[TunnelStatus]:
         """Get tunnels that are not in healthy state."""
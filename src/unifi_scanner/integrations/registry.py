@@ -7,7 +7,7 @@ of integration classes (not dynamic plugin discovery).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Type
 
 import structlog
 
@@ -16,7 +16,8 @@ from unifi_scanner.integrations.base import Integration
 if TYPE_CHECKING:
     pass
 
-log = structlog.get_logger()
+# Lazy proxy: initial values bind on first use, after configure_logging() has run
+log = structlog.get_logger(__name__, component="integrations")
 
 
 class IntegrationRegistry:
@@ -41,8 +42,26 @@ class IntegrationRegistry:
             result = await integration.fetch()
     """
 
-    _integration_classes: List[Type[Integration]] = []
-    """Registered integration classes (hardcoded, not dynamic discovery)."""
+    _integration_classes: Dict[Type[Integration], None] = {}
+    """Registered integration classes (hardcoded, not dynamic discovery).
+
+    Used as an insertion-ordered set: keys keep registration order and
+    membership checks are O(1).
+    """
+
+    _cached_settings: Any = None
+    """Settings object the cached instances were built from."""
+
+    _instance_cache: Dict[Type[Integration], Integration] = {}
+    """Instances built from _cached_settings, keyed by class.
+
+    Only the current settings object is cached: a different settings object
+    (e.g. after a config reload) replaces the whole cache, so old settings and
+    instances are not kept alive.
+    """
+
+    _stale_instances: List[Integration] = []
+    """Instances dropped from the cache, waiting for aclose_stale()."""
 
     @classmethod
     def register(cls, integration_class: Type[Integration]) -> None:
@@ -55,18 +74,68 @@ class IntegrationRegistry:
             integration_class: Integration class to register.
         """
         if integration_class not in cls._integration_classes:
-            cls._integration_classes.append(integration_class)
+            cls._integration_classes[integration_class] = None
             log.debug(
                 "integration_registered",
                 integration=getattr(integration_class, "__name__", str(integration_class)),
             )
 
+    @classmethod
+    def _instantiate(cls, integration_class: Type[Integration], settings: Any) -> Integration:
+        """Return the cached instance for integration_class, creating it on a miss.
+
+        A settings object other than the cached one drops every cached
+        instance (they are closed by the next aclose_stale() call).
+
+        Args:
+            integration_class: Registered integration class.
+            settings: Application settings object passed to the constructor.
+
+        Returns:
+            Integration instance bound to settings.
+
+        Raises:
+            Exception: Anything raised by the integration constructor (not cached).
+        """
+        if settings is not cls._cached_settings:
+            cls._stale_instances.extend(cls._instance_cache.values())
+            cls._instance_cache = {}
+            cls._cached_settings = settings
+
+        integration = cls._instance_cache.get(integration_class)
+        if integration is None:
+            integration = integration_class(settings)  # type: ignore[call-arg]
+            cls._instance_cache[integration_class] = integration
+        return integration
+
+    @classmethod
+    async def aclose_stale(cls) -> None:
+        """Close instances dropped from the cache by a settings change.
+
+        Integrations holding resources (e.g. HTTP clients) release them in an
+        optional async aclose() method; instances without one are just dropped.
+        """
+        stale, cls._stale_instances = cls._stale_instances, []
+        for integration in stale:
+            aclose = getattr(integration, "aclose", None)
+            if aclose is None:
+                continue
+            try:
+                await aclose()
+            except Exception as e:
+                log.warning(
+                    "integration_close_failed",
+                    integration=getattr(integration, "name", type(integration).__name__),
+                    error=str(e),
+                )
+
     @classmethod
     def get_configured(cls, settings: Any) -> List[Integration]:
         """Get all integrations that are fully configured.
 
-        Instantiates each registered integration class with settings,
-        checks is_configured(), and returns only those that are ready.
+        Instantiates each registered integration class with settings (reusing
+        instances from earlier calls with the same settings object), checks
+        is_configured(), and returns only those that are ready.
         Logs warnings for partially configured integrations.
 
         Args:
@@ -75,11 +144,14 @@ class IntegrationRegistry:
         Returns:
             List of configured Integration instances. Empty if none configured.
         """
+        if not cls._integration_classes:
+            return []
+
         configured: List[Integration] = []
 
         for integration_class in cls._integration_classes:
             try:
-                integration = integration_class(settings)  # type: ignore[call-arg]
+                integration = cls._instantiate(integration_class, settings)
 
                 # Check for partial configuration and log warning
                 warning = integration.validate_config()
@@ -125,7 +197,7 @@ class IntegrationRegistry:
 
         for integration_class in cls._integration_classes:
             try:
-                integration = integration_class(settings)  # type: ignore[call-arg]
+                integration = cls._instantiate(integration_class, settings)
                 all_integrations.append(integration)
             except Exception as e:
                 log.warning(
@@ -138,8 +210,11 @@ class IntegrationRegistry:
 
     @classmethod
     def clear(cls) -> None:
-        """Clear all registered integrations.
+        """Clear all registered integrations and cached instances.
 
         Primarily for testing purposes.
         """
-        cls._integration_classes = []
+        cls._integration_classes = {}
+        cls._cached_settings = None
+        cls._instance_cache = {}
+        cls._stale_instances = []
@@ -17,7 +17,8 @@ Example usage::
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, Dict
+import sys
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, TypeVar
 
 import pybreaker
 import structlog
@@ -33,16 +34,37 @@ from unifi_scanner.integrations.registry import IntegrationRegistry
 if TYPE_CHECKING:
     pass
 
-log = structlog.get_logger()
+# Lazy proxy: initial values bind on first use, after configure_logging() has run
+log = structlog.get_logger(__name__, component="integrations")
 
 # Module-level constants for circuit breaker and timeout configuration
 INTEGRATION_TIMEOUT = 30  # seconds per integration
 CIRCUIT_FAIL_MAX = 3  # open after 3 consecutive failures
 CIRCUIT_RESET_TIMEOUT = 60  # try again after 60 seconds
 
+# Report header names by integration identifier (extend as integrations are added)
+_DISPLAY_NAMES: Dict[str, str] = {
+    "cloudflare": "Cloudflare Security",
+    "cybersecure": "Cybersecure",
+}
+
 # Cache of circuit breakers by integration name (in-memory, resets on restart)
 _circuit_breakers: Dict[str, pybreaker.CircuitBreaker] = {}
 
+T = TypeVar("T")
+
+
+async def _with_timeout(aw: Awaitable[T], timeout: float) -> T:
+    """Await aw, raising asyncio.TimeoutError after timeout seconds.
+
+    Uses the asyncio.timeout() context manager on Python 3.11+, which avoids
+    the extra Task that asyncio.wait_for() wraps around the awaitable.
+    """
+    if sys.version_info >= (3, 11):
+        async with asyncio.timeout(timeout):
+            return await aw
+    return await asyncio.wait_for(aw, timeout=timeout)
+
 
 class CircuitBreakerLoggingListener(pybreaker.CircuitBreakerListener):
     """Logs circuit breaker state changes.
@@ -81,13 +103,17 @@ class CircuitBreakerLoggingListener(pybreaker.CircuitBreakerListener):
             )
 
 
+# The listener is stateless, so every breaker shares one instance
+_SHARED_LISTENER = CircuitBreakerLoggingListener()
+
+
 def create_circuit_breaker(name: str) -> pybreaker.CircuitBreaker:
     """Create a circuit breaker for an integration.
 
     Uses consistent configuration across all integrations:
     - fail_max=3: Open after 3 consecutive failures
     - reset_timeout=60: Try again after 60 seconds
-    - Logging listener for state change monitoring
+    - Shared logging listener for state change monitoring
 
     Args:
         name: Integration name for logging context.
@@ -99,7 +125,7 @@ def create_circuit_breaker(name: str) -> pybreaker.CircuitBreaker:
         name=name,
         fail_max=CIRCUIT_FAIL_MAX,
         reset_timeout=CIRCUIT_RESET_TIMEOUT,
-        listeners=[CircuitBreakerLoggingListener()],
+        listeners=[_SHARED_LISTENER],
     )
 
 
@@ -150,49 +176,40 @@ class IntegrationRunner:
     async def run_all(self) -> IntegrationResults:
         """Run all configured integrations in parallel.
 
-        Gets configured integrations from registry, runs them in parallel
-        using asyncio.gather with return_exceptions=True for complete
-        isolation (INTG-02).
+        Gets configured integrations from registry and runs them in parallel
+        (asyncio.TaskGroup on Python 3.11+, asyncio.gather otherwise).
+        _run_one never raises for integration failures, so one failing
+        integration cannot affect the others (INTG-02).
 
         Returns:
             IntegrationResults with sections for all integrations.
             Empty sections list if no integrations configured.
         """
         integrations = IntegrationRegistry.get_configured(self._settings)
+        # Release instances built from settings replaced by a config reload
+        await IntegrationRegistry.aclose_stale()
 
         if not integrations:
             # Silent skip when no integrations configured
             return IntegrationResults(sections=[])
 
-        # Run all integrations in parallel with complete isolation
-        results = await asyncio.gather(
-            *[self._run_one(integration) for integration in integrations],
-            return_exceptions=True,  # Critical for isolation (INTG-02)
-        )
+        # Run all integrations in parallel. _run_one converts every failure
+        # into an IntegrationResult, which provides the isolation (INTG-02).
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(self._run_one(integration)) for integration in integrations]
+            results = [task.result() for task in tasks]
+        else:
+            results = await asyncio.gather(
+                *[self._run_one(integration) for integration in integrations]
+            )
 
         # Convert results to sections
-        sections = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                # Unexpected exception from gather itself
-                integration = integrations[i]
-                log.error(
-                    "integration_unexpected_error",
-                    integration=integration.name,
-                    error=str(result),
-                )
-                sections.append(
-                    IntegrationSection(
-                        name=integration.name,
-                        display_name=self._get_display_name(integration.name),
-                        success=False,
-                        error_message="Unable to fetch data",
-                    )
-                )
-            else:
-                sections.append(self._result_to_section(result))
+        integration_results = IntegrationResults()
+        for result in results:
+            integration_results.add(self._result_to_section(result))
 
-        return IntegrationResults(sections=sections)
+        return integration_results
 
     async def _run_one(self, integration: Integration) -> IntegrationResult:
         """Run a single integration with circuit breaker and timeout.
@@ -231,10 +248,7 @@ class IntegrationRunner:
             # Use calling() context manager for proper async support
             # The context manager tracks success/failure and updates circuit state
             with breaker.calling():
-                result = await asyncio.wait_for(
-                    integration.fetch(),
-                    timeout=INTEGRATION_TIMEOUT,
-                )
+                result = await _with_timeout(integration.fetch(), INTEGRATION_TIMEOUT)
             return result
 
         except asyncio.TimeoutError:
@@ -260,6 +274,9 @@ class IntegrationRunner:
                 error="circuit_open",
             )
         except Exception as e:
+            # Isolation boundary for run_all: every integration failure ends
+            # here. BaseException (cancellation, KeyboardInterrupt, SystemExit)
+            # is deliberately left to propagate.
             log.error(
                 "integration_error",
                 integration=integration.name,
@@ -307,8 +324,8 @@ class IntegrationRunner:
     def _get_display_name(self, name: str) -> str:
         """Get human-readable display name for integration.
 
-        Maps integration identifiers to display names for report headers.
-        Can be extended as integrations are added.
+        Maps integration identifiers to display names for report headers
+        via _DISPLAY_NAMES, falling back to a title-cased identifier.
 
         Args:
             name: Integration identifier.
@@ -316,9 +333,4 @@ class IntegrationRunner:
         Returns:
             Human-readable display name.
         """
-        # Display name mapping (can be extended for future integrations)
-        display_names = {
-            "cloudflare": "Cloudflare Security",
-            "cybersecure": "Cybersecure",
-        }
-        return display_names.get(name, name.replace("_", " ").title())
+        return _DISPLAY_NAMES.get(name) or name.replace("_", " ").title()
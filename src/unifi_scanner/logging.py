@@ -8,6 +8,17 @@ from typing import List, Literal
 
 import structlog
 
+# Level names accepted by configure_logging (unknown names fall back to INFO)
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.CRITICAL,
+}
+
 
 def configure_logging(
     log_format: Literal["json", "text"] = "json",
@@ -19,6 +30,8 @@ def configure_logging(
         log_format: Output format - "json" for production, "text" for development.
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR).
     """
+    level = _LEVELS.get(log_level.upper(), logging.INFO)
+
     # Common processors for all formats
     shared_processors: List[structlog.typing.Processor] = [
         structlog.contextvars.merge_contextvars,
@@ -44,9 +57,7 @@ def configure_logging(
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper(), logging.INFO)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
@@ -56,7 +67,7 @@ def configure_logging(
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper(), logging.INFO),
+        level=level,
     )
 
 
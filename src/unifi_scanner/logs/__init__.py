@@ -1,11 +1,21 @@
-"""Log parsing modules for UniFi Scanner."""
+"""Log parsing modules for UniFi Scanner.
 
-from .api_collector import APICollectionError, APILogCollector
-from .collector import LogCollectionError, LogCollector
-from .mongo_ips_collector import MongoIPSCollector
-from .parser import LogParser
-from .ssh_collector import SSHCollectionError, SSHLogCollector
-from .ws_collector import WSCollectionError, WSLogCollector
+Public names are imported lazily (PEP 562) so that importing one collector
+module does not pull in the dependencies of every other collector.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api_collector import APICollectionError, APILogCollector
+    from .collector import LogCollectionError, LogCollector
+    from .mongo_ips_collector import MongoIPSCollector
+    from .parser import LogParser
+    from .ssh_collector import SSHCollectionError, SSHLogCollector
+    from .ws_collector import WSCollectionError, WSLogCollector
 
 __all__ = [
     # Main orchestrator
@@ -25,3 +35,32 @@ __all__ = [
     # Parser
     "LogParser",
 ]
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "LogCollector": ".collector",
+    "LogCollectionError": ".collector",
+    "APILogCollector": ".api_collector",
+    "APICollectionError": ".api_collector",
+    "SSHLogCollector": ".ssh_collector",
+    "SSHCollectionError": ".ssh_collector",
+    "MongoIPSCollector": ".mongo_ips_collector",
+    "WSLogCollector": ".ws_collector",
+    "WSCollectionError": ".ws_collector",
+    "LogParser": ".parser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
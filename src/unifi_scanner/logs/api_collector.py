@@ -4,8 +4,13 @@ Wraps UnifiClient methods to retrieve events and alarms,
 parsing them into LogEntry objects.
 """
 
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from functools import partial
+from typing import Any, Callable, ClassVar, Dict, List, Optional
 
 import structlog
 
@@ -16,6 +21,13 @@ from .parser import LogParser
 
 logger = structlog.get_logger(__name__)
 
+# Clock skew tolerance applied to since_timestamp cutoffs (STATE-07)
+CLOCK_SKEW_TOLERANCE = timedelta(minutes=5)
+
+# Parsed API events kept across collections; overlapping poll windows return
+# many of the same events, which then skip LogEntry validation
+PARSE_CACHE_SIZE = 20000
+
 
 class APICollectionError(Exception):
     """Raised when API log collection fails."""
@@ -43,6 +55,9 @@ class APILogCollector:
         ...     entries = collector.collect()
     """
 
+    # Shared across instances so the parse cache persists between polls/sites
+    _parser: ClassVar[LogParser] = LogParser(cache_size=PARSE_CACHE_SIZE)
+
     def __init__(
         self,
         client: UnifiClient,
@@ -64,7 +79,7 @@ class APILogCollector:
         self.site = site
         self.history_hours = history_hours
         self.since_timestamp = since_timestamp
-        self._parser = LogParser()
+        self._log = logger.bind(site=site)
         self.raw_ips_events: list[dict] = []
 
     def collect(
@@ -75,7 +90,9 @@ class APILogCollector:
     ) -> List[LogEntry]:
         """Collect logs from the API.
 
-        Retrieves events, alarms, and IPS events and parses into LogEntry objects.
+        Retrieves events, alarms, and IPS events concurrently (the requests are
+        independent) and parses them into LogEntry objects in that order. A
+        failed request is logged and skipped; the others are still returned.
 
         Args:
             include_events: Include event logs (default True).
@@ -86,69 +103,117 @@ class APILogCollector:
             List of LogEntry objects from API.
 
         Raises:
-            APICollectionError: API request failed.
+            APICollectionError: Every API request failed, or parsing failed.
         """
         entries: List[LogEntry] = []
 
-        logger.info(
+        self._log.info(
             "api_collection_starting",
-            site=self.site,
             history_hours=self.history_hours,
             include_events=include_events,
             include_alarms=include_alarms,
             include_ips_events=include_ips_events,
         )
 
+        # Filter by since_timestamp while parsing (client-side filtering);
+        # UniFi API doesn't support timestamp filtering on events endpoint.
+        # Apply clock skew tolerance (STATE-07)
+        effective_cutoff: Optional[datetime] = None
+        if self.since_timestamp:
+            effective_cutoff = self.since_timestamp - CLOCK_SKEW_TOLERANCE
+
+        # Don't ask for more history than the cutoff can use: incremental runs
+        # shrink the window to the hours since the last report.
+        end_ms = time.time_ns() // 1_000_000
+        history_hours = self.history_hours
+        start_ms = end_ms - (history_hours * 60 * 60 * 1000)
+        if effective_cutoff is not None:
+            cutoff_ms = int(effective_cutoff.timestamp() * 1000)
+            needed_hours = max(1, math.ceil((end_ms - cutoff_ms) / (60 * 60 * 1000)))
+            history_hours = min(history_hours, needed_hours)
+            start_ms = max(start_ms, cutoff_ms)
+
+        # Build the independent fetches up front, then run them concurrently
+        # so collection takes ~max(request) instead of sum(requests).
+        fetches: Dict[str, Callable[[], List[Dict[str, Any]]]] = {}
+        if include_events:
+            fetches["events"] = partial(
+                self.client.get_events,
+                site=self.site,
+                history_hours=history_hours,
+            )
+        if include_alarms:
+            fetches["alarms"] = partial(self.client.get_alarms, site=self.site)
+        if include_ips_events:
+            # IPS events use start/end timestamps in ms, not history_hours
+            fetches["ips_events"] = partial(
+                self.client.get_ips_events,
+                site=self.site,
+                start=start_ms,
+                end=end_ms,
+            )
+
+        # Each fetch fails independently: a broken IPS endpoint shouldn't
+        # discard events and alarms that were retrieved fine.
+        raw: Dict[str, List[Dict[str, Any]]] = {}
+        errors: Dict[str, Exception] = {}
+        if fetches:
+            with ThreadPoolExecutor(
+                max_workers=len(fetches),
+                thread_name_prefix="api-collect",
+            ) as pool:
+                futures = {name: pool.submit(fetch) for name, fetch in fetches.items()}
+                for name, future in futures.items():
+                    try:
+                        raw[name] = future.result()
+                    except Exception as e:
+                        errors[name] = e
+                        self._log.warning("api_fetch_failed", fetch=name, error=str(e))
+
+        if errors and not raw:
+            cause = next(iter(errors.values()))
+            details = "; ".join(f"{name}: {e}" for name, e in errors.items())
+            raise APICollectionError(
+                message=f"API collection failed: {details}",
+                cause=cause,
+            ) from cause
+
         try:
-            if include_events:
-                events = self.client.get_events(
-                    site=self.site,
-                    history_hours=self.history_hours,
-                )
-                parsed_events = self._parser.parse_api_events(events)
+            if "events" in raw:
+                events = raw["events"]
+                parsed_events = self._parser.parse_api_events(events, since=effective_cutoff)
                 entries.extend(parsed_events)
                 # Log at INFO if no events found to help diagnose issues
                 if len(events) == 0:
-                    logger.info(
+                    self._log.info(
                         "api_events_empty",
-                        site=self.site,
-                        history_hours=self.history_hours,
+                        history_hours=history_hours,
                         hint="Controller may have no events, or API endpoint may differ",
                     )
                 else:
-                    logger.debug(
+                    self._log.debug(
                         "api_events_collected",
                         raw_count=len(events),
                         parsed_count=len(parsed_events),
                     )
 
-            if include_alarms:
-                alarms = self.client.get_alarms(site=self.site)
-                parsed_alarms = self._parser.parse_api_events(alarms)
+            if "alarms" in raw:
+                alarms = raw["alarms"]
+                parsed_alarms = self._parser.parse_api_events(alarms, since=effective_cutoff)
                 entries.extend(parsed_alarms)
-                logger.debug(
+                self._log.debug(
                     "api_alarms_collected",
                     raw_count=len(alarms),
                     parsed_count=len(parsed_alarms),
                 )
 
-            if include_ips_events:
-                # IPS events use start/end timestamps in ms, not history_hours
-                # Calculate based on history_hours for consistency
-                import time
-                end_ms = int(time.time() * 1000)
-                start_ms = end_ms - (self.history_hours * 60 * 60 * 1000)
-
-                ips_events = self.client.get_ips_events(
-                    site=self.site,
-                    start=start_ms,
-                    end=end_ms,
-                )
+            if "ips_events" in raw:
+                ips_events = raw["ips_events"]
                 self.raw_ips_events = ips_events
-                parsed_ips = self._parser.parse_api_events(ips_events)
+                parsed_ips = self._parser.parse_api_events(ips_events, since=effective_cutoff)
                 entries.extend(parsed_ips)
                 # Log IPS events count at INFO level for visibility
-                logger.info(
+                self._log.info(
                     "api_ips_events_collected",
                     raw_count=len(ips_events),
                     parsed_count=len(parsed_ips),
@@ -160,24 +225,21 @@ class APILogCollector:
                 cause=e,
             ) from e
 
-        # Filter by since_timestamp if provided (client-side filtering)
-        # UniFi API doesn't support timestamp filtering on events endpoint
-        if self.since_timestamp:
-            unfiltered_count = len(entries)
-            # Apply 5-minute clock skew tolerance (STATE-07)
-            effective_cutoff = self.since_timestamp - timedelta(minutes=5)
-            entries = [e for e in entries if e.timestamp > effective_cutoff]
-            logger.debug(
+        if (
+            effective_cutoff is not None
+            and self.since_timestamp is not None
+            and self._log.is_enabled_for(logging.DEBUG)
+        ):
+            self._log.debug(
                 "api_entries_filtered",
-                before_filter=unfiltered_count,
+                raw_count=sum(len(v) for v in raw.values()),
                 after_filter=len(entries),
                 since=self.since_timestamp.isoformat(),
                 effective_cutoff=effective_cutoff.isoformat(),
             )
 
-        logger.info(
+        self._log.info(
             "api_collection_complete",
-            site=self.site,
             total_entries=len(entries),
         )
         return entries
@@ -4,8 +4,9 @@ Tries WebSocket first (for WiFi events), then REST API, then falls back
 to SSH if API fails or returns insufficient entries.
 """
 
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Optional
+from datetime import datetime
+from itertools import chain
+from typing import TYPE_CHECKING, Optional, Union
 
 import structlog
 
@@ -13,7 +14,7 @@ from unifi_scanner.api import UnifiClient
 from unifi_scanner.config import UnifiSettings
 from unifi_scanner.models import DeviceType, LogEntry
 
-from .api_collector import APICollectionError, APILogCollector
+from .api_collector import CLOCK_SKEW_TOLERANCE, APICollectionError, APILogCollector
 from .ssh_collector import SSHCollectionError, SSHLogCollector
 from .ws_collector import WSCollectionError, WSLogCollector
 
@@ -83,6 +84,7 @@ class LogCollector:
         self.min_entries = min_entries
         self._ws_manager = ws_manager
         self.raw_ips_events: list[dict] = []
+        self._log = logger.bind(site=site)
 
     def collect(
         self,
@@ -127,15 +129,15 @@ class LogCollector:
 
                     if ws_events:
                         sources.append("ws")
-                        logger.info(
+                        self._log.info(
                             "websocket_events_collected",
                             count=len(ws_events),
                         )
                 else:
-                    logger.debug("websocket_manager_not_running")
+                    self._log.debug("websocket_manager_not_running")
 
             except WSCollectionError as e:
-                logger.warning(
+                self._log.warning(
                     "ws_collection_failed",
                     error=str(e),
                 )
@@ -159,13 +161,13 @@ class LogCollector:
 
             except APICollectionError as e:
                 api_error = e
-                logger.warning(
+                self._log.warning(
                     "api_collection_failed",
                     error=str(e),
                 )
             except Exception as e:
                 api_error = e
-                logger.warning(
+                self._log.warning(
                     "api_collection_unexpected_error",
                     error=str(e),
                 )
@@ -177,7 +179,7 @@ class LogCollector:
         if len(merged_events) >= self.min_entries or api_succeeded:
             # Don't try SSH if we have enough or API succeeded
             if len(merged_events) >= self.min_entries:
-                logger.info(
+                self._log.info(
                     "log_collection_complete",
                     sources=sources,
                     ws_count=len(ws_events),
@@ -188,7 +190,7 @@ class LogCollector:
 
             # API succeeded but insufficient entries, try SSH if enabled
             if len(merged_events) < self.min_entries:
-                logger.info(
+                self._log.info(
                     "api_insufficient_entries",
                     entries=len(merged_events),
                     min_required=self.min_entries,
@@ -202,11 +204,11 @@ class LogCollector:
                 # Filter SSH entries by since_timestamp (defensive, same as API)
                 if since_timestamp:
                     unfiltered_count = len(ssh_entries)
-                    effective_cutoff = since_timestamp - timedelta(minutes=5)
+                    effective_cutoff = since_timestamp - CLOCK_SKEW_TOLERANCE
                     ssh_entries = [
                         e for e in ssh_entries if e.timestamp > effective_cutoff
                     ]
-                    logger.debug(
+                    self._log.debug(
                         "ssh_entries_filtered",
                         before_filter=unfiltered_count,
                         after_filter=len(ssh_entries),
@@ -219,7 +221,7 @@ class LogCollector:
                 # Merge with WS + API entries
                 merged_events = self._merge_events(merged_events, ssh_entries)
 
-                logger.info(
+                self._log.info(
                     "log_collection_complete",
                     sources=sources,
                     ws_count=len(ws_events),
@@ -231,23 +233,23 @@ class LogCollector:
 
             except SSHCollectionError as e:
                 ssh_error = e
-                logger.warning(
+                self._log.warning(
                     "ssh_collection_failed",
                     error=str(e),
                 )
             except Exception as e:
                 ssh_error = e
-                logger.warning(
+                self._log.warning(
                     "ssh_collection_unexpected_error",
                     error=str(e),
                 )
         else:
-            logger.debug("ssh_fallback_disabled")
+            self._log.debug("ssh_fallback_disabled")
 
         # If API succeeded (even with 0 entries), return what we got
         # 0 entries is valid - may just be no events in the time window
         if api_succeeded or ws_events:
-            logger.info(
+            self._log.info(
                 "log_collection_partial",
                 sources=sources,
                 ws_count=len(ws_events),
@@ -269,7 +271,9 @@ class LogCollector:
         events_a: list[LogEntry],
         events_b: list[LogEntry],
     ) -> list[LogEntry]:
-        """Merge two lists of log entries, deduplicating by timestamp+message.
+        """Merge two lists of log entries, deduplicating by controller event ID.
+
+        Entries without a source_id (e.g. SSH) fall back to timestamp+message.
 
         Args:
             events_a: First list of events (preserved in conflicts).
@@ -283,14 +287,12 @@ class LogCollector:
         if not events_b:
             return events_a
 
-        # Use dict to deduplicate, preserving events_a in conflicts
-        seen: dict[tuple[datetime, str], LogEntry] = {}
-        for e in events_a:
-            seen[(e.timestamp, e.message)] = e
-        for e in events_b:
-            key = (e.timestamp, e.message)
-            if key not in seen:
-                seen[key] = e
+        # Single pass over both inputs; setdefault keeps the first entry per
+        # key, so events_a wins conflicts and insertion order is preserved
+        seen: dict[Union[str, tuple[datetime, str]], LogEntry] = {}
+        setdefault = seen.setdefault
+        for e in chain(events_a, events_b):
+            setdefault(e.source_id or (e.timestamp, e.message), e)
 
         return list(seen.values())
 
@@ -8,10 +8,11 @@ The MongoDB database on UDM Pro devices stores blocked threats in the
 `ace.alert` collection with key `THREAT_BLOCKED_V3`.
 """
 
-import json
+import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+import orjson
 import paramiko
 import structlog
 
@@ -19,6 +20,17 @@ from .ssh_collector import SSHCollectionError, WarningHostKeyPolicy, _Fingerprin
 
 logger = structlog.get_logger(__name__)
 
+# MongoDB shell extended JSON wrappers, unwrapped in a single regex pass:
+# ObjectId("...") / ISODate("...") -> "...", NumberLong(n) / NumberLong("n") -> n
+_MONGO_WRAPPER_PATTERN = re.compile(
+    r'(?:ObjectId|ISODate)\(("[^"]+")\)|NumberLong\((?:(\d+)|"(\d+)")\)'
+)
+
+
+def _unwrap_mongo_value(match: "re.Match[str]") -> str:
+    """Return the plain JSON value captured by _MONGO_WRAPPER_PATTERN."""
+    return match.group(1) or match.group(2) or match.group(3)
+
 
 class MongoIPSCollector:
     """Collects IPS threat alerts from UniFi device MongoDB via SSH.
@@ -277,8 +289,12 @@ class MongoIPSCollector:
         if not output.strip():
             return []
 
+        # Unwrap extended JSON once for the whole output rather than per document;
+        # the substitutions never add or remove braces, so boundaries are unchanged
+        output = self._convert_mongo_json(output)
+
         alerts = []
-        current_doc = ""
+        doc_lines: List[str] = []
         brace_count = 0
 
         for line in output.split("\n"):
@@ -287,27 +303,20 @@ class MongoIPSCollector:
                 continue
 
             # Track brace nesting to find document boundaries
-            for char in line:
-                if char == "{":
-                    brace_count += 1
-                elif char == "}":
-                    brace_count -= 1
-
-            current_doc += line + " "
+            brace_count += line.count("{") - line.count("}")
+            doc_lines.append(line)
 
-            if brace_count == 0 and current_doc.strip():
+            if brace_count == 0:
+                doc_str = " ".join(doc_lines)
+                doc_lines = []
                 try:
-                    # Handle MongoDB extended JSON (ObjectId, NumberLong, etc.)
-                    doc_str = self._convert_mongo_json(current_doc.strip())
-                    doc = json.loads(doc_str)
-                    alerts.append(doc)
-                except json.JSONDecodeError as e:
+                    alerts.append(orjson.loads(doc_str))
+                except orjson.JSONDecodeError as e:
                     logger.debug(
                         "mongo_json_parse_error",
                         error=str(e),
-                        doc=current_doc[:200],
+                        doc=doc_str[:200],
                     )
-                current_doc = ""
 
         return alerts
 
@@ -325,19 +334,7 @@ class MongoIPSCollector:
         Returns:
             Standard JSON string.
         """
-        import re
-
-        # ObjectId("...") -> "..."
-        result = re.sub(r'ObjectId\("([^"]+)"\)', r'"\1"', mongo_json)
-
-        # NumberLong(...) or NumberLong("...") -> number
-        result = re.sub(r'NumberLong\((\d+)\)', r'\1', result)
-        result = re.sub(r'NumberLong\("(\d+)"\)', r'\1', result)
-
-        # ISODate("...") -> "..."
-        result = re.sub(r'ISODate\("([^"]+)"\)', r'"\1"', result)
-
-        return result
+        return _MONGO_WRAPPER_PATTERN.sub(_unwrap_mongo_value, mongo_json)
 
     def _normalize_alert(self, alert: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize a MongoDB alert to a consistent format.
@@ -1,11 +1,15 @@
 """Multi-format log parser for UniFi logs."""
 
 import json
-from typing import Any, Dict, List
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 import structlog
 
 from unifi_scanner.models import LogEntry
+from unifi_scanner.utils.timestamps import epoch_seconds
 
 logger = structlog.get_logger(__name__)
 
@@ -17,6 +21,10 @@ class LogParser:
     Handles malformed data gracefully, logging warnings
     and skipping unparseable entries.
 
+    With cache_size > 0, API events that carry a controller "_id" are kept
+    in an LRU cache so events returned again by overlapping poll windows
+    are not re-validated. A hit is only used if the raw event is unchanged.
+
     Example:
         >>> parser = LogParser()
         >>> entries = parser.parse_api_events([{"time": 1705084800000, "key": "EVT_TEST", "msg": "Test"}])
@@ -24,20 +32,75 @@ class LogParser:
         1
     """
 
-    def parse_api_events(self, events: List[Dict[str, Any]]) -> List[LogEntry]:
+    def __init__(self, cache_size: int = 0) -> None:
+        """Initialize the parser.
+
+        Args:
+            cache_size: Maximum parsed API events to cache by "_id" (0 disables).
+        """
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, LogEntry] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cached_entry(self, event_id: str, event: Dict[str, Any]) -> Optional[LogEntry]:
+        """Return the cached entry for event_id if its raw data is unchanged."""
+        with self._cache_lock:
+            entry = self._cache.get(event_id)
+            if entry is None or entry.raw_data != event:
+                return None
+            self._cache.move_to_end(event_id)
+            return entry
+
+    def _cache_entry(self, event_id: str, entry: LogEntry) -> None:
+        """Store a parsed entry, evicting the least recently used beyond cache_size."""
+        with self._cache_lock:
+            self._cache[event_id] = entry
+            self._cache.move_to_end(event_id)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def parse_api_events(
+        self,
+        events: List[Dict[str, Any]],
+        since: Optional[datetime] = None,
+    ) -> List[LogEntry]:
         """Parse list of events from UniFi API.
 
         Args:
             events: List of event dictionaries from API response
+            since: If set, drop events at or before this time. Events with a
+                numeric "time" are rejected before any LogEntry is built.
 
         Returns:
             List of LogEntry objects (skips unparseable events)
         """
         entries: List[LogEntry] = []
+        use_cache = self._cache_size > 0
+        since_s = since.timestamp() if since is not None else None
         for i, event in enumerate(events):
+            if since_s is not None:
+                raw_time = event.get("time")
+                if (
+                    raw_time  # falsy times fall back to "datetime" in LogEntry
+                    and isinstance(raw_time, (int, float))
+                    and not isinstance(raw_time, bool)
+                    and epoch_seconds(raw_time) < since_s
+                ):
+                    continue
+
+            event_id = event.get("_id") if use_cache else None
+            if isinstance(event_id, str):
+                cached = self._cached_entry(event_id, event)
+                if cached is not None:
+                    if since is None or cached.timestamp > since:
+                        entries.append(cached)
+                    continue
             try:
                 entry = LogEntry.from_unifi_event(event)
-                entries.append(entry)
+                if isinstance(event_id, str):
+                    self._cache_entry(event_id, entry)
+                if since is None or entry.timestamp > since:
+                    entries.append(entry)
             except Exception as e:
                 logger.warning(
                     "event_parse_failed",
@@ -4,7 +4,7 @@ Provides fallback log collection when API access is insufficient.
 Connects to UniFi devices via SSH and reads log files directly.
 """
 
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 import paramiko
 from paramiko import MissingHostKeyPolicy, PKey
@@ -131,6 +131,9 @@ class SSHLogCollector:
         >>> entries = collector.collect(max_lines=100)
     """
 
+    # Syslog parsing keeps no per-collector state, so one parser serves all
+    _parser: ClassVar[LogParser] = LogParser()
+
     def __init__(
         self,
         host: str,
@@ -167,7 +170,6 @@ class SSHLogCollector:
         self.host_key_fingerprint = host_key_fingerprint
         self.key_path = key_path
         self.key_passphrase = key_passphrase
-        self._parser = LogParser()
 
     def collect(self, max_lines: int = 1000) -> List[LogEntry]:
         """Collect logs from the device via SSH.
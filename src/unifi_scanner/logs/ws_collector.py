@@ -171,6 +171,9 @@ class WSLogCollector:
             event_type=event.event_type,
         )
 
+        # Controller event ID, matches the REST API copy of the same event
+        source_id = event.data.get("_id")
+
         # Get log level for metadata
         level = EVENT_LEVELS.get(event.event_type, "INFO")
 
@@ -187,6 +190,7 @@ class WSLogCollector:
             device_name=ap if ap != "unknown" else None,
             event_type=event.event_type,
             message=message,
+            source_id=source_id if isinstance(source_id, str) else None,
             raw_data=event.data,
             metadata=metadata,
         )
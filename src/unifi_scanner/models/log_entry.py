@@ -49,6 +49,9 @@ class LogEntry(BaseModel):
     device_name: Optional[str] = Field(default=None, description="Human-readable device name")
     event_type: str = Field(..., description="UniFi event type code like 'EVT_AP_Connected'")
     message: str = Field(..., description="Human-readable message")
+    source_id: Optional[str] = Field(
+        default=None, description="Controller event ID ('_id'), used to deduplicate sources"
+    )
     raw_data: Dict[str, Any] = Field(
         default_factory=dict, description="Original data for debugging"
     )
@@ -130,6 +133,9 @@ class LogEntry(BaseModel):
             or event_data.get("gw_name")
         )
 
+        # Controller event ID, shared by REST and WebSocket copies of an event
+        source_id = event_data.get("_id")
+
         # Build metadata with subsystem info
         metadata: Dict[str, Any] = {}
         if "subsystem" in event_data:
@@ -144,6 +150,7 @@ class LogEntry(BaseModel):
             device_name=device_name,
             event_type=event_data.get("key"),
             message=event_data.get("msg", ""),
+            source_id=source_id if isinstance(source_id, str) else None,
             raw_data=event_data,
             metadata=metadata,
         )
@@ -1,7 +1,9 @@
 """Utility modules for UniFi Scanner."""
 
-from .timestamps import normalize_timestamp
+from .timestamps import epoch_seconds, get_zoneinfo, normalize_timestamp
 
 __all__ = [
+    "epoch_seconds",
+    "get_zoneinfo",
     "normalize_timestamp",
 ]
@@ -1,11 +1,44 @@
 """Timestamp normalization utilities for UniFi log data."""
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Union
+from zoneinfo import ZoneInfo
 
 from dateutil import parser as dateutil_parser
 
 
+@lru_cache(maxsize=8)
+def get_zoneinfo(name: str) -> ZoneInfo:
+    """Return a ZoneInfo for an IANA timezone name, cached by name.
+
+    Args:
+        name: IANA timezone name (e.g., "UTC", "America/New_York")
+
+    Returns:
+        ZoneInfo instance for the timezone
+
+    Raises:
+        ZoneInfoNotFoundError: If the timezone name is unknown
+    """
+    return ZoneInfo(name)
+
+
+def epoch_seconds(value: Union[int, float]) -> float:
+    """Convert a numeric Unix timestamp (milliseconds or seconds) to seconds.
+
+    UniFi uses milliseconds; values > 1e12 are treated as milliseconds
+    (anything after 2001), smaller values as seconds.
+
+    Args:
+        value: Unix timestamp in milliseconds or seconds
+
+    Returns:
+        Unix timestamp in seconds
+    """
+    return value / 1000 if value > 1e12 else value
+
+
 def normalize_timestamp(
     value: Any,
     assume_utc: bool = True,
@@ -37,10 +70,7 @@ def normalize_timestamp(
         dt = value
     elif isinstance(value, (int, float)):
         # UniFi uses milliseconds - detect by magnitude
-        # Timestamps > 1e12 are definitely milliseconds (after year 2001)
-        if value > 1e12:
-            value = value / 1000
-        dt = datetime.fromtimestamp(value, tz=timezone.utc)
+        dt = datetime.fromtimestamp(epoch_seconds(value), tz=timezone.utc)
         return dt  # Already UTC, no further conversion needed
     elif isinstance(value, str):
         dt = dateutil_parser.parse(value)
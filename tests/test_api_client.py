@@ -1,8 +1,9 @@
 """Tests for UniFi API client event and alarm retrieval."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import httpx
+import orjson
 import pytest
 
 from unifi_scanner.api.client import UnifiClient
@@ -42,12 +43,12 @@ class TestGetEvents:
         # Setup mock response
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "meta": {"rc": "ok"},
             "data": [
                 {"key": "EVT_AP_Connected", "time": 1705084800000, "msg": "AP connected"}
             ],
-        }
+        })
         connected_client._client.request.return_value = mock_response
 
         # Call method
@@ -62,7 +63,7 @@ class TestGetEvents:
         """Test get_events sends POST with correct body."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         connected_client._client.request.return_value = mock_response
 
         # Call with specific parameters
@@ -84,7 +85,7 @@ class TestGetEvents:
         """Test get_events enforces 3000 limit maximum."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         connected_client._client.request.return_value = mock_response
 
         # Request more than 3000
@@ -100,10 +101,10 @@ class TestGetEvents:
         # Create response with truncation (count > data length)
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "meta": {"rc": "ok", "count": 5000},
             "data": [{"key": f"EVT_{i}"} for i in range(3000)],
-        }
+        })
         connected_client._client.request.return_value = mock_response
 
         # Call method
@@ -120,7 +121,7 @@ class TestGetEvents:
         """Test get_events handles empty data array."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"meta": {"rc": "ok"}, "data": []}
+        mock_response.content = orjson.dumps({"meta": {"rc": "ok"}, "data": []})
         connected_client._client.request.return_value = mock_response
 
         events = connected_client.get_events("default")
@@ -131,7 +132,7 @@ class TestGetEvents:
         """Test get_events handles response without wrapper."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = [{"key": "EVT_Test"}]
+        mock_response.content = orjson.dumps([{"key": "EVT_Test"}])
         connected_client._client.request.return_value = mock_response
 
         events = connected_client.get_events("default")
@@ -147,12 +148,12 @@ class TestGetAlarms:
         """Test get_alarms returns alarm data from API response."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "meta": {"rc": "ok"},
             "data": [
                 {"key": "EVT_IPS_Alert", "time": 1705084800000, "msg": "IPS alert triggered"}
             ],
-        }
+        })
         connected_client._client.request.return_value = mock_response
 
         alarms = connected_client.get_alarms("default")
@@ -164,7 +165,7 @@ class TestGetAlarms:
         """Test get_alarms sends GET request to correct endpoint."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         connected_client._client.request.return_value = mock_response
 
         connected_client.get_alarms("mysite")
@@ -177,7 +178,7 @@ class TestGetAlarms:
         """Test get_alarms passes archived=true query param when archived=True."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         connected_client._client.request.return_value = mock_response
 
         connected_client.get_alarms("default", archived=True)
@@ -191,7 +192,7 @@ class TestGetAlarms:
         """Test get_alarms passes archived=false query param when archived=False."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         connected_client._client.request.return_value = mock_response
 
         connected_client.get_alarms("default", archived=False)
@@ -205,7 +206,7 @@ class TestGetAlarms:
         """Test get_alarms does not include archived param when archived=None."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         connected_client._client.request.return_value = mock_response
 
         connected_client.get_alarms("default", archived=None)
@@ -219,7 +220,7 @@ class TestGetAlarms:
         """Test get_alarms handles empty data array."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"meta": {"rc": "ok"}, "data": []}
+        mock_response.content = orjson.dumps({"meta": {"rc": "ok"}, "data": []})
         connected_client._client.request.return_value = mock_response
 
         alarms = connected_client.get_alarms("default")
@@ -241,7 +242,7 @@ class TestEndpointRouting:
 
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         client._client.request.return_value = mock_response
 
         client.get_events("default")
@@ -261,7 +262,7 @@ class TestEndpointRouting:
 
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         client._client.request.return_value = mock_response
 
         client.get_events("default")
@@ -282,7 +283,7 @@ class TestEndpointRouting:
 
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         client._client.request.return_value = mock_response
 
         client.get_alarms("default")
@@ -302,7 +303,7 @@ class TestEndpointRouting:
 
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         client._client.request.return_value = mock_response
 
         client.get_alarms("default")
@@ -311,3 +312,21 @@ class TestEndpointRouting:
         url = call_args[0][1]
         assert "/api/s/default/list/alarm" in url
         assert "/proxy/network" not in url
+
+
+class TestConnect:
+    """Tests for UnifiClient connection setup."""
+
+    def test_connect_enables_http2(self, mock_settings):
+        """The HTTP client negotiates HTTP/2 so concurrent requests share a connection."""
+        client = UnifiClient(mock_settings)
+
+        with patch(
+            "unifi_scanner.api.client.detect_device_type",
+            return_value=(DeviceType.UDM_PRO, 443),
+        ), patch("unifi_scanner.api.client.authenticate", return_value="csrf"), patch(
+            "unifi_scanner.api.client.httpx.Client"
+        ) as client_cls:
+            client.connect()
+
+        assert client_cls.call_args.kwargs["http2"] is True
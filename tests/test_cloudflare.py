@@ -5,13 +5,21 @@ Tests models, client mocking, integration Protocol compliance, and template rend
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import pybreaker
 import pytest
+from pydantic import ValidationError
 
 from unifi_scanner.integrations.base import IntegrationResult
+from unifi_scanner.integrations.cloudflare import client as client_module
+from unifi_scanner.integrations.cloudflare.client import CloudflareClient
 from unifi_scanner.integrations.cloudflare.models import (
     CloudflareData,
     DNSAnalytics,
@@ -74,6 +82,32 @@ class TestWAFEvent:
             )
             assert event.action == action
 
+    def test_waf_event_is_frozen(self):
+        """WAFEvent instances are immutable."""
+        event = WAFEvent(
+            timestamp=datetime.now(timezone.utc),
+            action="block",
+            source_ip="1.2.3.4",
+            rule_source="waf",
+        )
+        with pytest.raises(ValidationError):
+            event.action = "log"
+
+    def test_repeated_strings_are_interned(self):
+        """Equal country/rule_source values share one string object."""
+        events = [
+            WAFEvent(
+                timestamp=datetime.now(timezone.utc),
+                action="block",
+                source_ip="1.2.3.4",
+                rule_source="".join(["fire", "wall"]),
+                country="".join(["C", "N"]),
+            )
+            for _ in range(2)
+        ]
+        assert events[0].country is events[1].country
+        assert events[0].rule_source is events[1].rule_source
+
 
 class TestDNSAnalytics:
     """Tests for DNSAnalytics model."""
@@ -183,6 +217,10 @@ class TestCloudflareData:
         assert not data.has_tunnel_statuses
         assert data.blocked_event_count == 0
 
+    def test_collected_at_defaults_to_aware_utc(self):
+        """collected_at defaults to a timezone-aware UTC timestamp."""
+        assert CloudflareData().collected_at.tzinfo is timezone.utc
+
     def test_cloudflare_data_with_waf_events(self):
         """CloudflareData with WAF events."""
         events = [
@@ -232,6 +270,23 @@ class TestCloudflareData:
         assert top_countries[0] == ("CN", 2)
         assert top_countries[1] == ("RU", 1)
 
+    def test_cloudflare_data_aggregates_follow_waf_events(self):
+        """Copies with new waf_events and appended events do not reuse stale counts."""
+        event = WAFEvent(
+            timestamp=datetime.now(timezone.utc),
+            action="block",
+            source_ip="1.2.3.4",
+            rule_source="waf",
+        )
+        data = CloudflareData(waf_events=[event])
+        assert data.blocked_event_count == 1
+
+        assert data.model_copy(update={"waf_events": []}).blocked_event_count == 0
+
+        data.waf_events.append(event)
+        assert data.blocked_event_count == 2
+        assert data.get_top_blocked_ips() == [("1.2.3.4", 2)]
+
     def test_cloudflare_data_unhealthy_tunnels(self):
         """CloudflareData filters unhealthy tunnels."""
         tunnels = [
@@ -374,7 +429,7 @@ class TestCloudflareIntegration:
         ) as MockClient:
             mock_instance = MagicMock()
             mock_instance.fetch_all = AsyncMock(return_value=mock_data)
-            mock_instance.close = MagicMock()
+            mock_instance.aclose = AsyncMock()
             MockClient.return_value = mock_instance
 
             result = await integration.fetch()
@@ -401,12 +456,625 @@ class TestCloudflareIntegration:
         ) as MockClient:
             mock_instance = MagicMock()
             mock_instance.fetch_all = AsyncMock(return_value=mock_data)
-            mock_instance.close = MagicMock()
+            mock_instance.aclose = AsyncMock()
             MockClient.return_value = mock_instance
 
             await integration.fetch()
 
-            mock_instance.close.assert_called_once()
+            mock_instance.aclose.assert_awaited_once()
+
+
+# ============================================================================
+# Client Tests
+# ============================================================================
+
+ZONES = [
+    {"id": "zone-a", "name": "a.example.com", "account": {"id": "acct-1"}},
+    {"id": "zone-b", "name": "b.example.com", "account": {"id": "acct-1"}},
+]
+
+WINDOW = (
+    datetime(2026, 1, 24, tzinfo=timezone.utc),
+    datetime(2026, 1, 25, tzinfo=timezone.utc),
+)
+
+
+def _cloudflare_handler(request: httpx.Request) -> httpx.Response:
+    """Fake Cloudflare API: zones, GraphQL analytics, and tunnels."""
+    path = request.url.path
+    if path.endswith("/zones"):
+        return httpx.Response(200, json={"success": True, "result": ZONES})
+    if path.endswith("/cfd_tunnel"):
+        tunnel = {
+            "id": "t1",
+            "name": "home",
+            "status": "degraded",
+            "created_at": "2026-01-01T00:00:00Z",
+            "connections": [{"colo_name": "SJC", "opened_at": "2026-01-02T00:00:00Z"}],
+        }
+        return httpx.Response(200, json={"success": True, "result": [tunnel]})
+    if path.endswith("/graphql"):
+        body = json.loads(request.content)
+        zone_tags = body["variables"]["zoneTags"]
+        if "firewallEventsAdaptive" in body["query"]:
+            dataset = {
+                "firewallEventsAdaptive": [
+                    {
+                        "datetime": "2026-01-24T12:00:00Z",
+                        "action": "block",
+                        "clientIP": "1.2.3.4",
+                        "source": "waf",
+                    }
+                ]
+            }
+        else:
+            dataset = {
+                "dnsAnalyticsAdaptiveGroups": [
+                    {"count": 5, "dimensions": {"queryType": "A", "responseCode": 0}},
+                    {"count": 2, "dimensions": {"queryType": "AAAA", "responseCode": 3}},
+                ]
+            }
+        zones = [{"zoneTag": tag, **dataset} for tag in zone_tags]
+        return httpx.Response(200, json={"data": {"viewer": {"zones": zones}}})
+    return httpx.Response(404)
+
+
+def _waf_page_handler(rows: list[dict], requested_until: list[str]):
+    """Serve WAF rows (newest first) honouring the query's until comparison."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("/graphql"):
+            return _cloudflare_handler(request)
+        body = json.loads(request.content)
+        variables = body["variables"]
+        requested_until.append(variables["until"])
+        until = datetime.fromisoformat(variables["until"].replace("Z", "+00:00"))
+        inclusive = "datetime_leq" in body["query"]
+        page = [
+            {"action": "block", **row}
+            for row in rows
+            if (ts := datetime.fromisoformat(row["datetime"].replace("Z", "+00:00"))) < until
+            or (inclusive and ts == until)
+        ][: variables["limit"]]
+        zones = [{"zoneTag": tag, "firewallEventsAdaptive": page} for tag in variables["zoneTags"]]
+        return httpx.Response(200, json={"data": {"viewer": {"zones": zones}}})
+
+    return handler
+
+
+def _make_client(
+    handler=_cloudflare_handler, api_token: str = "test_token", **kwargs
+) -> CloudflareClient:
+    """Create a CloudflareClient backed by a mock transport."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return CloudflareClient(api_token=api_token, http_client=http_client, **kwargs)
+
+
+class TestCloudflareClient:
+    """Tests for CloudflareClient against a mocked HTTP transport."""
+
+    @pytest.fixture(autouse=True)
+    def clear_zones_cache(self):
+        """Isolate tests from the process-wide caches and GraphQL breakers."""
+        client_module._ZONES_CACHE.clear()
+        client_module._GRAPHQL_CACHE.clear()
+        client_module._GRAPHQL_BREAKERS.clear()
+        yield
+        client_module._ZONES_CACHE.clear()
+        client_module._GRAPHQL_CACHE.clear()
+        client_module._GRAPHQL_BREAKERS.clear()
+
+    @pytest.mark.asyncio
+    async def test_fetch_all(self):
+        """fetch_all() collects WAF, DNS, and tunnel data for every zone."""
+        async with _make_client() as client:
+            data = await client.fetch_all(lookback_hours=1)
+
+        assert client.account_id == "acct-1"
+        assert data.errors == []
+        assert [e.source_ip for e in data.waf_events] == ["1.2.3.4", "1.2.3.4"]
+        assert data.waf_events[0].timestamp == datetime(2026, 1, 24, 12, tzinfo=timezone.utc)
+        assert [d.zone_name for d in data.dns_analytics] == ["a.example.com", "b.example.com"]
+        assert data.dns_analytics[0].query_types == {"A": 5, "AAAA": 2}
+        assert data.dns_analytics[0].nxdomain_count == 2
+        assert data.tunnel_statuses[0].status == "degraded"
+        assert data.tunnel_statuses[0].connections_count == 1
+        assert data.tunnel_statuses[0].created_at == datetime(2026, 1, 1, tzinfo=timezone.utc)
+        assert data.tunnel_statuses[0].connections[0].opened_at == datetime(
+            2026, 1, 2, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.asyncio
+    async def test_waf_events_paginate_with_datetime_cursor(self, monkeypatch):
+        """Full pages are followed with until set to the oldest event seen."""
+        monkeypatch.setattr(client_module, "WAF_PAGE_SIZE", 2)
+        rows = [
+            {"datetime": f"2026-01-24T12:0{minute}:00Z", "rayName": f"ray-{minute}"}
+            for minute in range(4, -1, -1)
+        ]
+        requested_until = []
+
+        async with _make_client(_waf_page_handler(rows, requested_until), account_id="acct-1") as client:
+            client._zones = ZONES[:1]
+            events = await client._fetch_waf_events(*WINDOW)
+
+        assert [e.timestamp.minute for e in events] == [4, 3, 2, 1, 0]
+        assert requested_until[1:] == [f"2026-01-24T12:0{minute}:00Z" for minute in (3, 2, 1, 0)]
+
+    @pytest.mark.asyncio
+    async def test_waf_pagination_keeps_rest_of_boundary_second(self, monkeypatch):
+        """Events sharing the cursor second with the page end are not dropped."""
+        monkeypatch.setattr(client_module, "WAF_PAGE_SIZE", 3)
+        seconds = ["05", "04", "03", "03", "02", "01"]
+        rows = [
+            {"datetime": f"2026-01-24T12:00:{sec}Z", "rayName": f"ray-{i}"}
+            for i, sec in enumerate(seconds)
+        ]
+
+        async with _make_client(_waf_page_handler(rows, []), account_id="acct-1") as client:
+            client._zones = ZONES[:1]
+            events = await client._fetch_waf_events(*WINDOW)
+
+        assert [e.ray_id for e in events] == [f"ray-{i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_waf_pagination_steps_past_overfull_second(self, monkeypatch):
+        """A second with more events than a page moves the cursor on instead of looping."""
+        monkeypatch.setattr(client_module, "WAF_PAGE_SIZE", 2)
+        seconds = ["03", "03", "03", "02"]
+        rows = [
+            {"datetime": f"2026-01-24T12:00:{sec}Z", "rayName": f"ray-{i}"}
+            for i, sec in enumerate(seconds)
+        ]
+        requested_until = []
+
+        async with _make_client(_waf_page_handler(rows, requested_until), account_id="acct-1") as client:
+            client._zones = ZONES[:1]
+            events = await client._fetch_waf_events(*WINDOW)
+
+        assert [e.ray_id for e in events] == ["ray-0", "ray-1", "ray-3"]
+        assert requested_until[1:] == ["2026-01-24T12:00:03Z", "2026-01-24T12:00:02Z"]
+
+    @pytest.mark.asyncio
+    async def test_waf_pagination_stops_at_max_events(self, monkeypatch):
+        """Paging stops once WAF_MAX_EVENTS_PER_ZONE events are fetched."""
+        monkeypatch.setattr(client_module, "WAF_PAGE_SIZE", 2)
+        monkeypatch.setattr(client_module, "WAF_MAX_EVENTS_PER_ZONE", 3)
+        limits = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if not request.url.path.endswith("/graphql"):
+                return _cloudflare_handler(request)
+            variables = json.loads(request.content)["variables"]
+            limits.append(variables["limit"])
+            rows = [
+                {"datetime": f"2026-01-24T11:5{i}:00Z", "action": "block"}
+                for i in range(variables["limit"])
+            ]
+            zones = [
+                {"zoneTag": tag, "firewallEventsAdaptive": rows} for tag in variables["zoneTags"]
+            ]
+            return httpx.Response(200, json={"data": {"viewer": {"zones": zones}}})
+
+        async with _make_client(handler, account_id="acct-1") as client:
+            client._zones = ZONES[:1]
+            events = await client._fetch_waf_events(*WINDOW)
+
+        assert limits == [2, 1]
+        assert len(events) == 3
+
+    @pytest.mark.asyncio
+    async def test_malformed_waf_event_is_skipped(self):
+        """One unparseable WAF event does not drop the rest of the zone."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/graphql"):
+                rows = [
+                    {"datetime": "not-a-date", "action": "block", "clientIP": "6.6.6.6"},
+                    {"datetime": "2026-01-24T12:00:00Z", "action": "drop", "clientIP": "1.2.3.4"},
+                ]
+                zone = {"zoneTag": "zone-a", "firewallEventsAdaptive": rows}
+                return httpx.Response(200, json={"data": {"viewer": {"zones": [zone]}}})
+            return _cloudflare_handler(request)
+
+        async with _make_client(handler, account_id="acct-1") as client:
+            events = await client._fetch_waf_events(*WINDOW)
+
+        assert [(e.source_ip, e.action) for e in events] == [("1.2.3.4", "block")]
+
+    def test_query_window_floors_to_bucket(self, monkeypatch):
+        """Query windows end on a bucket boundary so nearby runs share cache keys."""
+        now = datetime(2026, 1, 24, 12, 7, 42, 123456, tzinfo=timezone.utc)
+
+        start, end = client_module._query_window(24, now=now)
+
+        assert end == datetime(2026, 1, 24, 12, 7, tzinfo=timezone.utc)
+        assert start == datetime(2026, 1, 23, 12, 7, tzinfo=timezone.utc)
+
+        monkeypatch.setattr(client_module, "QUERY_WINDOW_BUCKET_SECONDS", 300)
+        assert client_module._query_window(1, now=now)[1] == datetime(
+            2026, 1, 24, 12, 5, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("block", "block"),
+            ("DROP", "block"),
+            ("jschallenge", "js_challenge"),
+            ("managed_challenge", "managed_challenge"),
+            ("allow", "log"),
+            ("skip", "log"),
+        ],
+    )
+    def test_map_waf_action(self, raw, expected):
+        """Cloudflare WAF actions map case-insensitively, defaulting to log."""
+        assert CloudflareClient(api_token="t")._map_waf_action(raw) == expected
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("healthy", "healthy"), ("Degraded", "degraded"), ("offline", "down"), ("x", "inactive")],
+    )
+    def test_map_tunnel_status(self, raw, expected):
+        """Tunnel statuses map case-insensitively, defaulting to inactive."""
+        assert CloudflareClient(api_token="t")._map_tunnel_status(raw) == expected
+
+    @pytest.mark.asyncio
+    async def test_requests_carry_client_token(self):
+        """Credentials are sent per request rather than baked into the pool."""
+        auth_headers = set()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            auth_headers.add(request.headers.get("Authorization"))
+            return _cloudflare_handler(request)
+
+        async with _make_client(handler, account_id="acct-1") as client:
+            await client.fetch_all()
+
+        assert auth_headers == {"Bearer test_token"}
+
+    @pytest.mark.asyncio
+    async def test_shared_client_reused_across_clients(self):
+        """Clients without a dedicated AsyncClient share one pool until shutdown."""
+        first = CloudflareClient(api_token="a")
+        shared = await first._get_client()
+        await first.aclose()
+
+        second = CloudflareClient(api_token="b")
+        assert await second._get_client() is shared
+        assert not shared.is_closed
+
+        await client_module.aclose_shared_client()
+        assert shared.is_closed
+
+    def test_shared_client_is_per_event_loop(self):
+        """A new event loop gets a new pool (connections are loop-bound)."""
+
+        async def get_shared():
+            return await CloudflareClient(api_token="a")._get_client()
+
+        first = asyncio.run(get_shared())
+        second = asyncio.run(get_shared())
+
+        assert first is not second
+        asyncio.run(client_module.aclose_shared_client())
+
+    def test_shared_client_from_running_loop_is_closed_on_loop_change(self):
+        """The pool left on another, still running loop is closed on that loop."""
+        from unifi_scanner.api.async_host import AsyncIOHost
+
+        async def get_shared():
+            return await CloudflareClient(api_token="a")._get_client()
+
+        host = AsyncIOHost()
+        try:
+            first = host.submit(get_shared()).result(timeout=2.0)
+            second = asyncio.run(get_shared())
+
+            deadline = time.monotonic() + 2.0
+            while not first.is_closed and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert first.is_closed
+            assert not second.is_closed
+        finally:
+            host.shutdown()
+            asyncio.run(client_module.aclose_shared_client())
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_http_client(self):
+        """aclose() closes and drops the underlying AsyncClient."""
+        client = _make_client()
+        http_client = client._http_client
+
+        await client.aclose()
+
+        assert http_client.is_closed
+        assert client._http_client is None
+
+    @pytest.mark.asyncio
+    async def test_zone_batches_share_one_request(self):
+        """All zones in a batch are fetched with one GraphQL request per dataset."""
+        graphql_requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal graphql_requests
+            if request.url.path.endswith("/graphql"):
+                graphql_requests += 1
+            return _cloudflare_handler(request)
+
+        async with _make_client(handler, account_id="acct-1") as client:
+            data = await client.fetch_all()
+
+        assert graphql_requests == 2  # one WAF + one DNS
+        assert len(data.waf_events) == len(ZONES)
+        assert len(data.dns_analytics) == len(ZONES)
+
+    @pytest.mark.asyncio
+    async def test_graphql_responses_cached(self):
+        """Identical GraphQL queries within the TTL reuse the cached response."""
+        graphql_requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal graphql_requests
+            graphql_requests += 1
+            return _cloudflare_handler(request)
+
+        query = client_module._graphql_request_prefix(
+            "query { viewer { zones { zoneTag firewallEventsAdaptive { datetime } } } }"
+        )
+        variables = {"zoneTags": ["zone-a"]}
+
+        async with _make_client(handler) as client:
+            first = await client._graphql(query, variables)
+            second = await client._graphql(query, variables)
+            assert graphql_requests == 1
+            assert second == first
+
+            await client._graphql(query, {"zoneTags": ["zone-b"]})
+            assert graphql_requests == 2
+
+            await client._graphql(query, variables, ttl=0.0)
+            assert graphql_requests == 3
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with CloudflareClient(api_token="other_token", http_client=http_client) as other:
+            await other._graphql(query, variables)
+        assert graphql_requests == 4  # cache is per API token
+
+    @pytest.mark.asyncio
+    async def test_graphql_error_responses_not_cached(self):
+        """A 200 response carrying GraphQL errors is not replayed from cache."""
+        error_body = {"data": None, "errors": [{"message": "rate limited"}]}
+        responses = iter([httpx.Response(200, json=error_body)])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return next(responses, None) or _cloudflare_handler(request)
+
+        variables = {"zoneTags": ["z"]}
+        async with _make_client(handler) as client:
+            first = await client._graphql(client_module._WAF_REQUEST_PREFIX, variables)
+            second = await client._graphql(client_module._WAF_REQUEST_PREFIX, variables)
+
+        assert first["errors"]
+        assert "errors" not in second
+        assert second["data"]["viewer"]["zones"][0]["zoneTag"] == "z"
+
+    @pytest.mark.asyncio
+    async def test_graphql_retries_transient_status(self, monkeypatch):
+        """429/5xx gateway errors are retried with backoff before succeeding."""
+        monkeypatch.setattr(client_module, "GRAPHQL_RETRY_BASE_DELAY", 0)
+        statuses = iter([503, 429])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status = next(statuses, None)
+            if status is not None:
+                return httpx.Response(status)
+            return _cloudflare_handler(request)
+
+        async with _make_client(handler) as client:
+            data = await client._graphql(client_module._WAF_REQUEST_PREFIX, {"zoneTags": ["z"]})
+
+        assert data["data"]["viewer"]["zones"][0]["zoneTag"] == "z"
+
+    @pytest.mark.asyncio
+    async def test_graphql_does_not_retry_client_errors(self, monkeypatch):
+        """Non-transient errors such as 400 fail on the first attempt."""
+        monkeypatch.setattr(client_module, "GRAPHQL_RETRY_BASE_DELAY", 0)
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(400)
+
+        async with _make_client(handler) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._graphql(client_module._WAF_REQUEST_PREFIX, {})
+
+        assert attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_graphql_circuit_opens_after_repeated_failures(self, monkeypatch):
+        """Once the breaker opens, further GraphQL calls fail without a request."""
+        monkeypatch.setattr(client_module, "GRAPHQL_RETRY_BASE_DELAY", 0)
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(503)
+
+        async with _make_client(handler) as client:
+            for i in range(client_module.GRAPHQL_CIRCUIT_FAIL_MAX):
+                with pytest.raises((httpx.HTTPStatusError, pybreaker.CircuitBreakerError)):
+                    await client._graphql(client_module._WAF_REQUEST_PREFIX, {"i": i})
+            with pytest.raises(pybreaker.CircuitBreakerError):
+                await client._graphql(client_module._WAF_REQUEST_PREFIX, {"i": "next"})
+
+        assert attempts == client_module.GRAPHQL_CIRCUIT_FAIL_MAX * client_module.GRAPHQL_MAX_ATTEMPTS
+
+    @pytest.mark.parametrize("window, opens", [(60.0, True), (0.0, False)])
+    @pytest.mark.asyncio
+    async def test_graphql_circuit_counts_failures_within_window(
+        self, monkeypatch, window, opens
+    ):
+        """Failures interleaved with successes open the breaker only within the window."""
+        monkeypatch.setattr(client_module, "GRAPHQL_RETRY_BASE_DELAY", 0)
+        monkeypatch.setattr(client_module, "GRAPHQL_CIRCUIT_FAIL_WINDOW", window)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if b'"fail"' in request.content:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"data": {}})
+
+        async with _make_client(handler) as client:
+            for i in range(client_module.GRAPHQL_CIRCUIT_FAIL_MAX):
+                await client._graphql(client_module._WAF_REQUEST_PREFIX, {"ok": i})
+                with pytest.raises(httpx.HTTPStatusError):
+                    await client._graphql(client_module._WAF_REQUEST_PREFIX, {"fail": i})
+                time.sleep(0.001)  # keep failure timestamps distinct
+
+            if opens:
+                with pytest.raises(pybreaker.CircuitBreakerError):
+                    await client._graphql(client_module._WAF_REQUEST_PREFIX, {"ok": "next"})
+            else:
+                assert await client._graphql(
+                    client_module._WAF_REQUEST_PREFIX, {"ok": "next"}
+                ) == {"data": {}}
+
+    @pytest.mark.asyncio
+    async def test_graphql_circuit_ignores_client_errors(self):
+        """Non-retryable statuses such as 401 never open the breaker."""
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(401)
+
+        async with _make_client(handler) as client:
+            for i in range(client_module.GRAPHQL_CIRCUIT_FAIL_MAX + 1):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await client._graphql(client_module._WAF_REQUEST_PREFIX, {"i": i})
+
+        assert attempts == client_module.GRAPHQL_CIRCUIT_FAIL_MAX + 1
+
+    @pytest.mark.asyncio
+    async def test_graphql_circuit_is_per_token(self, monkeypatch):
+        """An open circuit for one API token does not block another token."""
+        monkeypatch.setattr(client_module, "GRAPHQL_RETRY_BASE_DELAY", 0)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers["Authorization"] == "Bearer bad_token":
+                return httpx.Response(503)
+            return httpx.Response(200, json={"data": {}})
+
+        async with _make_client(handler, api_token="bad_token") as bad:
+            for i in range(client_module.GRAPHQL_CIRCUIT_FAIL_MAX):
+                with pytest.raises((httpx.HTTPStatusError, pybreaker.CircuitBreakerError)):
+                    await bad._graphql(client_module._WAF_REQUEST_PREFIX, {"i": i})
+            with pytest.raises(pybreaker.CircuitBreakerError):
+                await bad._graphql(client_module._WAF_REQUEST_PREFIX, {"i": "next"})
+
+        async with _make_client(handler) as good:
+            assert await good._graphql(client_module._WAF_REQUEST_PREFIX, {}) == {"data": {}}
+
+    @pytest.mark.asyncio
+    async def test_zone_failure_is_isolated(self, monkeypatch):
+        """A failing GraphQL call for one batch does not drop the others."""
+        monkeypatch.setattr(client_module, "ZONE_BATCH_SIZE", 1)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/graphql") and b"zone-a" in request.content:
+                return httpx.Response(500)
+            return _cloudflare_handler(request)
+
+        async with _make_client(handler, account_id="acct-1") as client:
+            data = await client.fetch_all()
+
+        assert len(data.waf_events) == 1
+        assert [d.zone_name for d in data.dns_analytics] == ["b.example.com"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_isolates_subtask_failures(self):
+        """A failing tunnel fetch is reported without losing WAF/DNS data."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/cfd_tunnel"):
+                return httpx.Response(403)
+            return _cloudflare_handler(request)
+
+        async with _make_client(handler, account_id="acct-1") as client:
+            data = await client.fetch_all()
+
+        assert data.has_waf_events
+        assert data.has_dns_analytics
+        assert data.tunnel_statuses == []
+        assert len(data.errors) == 1
+        assert data.errors[0].startswith("Failed to fetch tunnel status")
+
+    @pytest.mark.asyncio
+    async def test_zones_failure_recorded_once(self):
+        """A failing zones request is made once and skips the zone-based fetches."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if request.url.path.endswith("/zones"):
+                return httpx.Response(500)
+            return _cloudflare_handler(request)
+
+        async with _make_client(handler, account_id="acct-1") as client:
+            data = await client.fetch_all()
+
+        assert sum(path.endswith("/zones") for path in requests) == 1
+        assert not any(path.endswith("/graphql") for path in requests)
+        assert len(data.errors) == 1
+        assert data.errors[0].startswith("Failed to fetch zones")
+        assert data.has_tunnel_statuses
+
+    @pytest.mark.asyncio
+    async def test_zones_cached_across_clients(self, monkeypatch):
+        """A second client with the same token reuses zones until the TTL expires."""
+        zone_requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal zone_requests
+            if request.url.path.endswith("/zones"):
+                zone_requests += 1
+            return _cloudflare_handler(request)
+
+        for _ in range(2):
+            async with _make_client(handler) as client:
+                assert await client._get_zones() == ZONES
+        assert zone_requests == 1
+
+        monkeypatch.setattr(client_module, "ZONES_CACHE_TTL", 0.0)
+        async with _make_client(handler) as client:
+            await client._get_zones()
+        assert zone_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_zone_queries_run_concurrently(self, monkeypatch):
+        """GraphQL queries for separate zone batches are in flight at the same time."""
+        monkeypatch.setattr(client_module, "ZONE_BATCH_SIZE", 1)
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _cloudflare_handler(request)
+
+        async with _make_client(handler, account_id="acct-1") as client:
+            await client._get_zones()
+            await client._fetch_waf_events(*WINDOW)
+
+        assert peak == len(ZONES)
 
 
 # ============================================================================
@@ -1,5 +1,8 @@
 """Tests for log collectors."""
 
+import threading
+from datetime import datetime, timezone
+from typing import Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,7 +15,8 @@ from unifi_scanner.logs import (
     LogCollector,
     SSHCollectionError,
 )
-from unifi_scanner.models import DeviceType
+from unifi_scanner.models import DeviceType, LogEntry
+from unifi_scanner.models.enums import LogSource
 
 
 class TestAPILogCollector:
@@ -70,6 +74,8 @@ class TestAPILogCollector:
         """Should raise APICollectionError on API failure."""
         mock_client = MagicMock()
         mock_client.get_events.side_effect = Exception("API failed")
+        mock_client.get_alarms.side_effect = Exception("API failed")
+        mock_client.get_ips_events.side_effect = Exception("API failed")
 
         collector = APILogCollector(client=mock_client, site="default")
 
@@ -78,6 +84,80 @@ class TestAPILogCollector:
 
         assert "API collection failed" in str(exc_info.value)
 
+    def test_collect_returns_partial_results_on_single_failure(self) -> None:
+        """A failing fetch is skipped while the others are still returned."""
+        mock_client = MagicMock()
+        mock_client.get_events.return_value = [
+            {"time": 1705084800000, "key": "EVT_TEST", "msg": "Test event"},
+        ]
+        mock_client.get_alarms.return_value = [
+            {"time": 1705084801000, "key": "ALM_TEST", "msg": "Test alarm"},
+        ]
+        mock_client.get_ips_events.side_effect = Exception("IPS endpoint missing")
+
+        collector = APILogCollector(client=mock_client, site="default")
+        entries = collector.collect()
+
+        assert [e.message for e in entries] == ["Test event", "Test alarm"]
+        assert collector.raw_ips_events == []
+
+    def test_collect_fetches_concurrently(self) -> None:
+        """Events, alarms and IPS events are requested in parallel."""
+        # Each fetch waits for the other two; a serial collector would time out
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(result: list) -> list:
+            barrier.wait()
+            return result
+
+        mock_client = MagicMock()
+        mock_client.get_events.side_effect = lambda **kw: fetch(
+            [{"time": 1705084800000, "key": "EVT_TEST", "msg": "Test event"}]
+        )
+        mock_client.get_alarms.side_effect = lambda **kw: fetch(
+            [{"time": 1705084801000, "key": "ALM_TEST", "msg": "Test alarm"}]
+        )
+        mock_client.get_ips_events.side_effect = lambda **kw: fetch([])
+
+        collector = APILogCollector(client=mock_client, site="default")
+        entries = collector.collect()
+
+        assert [e.message for e in entries] == ["Test event", "Test alarm"]
+
+    def test_collect_filters_by_since_with_skew(self) -> None:
+        """Entries older than since_timestamp minus 5 minutes are dropped."""
+        mock_client = MagicMock()
+        mock_client.get_events.return_value = [
+            {"time": 1705085900000, "key": "EVT_SKEW", "msg": "Within skew"},  # since - 100s
+            {"time": 1705085000000, "key": "EVT_OLD", "msg": "Too old"},  # since - 600s
+        ]
+        mock_client.get_alarms.return_value = []
+        mock_client.get_ips_events.return_value = []
+        since = datetime(2024, 1, 12, 19, 0, 0, tzinfo=timezone.utc)
+
+        collector = APILogCollector(client=mock_client, site="default", since_timestamp=since)
+        entries = collector.collect()
+
+        assert [e.event_type for e in entries] == ["EVT_SKEW"]
+
+    def test_collect_narrows_window_to_since(self) -> None:
+        """A recent since_timestamp shrinks the requested history window."""
+        mock_client = MagicMock()
+        mock_client.get_events.return_value = []
+        mock_client.get_alarms.return_value = []
+        mock_client.get_ips_events.return_value = []
+        since = datetime(2024, 1, 12, 19, 0, 0, tzinfo=timezone.utc)
+        now_ns = int(since.timestamp() + 90 * 60) * 1_000_000_000  # since + 90 minutes
+
+        collector = APILogCollector(client=mock_client, site="default", since_timestamp=since)
+        with patch("unifi_scanner.logs.api_collector.time.time_ns", return_value=now_ns):
+            collector.collect()
+
+        assert mock_client.get_events.call_args.kwargs["history_hours"] == 2
+        ips_kwargs = mock_client.get_ips_events.call_args.kwargs
+        assert ips_kwargs["start"] == 1705085700000  # since - 5 minutes
+        assert ips_kwargs["end"] == now_ns // 1_000_000
+
 
 class TestLogCollector:
     """Tests for LogCollector with fallback logic."""
@@ -149,6 +229,8 @@ class TestLogCollector:
         mock_client = MagicMock()
         mock_client.device_type = DeviceType.UDM_PRO
         mock_client.get_events.side_effect = Exception("API broken")
+        mock_client.get_alarms.side_effect = Exception("API broken")
+        mock_client.get_ips_events.side_effect = Exception("API broken")
 
         settings = self._create_settings()
         collector = LogCollector(
@@ -169,6 +251,8 @@ class TestLogCollector:
         mock_client = MagicMock()
         mock_client.device_type = DeviceType.UDM_PRO
         mock_client.get_events.side_effect = Exception("API broken")
+        mock_client.get_alarms.side_effect = Exception("API broken")
+        mock_client.get_ips_events.side_effect = Exception("API broken")
 
         settings = self._create_settings(ssh_enabled=False)
         collector = LogCollector(
@@ -187,6 +271,8 @@ class TestLogCollector:
         mock_client = MagicMock()
         mock_client.device_type = DeviceType.UDM_PRO
         mock_client.get_events.side_effect = Exception("API broken")
+        mock_client.get_alarms.side_effect = Exception("API broken")
+        mock_client.get_ips_events.side_effect = Exception("API broken")
 
         settings = self._create_settings()
         collector = LogCollector(
@@ -361,3 +447,60 @@ class TestLogCollector:
         # Both should have ws_manager as None
         assert collector_default._ws_manager is None
         assert collector_explicit._ws_manager is None
+
+
+class TestMergeEvents:
+    """Tests for LogCollector._merge_events deduplication."""
+
+    def _collector(self) -> LogCollector:
+        mock_client = MagicMock()
+        mock_client.device_type = DeviceType.UDM_PRO
+        return LogCollector(
+            client=mock_client,
+            settings=UnifiSettings(host="192.168.1.1", username="admin", ssh_enabled=False),
+            site="default",
+        )
+
+    def _entry(
+        self,
+        time_ms: int,
+        msg: str,
+        source: LogSource = LogSource.API,
+        source_id: Optional[str] = None,
+    ) -> LogEntry:
+        return LogEntry(
+            timestamp=time_ms,
+            source=source,
+            event_type="EVT_TEST",
+            message=msg,
+            source_id=source_id,
+        )
+
+    def test_duplicates_keep_first_source(self) -> None:
+        """Entries sharing timestamp+message are kept once, preferring events_a."""
+        ws = [self._entry(1705084800000, "a", LogSource.WEBSOCKET)]
+        api = [self._entry(1705084800000, "a"), self._entry(1705084801000, "b")]
+
+        merged = self._collector()._merge_events(ws, api)
+
+        assert [(e.message, e.source) for e in merged] == [
+            ("a", LogSource.WEBSOCKET),
+            ("b", LogSource.API),
+        ]
+
+    def test_same_source_id_deduplicated_across_formats(self) -> None:
+        """Entries with the same controller _id merge even if their text differs."""
+        ws = [self._entry(1705084800000, "Client roamed", LogSource.WEBSOCKET, "abc123")]
+        api = [self._entry(1705084800500, "User[aa:bb] roamed from AP1", source_id="abc123")]
+
+        merged = self._collector()._merge_events(ws, api)
+
+        assert [e.source for e in merged] == [LogSource.WEBSOCKET]
+
+    def test_empty_side_returns_other(self) -> None:
+        """Merging with an empty list returns the other list's entries."""
+        api = [self._entry(1705084800000, "a")]
+        collector = self._collector()
+
+        assert collector._merge_events([], api) == api
+        assert collector._merge_events(api, []) == api
@@ -0,0 +1,239 @@
+"""Tests for configuration loading."""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from unifi_scanner.config import UnifiSettings
+from unifi_scanner.config.loader import (
+    ConfigurationError,
+    format_validation_errors,
+    get_config,
+    load_config,
+    load_yaml_config,
+    load_yaml_config_async,
+    resolve_file_secrets,
+)
+
+
+class TestLoadYamlConfig:
+    """Tests for load_yaml_config()."""
+
+    def test_no_path_returns_empty(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No config path and no CONFIG_PATH returns empty dict."""
+        monkeypatch.delenv("CONFIG_PATH", raising=False)
+
+        assert load_yaml_config() == {}
+
+    def test_parses_mapping(self, tmp_path: Path) -> None:
+        """YAML mapping is returned as a dict."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("host: 192.168.1.1\nport: 8443\n")
+
+        result = load_yaml_config(str(config_file))
+
+        assert result == {"host": "192.168.1.1", "port": 8443}
+
+    def test_non_mapping_returns_empty(self, tmp_path: Path) -> None:
+        """YAML that is not a mapping yields an empty dict."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("- just\n- a list\n")
+
+        assert load_yaml_config(str(config_file)) == {}
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """Missing file raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="not found"):
+            load_yaml_config(str(tmp_path / "missing.yaml"))
+
+    def test_invalid_yaml_raises(self, tmp_path: Path) -> None:
+        """Malformed YAML raises ConfigurationError."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("host: [unclosed\n")
+
+        with pytest.raises(ConfigurationError, match="Invalid YAML"):
+            load_yaml_config(str(config_file))
+
+    def test_cached_result_is_a_copy(self, tmp_path: Path) -> None:
+        """Mutating a returned dict does not affect later loads."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("host: 192.168.1.1\n")
+
+        first = load_yaml_config(str(config_file))
+        first["host"] = "mutated"
+
+        assert load_yaml_config(str(config_file)) == {"host": "192.168.1.1"}
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path) -> None:
+        """A modified file is re-read instead of served from cache."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("host: 192.168.1.1\n")
+        assert load_yaml_config(str(config_file)) == {"host": "192.168.1.1"}
+
+        config_file.write_text("host: 10.0.0.254\nport: 8443\n")
+
+        assert load_yaml_config(str(config_file)) == {"host": "10.0.0.254", "port": 8443}
+
+
+class TestLoadYamlConfigAsync:
+    """Tests for load_yaml_config_async()."""
+
+    async def test_parses_mapping(self, tmp_path: Path) -> None:
+        """Async loader returns the same data as the sync loader."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("host: 192.168.1.1\n")
+
+        result = await load_yaml_config_async(str(config_file))
+
+        assert result == {"host": "192.168.1.1"}
+
+    async def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """Errors from the executor propagate to the caller."""
+        with pytest.raises(ConfigurationError, match="not found"):
+            await load_yaml_config_async(str(tmp_path / "missing.yaml"))
+
+
+class TestResolveFileSecrets:
+    """Tests for resolve_file_secrets()."""
+
+    def test_reads_matching_secret_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """UNIFI_*_FILE variables resolve to stripped file contents."""
+        secret_file = tmp_path / "password"
+        secret_file.write_text("hunter2\n")
+        monkeypatch.setenv("UNIFI_PASSWORD_FILE", str(secret_file))
+        monkeypatch.setenv("OTHER_PASSWORD_FILE", str(secret_file))
+
+        secrets = resolve_file_secrets()
+
+        assert secrets["PASSWORD"] == "hunter2"
+        assert "OTHER_PASSWORD" not in secrets
+
+    def test_missing_secret_file_is_skipped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A _FILE variable pointing at a missing file is ignored."""
+        monkeypatch.setenv("UNIFI_SMTP_PASSWORD_FILE", str(tmp_path / "missing"))
+
+        assert "SMTP_PASSWORD" not in resolve_file_secrets()
+
+
+class TestFormatValidationErrors:
+    """Tests for format_validation_errors()."""
+
+    def test_missing_field_gets_hint(self) -> None:
+        """Missing required fields point at the env var and config key."""
+        messages = format_validation_errors(
+            [{"type": "missing", "loc": ("host",), "msg": "Field required", "input": {}}]
+        )
+
+        assert messages == [
+            "Configuration error: 'host' is required. "
+            "Set UNIFI_HOST environment variable or add 'host:' to config file."
+        ]
+
+    def test_invalid_value_includes_input(self) -> None:
+        """Other field errors include the rejected input."""
+        messages = format_validation_errors(
+            [
+                {
+                    "type": "greater_than",
+                    "loc": ("poll_interval",),
+                    "msg": "Input should be greater than 0",
+                    "input": -1,
+                }
+            ]
+        )
+
+        assert messages == [
+            "Configuration error: 'poll_interval' Input should be greater than 0, got: -1"
+        ]
+
+    def test_model_level_error_uses_message(self) -> None:
+        """Errors without a location use the validator message directly."""
+        messages = format_validation_errors(
+            [{"type": "value_error", "loc": (), "msg": "smtp_host is required"}]
+        )
+
+        assert messages == ["Configuration error: smtp_host is required"]
+
+
+class TestLoadConfig:
+    """Tests for load_config()."""
+
+    def test_loads_values_from_yaml(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Settings are populated from the YAML file at CONFIG_PATH."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("host: 10.0.0.1\nusername: admin\npoll_interval: 60\n")
+        monkeypatch.setenv("CONFIG_PATH", str(config_file))
+
+        config = load_config()
+
+        assert config.host == "10.0.0.1"
+        assert config.username == "admin"
+        assert config.poll_interval == 60
+        assert get_config() is config
+
+    def test_reload_picks_up_yaml_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second load sees edits to the YAML file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("host: 10.0.0.1\nusername: admin\n")
+        monkeypatch.setenv("CONFIG_PATH", str(config_file))
+        assert load_config().host == "10.0.0.1"
+
+        config_file.write_text("host: 10.0.0.254\nusername: admin\n")
+
+        assert load_config().host == "10.0.0.254"
+
+    def test_missing_yaml_raises(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A CONFIG_PATH pointing at a missing file raises ConfigurationError."""
+        monkeypatch.setenv("CONFIG_PATH", str(tmp_path / "missing.yaml"))
+
+        with pytest.raises(ConfigurationError, match="not found"):
+            load_config()
+
+
+class TestUnifiSettings:
+    """Tests for UnifiSettings validators and helpers."""
+
+    def _settings(self, **kwargs: object) -> UnifiSettings:
+        return UnifiSettings(host="192.168.1.1", username="admin", **kwargs)
+
+    def test_email_recipients_parsed(self) -> None:
+        """Comma-separated recipients are split and trimmed."""
+        settings = self._settings(email_recipients=" a@example.com ,b@example.com,, c@example.com ")
+
+        assert settings.get_email_recipients() == [
+            "a@example.com",
+            "b@example.com",
+            "c@example.com",
+        ]
+
+    def test_email_recipients_empty(self) -> None:
+        """Blank recipients string yields an empty list."""
+        assert self._settings(email_recipients="  ").get_email_recipients() == []
+
+    def test_log_level_normalized(self) -> None:
+        """Log level is upper-cased and WARN maps to WARNING."""
+        assert self._settings(log_level="warn").log_level == "WARNING"
+        assert self._settings(log_level="debug").log_level == "DEBUG"
+
+    def test_host_and_username_stripped(self) -> None:
+        """Surrounding whitespace is removed; blank values are rejected."""
+        settings = UnifiSettings(host=" 192.168.1.1 ", username=" admin\n")
+
+        assert settings.host == "192.168.1.1"
+        assert settings.username == "admin"
+        with pytest.raises(ValidationError, match="Host cannot be empty"):
+            UnifiSettings(host="   ", username="admin")
+
+    def test_invalid_schedule_preset_rejected(self) -> None:
+        """Unknown schedule presets fail validation."""
+        with pytest.raises(ValidationError, match="Invalid schedule preset"):
+            self._settings(schedule_preset="hourly")
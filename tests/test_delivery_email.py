@@ -107,7 +107,7 @@ class TestEmailDeliverySend:
         mock_smtp.assert_called_once()
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with("user", "pass")
-        mock_server.sendmail.assert_called_once()
+        mock_server.send_message.assert_called_once()
 
     @patch("unifi_scanner.delivery.email.smtplib.SMTP_SSL")
     def test_send_implicit_tls(self, mock_smtp_ssl: MagicMock) -> None:
@@ -132,7 +132,7 @@ class TestEmailDeliverySend:
         )
 
         mock_smtp_ssl.assert_called_once()
-        mock_server.sendmail.assert_called_once()
+        mock_server.send_message.assert_called_once()
 
     def test_send_no_recipients_skipped(self) -> None:
         """Empty recipient list skips sending."""
@@ -162,15 +162,48 @@ class TestEmailDeliverySend:
             text_content="Test",
         )
 
-        # Get the message string passed to sendmail
-        call_args = mock_server.sendmail.call_args
-        msg_string = call_args[0][2]  # Third argument is message string
+        # Get the message passed to send_message
+        call_args = mock_server.send_message.call_args
+        msg_string = call_args[0][0].as_string()
+        assert call_args[1]["to_addrs"] == ["secret@example.com", "hidden@example.com"]
+
+        # Date header is a valid RFC 2822 date
+        assert call_args[0][0]["Date"].datetime.tzinfo is not None
 
         # Verify Bcc header is NOT present
         assert "Bcc:" not in msg_string
         assert "secret@example.com" not in msg_string
         assert "hidden@example.com" not in msg_string
 
+    @patch("unifi_scanner.delivery.email.smtplib.SMTP")
+    def test_session_reuses_connection(self, mock_smtp: MagicMock) -> None:
+        """Multiple sends within one session share a single login."""
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__ = MagicMock(return_value=mock_server)
+        mock_smtp.return_value.__exit__ = MagicMock(return_value=False)
+
+        delivery = EmailDelivery(
+            smtp_host="smtp.test.com",
+            smtp_port=587,
+            smtp_user="user",
+            smtp_password="pass",
+            use_tls=True,
+        )
+
+        with delivery.session() as server:
+            for recipient in ["a@example.com", "b@example.com"]:
+                delivery.send(
+                    recipients=[recipient],
+                    subject="Test",
+                    html_content="<p>Test</p>",
+                    text_content="Test",
+                    server=server,
+                )
+
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once_with("user", "pass")
+        assert mock_server.send_message.call_count == 2
+
 
 class TestEmailDeliveryDeliver:
     """Test high-level deliver_report method."""
@@ -202,7 +235,7 @@ class TestEmailDeliveryDeliver:
         import smtplib
 
         mock_server = MagicMock()
-        mock_server.sendmail.side_effect = smtplib.SMTPException("Connection failed")
+        mock_server.send_message.side_effect = smtplib.SMTPException("Connection failed")
         mock_smtp.return_value.__enter__ = MagicMock(return_value=mock_server)
         mock_smtp.return_value.__exit__ = MagicMock(return_value=False)
 
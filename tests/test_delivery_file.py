@@ -227,6 +227,29 @@ class TestFileDeliveryCleanup:
         assert not old_html.exists()
         assert not old_txt.exists()
 
+    def test_cleanup_ignores_unrelated_files(self, temp_output_dir: Path) -> None:
+        """Cleanup only touches unifi-report-*.html/.txt files."""
+        delivery = FileDelivery(
+            output_dir=str(temp_output_dir),
+            retention_days=7,
+        )
+
+        old_mtime = datetime.now().timestamp() - (10 * 24 * 60 * 60)
+        unrelated = [
+            temp_output_dir / "notes.txt",
+            temp_output_dir / "unifi-report-2026-01-14-0800.json",
+        ]
+        for path in unrelated:
+            path.write_text("keep")
+            os.utime(path, (old_mtime, old_mtime))
+        (temp_output_dir / "unifi-report-archive.html").mkdir()
+
+        deleted = delivery.cleanup_old_reports()
+
+        assert deleted == 0
+        assert all(path.exists() for path in unrelated)
+        assert (temp_output_dir / "unifi-report-archive.html").is_dir()
+
 
 class TestFileDeliveryDeliver:
     """Test high-level deliver_report method."""
@@ -0,0 +1,70 @@
+"""Tests for delivery orchestration."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from unifi_scanner.delivery import DeliveryManager, EmailDelivery, EmailDeliveryError
+from unifi_scanner.models.enums import DeviceType
+from unifi_scanner.models.report import Report
+
+
+@pytest.fixture
+def sample_report() -> Report:
+    """Create sample report for testing."""
+    return Report(
+        id=uuid4(),
+        generated_at=datetime(2026, 1, 24, 14, 30, tzinfo=timezone.utc),
+        period_start=datetime(2026, 1, 23, 14, 30, tzinfo=timezone.utc),
+        period_end=datetime(2026, 1, 24, 14, 30, tzinfo=timezone.utc),
+        site_name="default",
+        controller_type=DeviceType.UDM_PRO,
+        findings=[],
+        log_entry_count=100,
+    )
+
+
+def _failing_email() -> MagicMock:
+    email = MagicMock(spec=EmailDelivery)
+    email.build_subject.return_value = "UniFi Report"
+    email.send.side_effect = EmailDeliveryError("SMTP down")
+    return email
+
+
+class TestDeliveryManager:
+    """Tests for DeliveryManager.deliver()."""
+
+    def test_no_channels_returns_false(self, sample_report: Report) -> None:
+        """Nothing configured means nothing delivered."""
+        manager = DeliveryManager()
+
+        assert manager.deliver(sample_report, "<p>r</p>", "r", ["a@example.com"]) is False
+
+    def test_email_failure_falls_back_to_file(
+        self, sample_report: Report, tmp_path: Path
+    ) -> None:
+        """Email failure saves the report to the fallback directory."""
+        manager = DeliveryManager(email_delivery=_failing_email(), fallback_dir=str(tmp_path))
+
+        result = manager.deliver(sample_report, "<p>r</p>", "r", ["a@example.com"])
+
+        assert result is True
+        assert sorted(p.suffix for p in tmp_path.iterdir()) == [".html", ".txt"]
+        # Fallback is not promoted to a configured channel
+        assert manager.file_delivery is None
+
+    def test_fallback_file_delivery_is_reused(
+        self, sample_report: Report, tmp_path: Path
+    ) -> None:
+        """Repeated email failures reuse one fallback FileDelivery."""
+        manager = DeliveryManager(email_delivery=_failing_email(), fallback_dir=str(tmp_path))
+
+        manager.deliver(sample_report, "<p>r</p>", "r", ["a@example.com"])
+        first = manager._fallback_file_delivery
+        manager.deliver(sample_report, "<p>r</p>", "r", ["a@example.com"])
+
+        assert first is not None
+        assert manager._fallback_file_delivery is first
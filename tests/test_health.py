@@ -0,0 +1,102 @@
+"""Tests for file-based health status."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from unifi_scanner import health
+from unifi_scanner.health import (
+    HealthStatus,
+    clear_health_status,
+    get_health_status,
+    update_health_status,
+)
+
+
+@pytest.fixture
+def health_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point HEALTH_FILE at a temporary path."""
+    path = tmp_path / "unifi-scanner-health"
+    monkeypatch.setattr(health, "HEALTH_FILE", path)
+    return path
+
+
+class TestUpdateHealthStatus:
+    """Tests for update_health_status()."""
+
+    def test_writes_status_and_details(self, health_file: Path) -> None:
+        """Status, timestamp, and details are written as JSON."""
+        update_health_status(HealthStatus.HEALTHY, {"site": "default"})
+
+        data = json.loads(health_file.read_text())
+        assert data["status"] == "healthy"
+        assert data["details"] == {"site": "default"}
+        assert data["timestamp"].endswith("+00:00")
+
+    def test_no_details_writes_empty_dict(self, health_file: Path) -> None:
+        """Missing details are written as an empty object."""
+        update_health_status(HealthStatus.STARTING)
+
+        assert json.loads(health_file.read_text())["details"] == {}
+
+    @pytest.mark.parametrize("status", list(HealthStatus))
+    def test_no_details_payload_matches_full_encoding(
+        self, health_file: Path, status: HealthStatus
+    ) -> None:
+        """The pre-rendered fast path produces the same JSON shape."""
+        update_health_status(status)
+        fast = json.loads(health_file.read_text())
+
+        update_health_status(status, {"k": "v"})
+        full = json.loads(health_file.read_text())
+
+        assert fast.keys() == full.keys()
+        assert fast["status"] == full["status"] == status.value
+        assert datetime.fromisoformat(fast["timestamp"]).tzinfo is not None
+
+    def test_overwrite_leaves_no_temp_files(self, health_file: Path) -> None:
+        """Repeated updates replace the file without leaving temp files."""
+        update_health_status(HealthStatus.STARTING)
+        update_health_status(HealthStatus.UNHEALTHY, {"error": "boom"})
+
+        assert [p.name for p in health_file.parent.iterdir()] == [health_file.name]
+        assert get_health_status()["status"] == "unhealthy"
+
+    def test_failed_replace_removes_temp_file(
+        self, health_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed rename cleans up the temp file and re-raises."""
+
+        def fail_replace(src: object, dst: object) -> None:
+            raise OSError("rename failed")
+
+        monkeypatch.setattr(health.os, "replace", fail_replace)
+
+        with pytest.raises(OSError, match="rename failed"):
+            update_health_status(HealthStatus.HEALTHY)
+
+        assert list(health_file.parent.iterdir()) == []
+
+
+class TestGetHealthStatus:
+    """Tests for get_health_status() and clear_health_status()."""
+
+    def test_missing_file_returns_none(self, health_file: Path) -> None:
+        """No health file means no status."""
+        assert get_health_status() is None
+
+    def test_corrupt_file_returns_none(self, health_file: Path) -> None:
+        """Unparseable content is treated as no status."""
+        health_file.write_text("{not json")
+
+        assert get_health_status() is None
+
+    def test_clear_removes_file(self, health_file: Path) -> None:
+        """clear_health_status() deletes the file and tolerates absence."""
+        update_health_status(HealthStatus.HEALTHY)
+        clear_health_status()
+        clear_health_status()
+
+        assert not health_file.exists()
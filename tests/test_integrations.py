@@ -4,6 +4,8 @@ Tests the Protocol contract, IntegrationRegistry filtering, and IntegrationRunne
 isolation/circuit breaker behavior (INTG-01, INTG-02, INTG-03 requirements).
 """
 
+import sys
+
 import pytest
 from typing import Any, Dict, Optional
 from unittest.mock import MagicMock
@@ -208,6 +210,15 @@ class TestIntegrationSection:
         assert section.data is None
         assert section.error_message is None
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True needs Python 3.10+")
+    def test_result_types_are_slotted(self):
+        """Result dataclasses carry no per-instance __dict__."""
+        section = IntegrationSection(name="test", display_name="Test", success=True)
+
+        assert not hasattr(section, "__dict__")
+        assert not hasattr(IntegrationResult(name="test", success=True), "__dict__")
+        assert not hasattr(IntegrationResults(sections=[section]), "__dict__")
+
 
 class TestIntegrationResults:
     """Tests for IntegrationResults aggregate dataclass."""
@@ -270,6 +281,26 @@ class TestIntegrationResults:
 
         assert found is None
 
+    def test_integration_results_add_indexes_section(self):
+        """add() appends the section and makes it available to get_section."""
+        results = IntegrationResults()
+        section = IntegrationSection(name="a", display_name="A", success=True)
+
+        results.add(section)
+
+        assert results.sections == [section]
+        assert results.get_section("a") is section
+
+    def test_integration_results_add_updates_has_data(self):
+        """has_data flips once a successful section with data is added."""
+        results = IntegrationResults()
+        results.add(IntegrationSection(name="a", display_name="A", success=False))
+        assert results.has_data is False
+
+        results.add(IntegrationSection(name="b", display_name="B", success=True, data={"k": 1}))
+
+        assert results.has_data is True
+
     def test_integration_results_default_empty(self):
         """IntegrationResults defaults to empty sections list."""
         results = IntegrationResults()
@@ -369,6 +400,48 @@ class TestIntegrationRegistry:
         assert len(result) == 1
         assert result[0].name == "configured_test"
 
+    def test_registry_reuses_instances_per_settings(self, mock_settings):
+        """Repeat calls with the same settings reuse the instance; new settings do not."""
+        IntegrationRegistry.register(ConfiguredIntegration)
+
+        first = IntegrationRegistry.get_configured(mock_settings)[0]
+
+        assert IntegrationRegistry.get_configured(mock_settings)[0] is first
+        assert IntegrationRegistry.get_all(mock_settings)[0] is first
+        assert IntegrationRegistry.get_configured(MagicMock())[0] is not first
+
+    @pytest.mark.asyncio
+    async def test_registry_releases_instances_for_replaced_settings(self, mock_settings):
+        """New settings replace the cache and aclose_stale() closes the old instances."""
+
+        class ClosableIntegration(ConfiguredIntegration):
+            closed = 0
+
+            async def aclose(self) -> None:
+                type(self).closed += 1
+
+        IntegrationRegistry.register(ClosableIntegration)
+        IntegrationRegistry.get_configured(mock_settings)
+        IntegrationRegistry.get_configured(MagicMock())
+
+        assert len(IntegrationRegistry._instance_cache) == 1
+        assert ClosableIntegration.closed == 0
+
+        await IntegrationRegistry.aclose_stale()
+        await IntegrationRegistry.aclose_stale()
+
+        assert ClosableIntegration.closed == 1
+
+    def test_registry_clear_drops_cached_instances(self, mock_settings):
+        """clear() invalidates the instance cache."""
+        IntegrationRegistry.register(ConfiguredIntegration)
+        first = IntegrationRegistry.get_configured(mock_settings)[0]
+
+        IntegrationRegistry.clear()
+        IntegrationRegistry.register(ConfiguredIntegration)
+
+        assert IntegrationRegistry.get_configured(mock_settings)[0] is not first
+
 
 # =============================================================================
 # IntegrationRunner Tests (INTG-02, INTG-03)
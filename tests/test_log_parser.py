@@ -2,6 +2,7 @@
 
 import json
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 
@@ -61,6 +62,12 @@ class TestLogParserApiEvents:
         entries = self.parser.parse_api_events([])
         assert entries == []
 
+    def test_source_id_from_controller_id(self) -> None:
+        """The controller _id is kept as source_id for deduplication."""
+        events = [{"_id": "abc123", "time": 1705084800000, "key": "EVT_TEST", "msg": "Test"}]
+        entries = self.parser.parse_api_events(events)
+        assert entries[0].source_id == "abc123"
+
     def test_source_is_api(self) -> None:
         """All parsed events have API source."""
         events = [{"time": 1705084800000, "key": "EVT_TEST", "msg": "Test"}]
@@ -68,6 +75,84 @@ class TestLogParserApiEvents:
         assert entries[0].source == LogSource.API
 
 
+class TestLogParserSince:
+    """Tests for the since cutoff in parse_api_events."""
+
+    def test_events_at_or_before_cutoff_dropped(self) -> None:
+        """Only events strictly after since are returned."""
+        parser = LogParser()
+        since = datetime(2024, 1, 12, 19, 0, 0, tzinfo=timezone.utc)  # 1705086000
+        events = [
+            {"time": 1705085000000, "key": "EVT_OLD", "msg": "Old"},
+            {"time": 1705086000000, "key": "EVT_EDGE", "msg": "At cutoff"},
+            {"time": 1705087000000, "key": "EVT_NEW", "msg": "New"},
+            {"datetime": "2024-01-12T18:00:00Z", "key": "EVT_OLD_ISO", "msg": "Old ISO"},
+            {"datetime": "2024-01-12T20:00:00Z", "key": "EVT_NEW_ISO", "msg": "New ISO"},
+        ]
+
+        entries = parser.parse_api_events(events, since=since)
+
+        assert [e.event_type for e in entries] == ["EVT_NEW", "EVT_NEW_ISO"]
+
+    def test_old_events_skip_entry_construction(self) -> None:
+        """Events rejected by the numeric time check never build a LogEntry."""
+        parser = LogParser()
+        since = datetime(2024, 1, 12, 19, 0, 0, tzinfo=timezone.utc)
+
+        with patch.object(LogEntry, "from_unifi_event") as from_event:
+            entries = parser.parse_api_events(
+                [{"time": 1705085000000, "key": "EVT_OLD", "msg": "Old"}], since=since
+            )
+
+        assert entries == []
+        from_event.assert_not_called()
+
+
+class TestLogParserCache:
+    """Tests for the optional parsed-event cache."""
+
+    def _event(self, **overrides: object) -> dict:
+        event = {"_id": "abc123", "time": 1705084800000, "key": "EVT_TEST", "msg": "Test"}
+        event.update(overrides)
+        return event
+
+    def test_repeated_event_reuses_entry(self) -> None:
+        """An unchanged event with the same _id returns the cached entry."""
+        parser = LogParser(cache_size=10)
+
+        first = parser.parse_api_events([self._event()])[0]
+        second = parser.parse_api_events([self._event()])[0]
+
+        assert second is first
+
+    def test_changed_event_is_reparsed(self) -> None:
+        """A cached _id whose raw data changed is parsed again."""
+        parser = LogParser(cache_size=10)
+
+        first = parser.parse_api_events([self._event()])[0]
+        second = parser.parse_api_events([self._event(msg="Updated")])[0]
+
+        assert second is not first
+        assert second.message == "Updated"
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """The cache holds at most cache_size entries."""
+        parser = LogParser(cache_size=1)
+
+        first = parser.parse_api_events([self._event()])[0]
+        parser.parse_api_events([self._event(_id="other")])
+
+        assert parser.parse_api_events([self._event()])[0] is not first
+
+    def test_cache_disabled_by_default(self) -> None:
+        """Without cache_size every call builds new entries."""
+        parser = LogParser()
+
+        first = parser.parse_api_events([self._event()])[0]
+
+        assert parser.parse_api_events([self._event()])[0] is not first
+
+
 class TestLogParserSyslogLines:
     """Tests for LogParser.parse_syslog_lines method."""
 
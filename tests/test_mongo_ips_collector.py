@@ -144,6 +144,28 @@ class TestMongoIPSCollector:
         assert result[0]["_id"] == "1"
         assert result[1]["_id"] == "2"
 
+    def test_parse_mongo_output_multiline_extended_json(self):
+        """Test parsing printjson-style documents with extended JSON types."""
+        from unifi_scanner.logs.mongo_ips_collector import MongoIPSCollector
+
+        collector = MongoIPSCollector(
+            host="192.168.1.1",
+            username="root",
+            key_path="/path/to/key",
+        )
+
+        output = (
+            '{\n\t"_id" : ObjectId("abc123"),\n\t"time" : NumberLong("1769377254306"),\n'
+            '\t"parameters" : {\n\t\t"SRC_IP" : { "name" : "1.2.3.4" }\n\t}\n}\n'
+            '{\n\t"_id" : ObjectId("def456"),\n\t"time" : NumberLong(1769377254307)\n}\n'
+        )
+        result = collector._parse_mongo_output(output)
+
+        assert [d["_id"] for d in result] == ["abc123", "def456"]
+        assert result[0]["time"] == 1769377254306
+        assert result[0]["parameters"]["SRC_IP"]["name"] == "1.2.3.4"
+        assert result[1]["time"] == 1769377254307
+
 
 class TestIPSEventFromMongoDB:
     """Test IPSEvent.from_mongodb_alert factory method."""
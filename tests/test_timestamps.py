@@ -108,3 +108,16 @@ class TestNormalizeTimestamp:
         result = normalize_timestamp(1705084800000)
         assert result.tzinfo == timezone.utc
         assert result.year == 2024
+
+
+class TestGetZoneinfo:
+    """Tests for get_zoneinfo function."""
+
+    def test_returns_cached_instance(self) -> None:
+        """Repeated lookups return the same ZoneInfo object."""
+        from unifi_scanner.utils.timestamps import get_zoneinfo
+
+        tz = get_zoneinfo("America/New_York")
+
+        assert str(tz) == "America/New_York"
+        assert get_zoneinfo("America/New_York") is tz
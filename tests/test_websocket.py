@@ -250,6 +250,48 @@ class TestWebSocketEventBuffer:
         # All events should be drained (30 total)
         assert len(events_drained) == 30
 
+    def test_drain_blocking_times_out_when_empty(self) -> None:
+        """drain_blocking returns an empty list after the timeout."""
+        buffer = WebSocketEventBuffer()
+
+        started = time.monotonic()
+        result = buffer.drain_blocking(timeout=0.05)
+
+        assert result == []
+        assert time.monotonic() - started >= 0.04
+
+    def test_drain_blocking_wakes_on_add(self) -> None:
+        """drain_blocking returns as soon as an event is added."""
+        buffer = WebSocketEventBuffer()
+        event = BufferedEvent(
+            timestamp=datetime.now(timezone.utc),
+            event_type="wu.connected",
+            data={},
+        )
+        timer = threading.Timer(0.05, buffer.add, args=(event,))
+        timer.start()
+
+        started = time.monotonic()
+        result = buffer.drain_blocking(timeout=5.0)
+        timer.join()
+
+        assert result == [event]
+        assert time.monotonic() - started < 5.0
+
+    def test_drain_blocking_waits_again_after_drain(self) -> None:
+        """Draining resets the not-empty signal."""
+        buffer = WebSocketEventBuffer()
+        buffer.add(
+            BufferedEvent(
+                timestamp=datetime.now(timezone.utc),
+                event_type="wu.connected",
+                data={},
+            )
+        )
+
+        assert len(buffer.drain_blocking(timeout=0.05)) == 1
+        assert buffer.drain_blocking(timeout=0.01) == []
+
 
 class TestUnifiWebSocketClientEndpoint:
     """Tests for UnifiWebSocketClient.endpoint property."""
@@ -538,3 +538,80 @@ class TestWebSocketManagerIntegration:
         assert mock_client_class.call_count == 1
 
         manager.stop()
+
+    @patch("unifi_scanner.api.ws_manager.UnifiWebSocketClient")
+    def test_manager_stop_cancels_listen_and_stops_client(
+        self, mock_client_class: MagicMock
+    ) -> None:
+        """stop() cancels a blocked listen() and the client is stopped on unwind."""
+        import asyncio
+        import threading
+        import time
+
+        from unifi_scanner.api.ws_manager import WebSocketManager
+
+        listening = threading.Event()
+        stopped = threading.Event()
+
+        class FakeClient:
+            async def connect(self) -> bool:
+                return True
+
+            async def listen(self, on_event: object) -> None:
+                listening.set()
+                await asyncio.sleep(3600)
+
+            async def stop(self) -> None:
+                stopped.set()
+
+        mock_client_class.return_value = FakeClient()
+
+        manager = WebSocketManager()
+        manager.start(
+            base_url="https://192.168.1.1",
+            site="default",
+            cookies={"TOKEN": "abc123"},
+            device_type=DeviceType.UDM_PRO,
+        )
+        assert listening.wait(timeout=2.0)
+
+        started = time.monotonic()
+        manager.stop()
+
+        assert time.monotonic() - started < 2.0
+        assert stopped.is_set()
+
+
+class TestAsyncIOHost:
+    """Tests for the shared background event loop."""
+
+    def test_get_returns_shared_instance(self) -> None:
+        """get() always returns the same host."""
+        from unifi_scanner.api.async_host import AsyncIOHost
+
+        assert AsyncIOHost.get() is AsyncIOHost.get()
+
+    def test_submit_runs_coroutine_on_background_loop(self) -> None:
+        """Submitted coroutines run on the host thread and return results."""
+        import threading
+
+        from unifi_scanner.api.async_host import AsyncIOHost
+
+        async def which_thread() -> str:
+            return threading.current_thread().name
+
+        host = AsyncIOHost()
+        try:
+            result = host.submit(which_thread()).result(timeout=2.0)
+            assert result == "asyncio-host"
+            assert host.is_running()
+        finally:
+            host.shutdown()
+
+        assert not host.is_running()
+
+    def test_managers_share_one_loop(self) -> None:
+        """Multiple WebSocketManagers use the same host."""
+        from unifi_scanner.api.ws_manager import WebSocketManager
+
+        assert WebSocketManager()._host is WebSocketManager()._host